@@ -0,0 +1,106 @@
+"""
+공용 캐시 헬퍼 (settings.CACHES의 default 캐시 사용)
+
+- get_or_compute: 캐시에 없을 때 한 번만 계산 (single-flight)
+  - 같은 프로세스: 키별 스레드 락으로 나머지 스레드는 계산 결과를 기다림
+  - 프로세스 간: cache.add 락으로 한 워커만 계산하고 나머지는 결과가 저장될 때까지 대기
+    (cache.add가 원자적인 Redis에서 보장, 파일 캐시는 최선 노력)
+- 버전 네임스페이스: make_key()로 만든 키는 bump_namespace() 한 번으로 모두 무효화
+"""
+
+import threading
+import time
+
+from django.core.cache import cache
+
+NAMESPACE_VERSION_KEY = "ns:{namespace}:version"
+LOCK_POLL_INTERVAL = 0.05
+
+_MISSING = object()
+
+# 키 해시로 나눈 고정 개수의 락 (키가 계속 늘어나도 락 객체 수는 고정)
+_key_locks = [threading.Lock() for _ in range(64)]
+
+
+def _get_key_lock(key):
+    return _key_locks[hash(key) % len(_key_locks)]
+
+
+def get_namespace_version(namespace):
+    """
+    네임스페이스의 현재 버전
+    - 초기값은 현재 시각(ms) → 버전 키가 캐시에서 밀려나도 이전 버전 키와 겹치지 않음
+    """
+    version_key = NAMESPACE_VERSION_KEY.format(namespace=namespace)
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, int(time.time() * 1000), timeout=None)
+        version = cache.get(version_key)
+    return version
+
+
+def bump_namespace(namespace):
+    """네임스페이스 버전을 올려서 기존 키 전체를 무효화 (이전 키는 TTL이 지나면 자연 삭제)"""
+    version_key = NAMESPACE_VERSION_KEY.format(namespace=namespace)
+    try:
+        return cache.incr(version_key)
+    except ValueError:
+        # 버전 키가 없으면 새 초기값이 곧 새 버전
+        return get_namespace_version(namespace)
+
+
+def make_key(namespace, *parts):
+    """'{namespace}:v{version}:{parts...}' 형식의 버전 포함 캐시 키"""
+    return ":".join([namespace, f"v{get_namespace_version(namespace)}", *map(str, parts)])
+
+
+def _wait_for_value(key, lock_key, lock_timeout):
+    """
+    다른 프로세스가 계산 중인 값을 기다림
+    - 반환: (값 또는 _MISSING, 락 획득 여부) - 계산한 쪽이 실패해서 락이 풀리면 이어받아 직접 계산
+    """
+    deadline = time.monotonic() + lock_timeout
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value, False
+        if cache.add(lock_key, 1, timeout=lock_timeout):
+            return _MISSING, True
+    return _MISSING, False
+
+
+def get_or_compute(key, compute, timeout=None, lock_timeout=30):
+    """
+    캐시된 값을 반환하고, 없으면 compute()로 계산해서 저장 (같은 키 동시 요청은 한 번만 계산)
+    - timeout: 캐시 유지 시간(초), None이면 CACHES 기본값
+    - lock_timeout: 계산 락 유지/대기 최대 시간(초) - 초과하면 기다리지 않고 직접 계산
+    - None도 정상 값으로 캐시됨
+    """
+    value = cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+
+    with _get_key_lock(key):
+        # 대기하는 동안 같은 프로세스의 다른 스레드가 계산을 끝냈으면 그 결과 사용
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        lock_key = f"{key}:lock"
+        locked = cache.add(lock_key, 1, timeout=lock_timeout)
+        if not locked:
+            value, locked = _wait_for_value(key, lock_key, lock_timeout)
+            if value is not _MISSING:
+                return value
+
+        try:
+            value = compute()
+            if timeout is None:
+                cache.set(key, value)
+            else:
+                cache.set(key, value, timeout=timeout)
+            return value
+        finally:
+            if locked:
+                cache.delete(lock_key)
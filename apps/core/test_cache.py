@@ -0,0 +1,111 @@
+import threading
+import time
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from apps.core.cache import bump_namespace, get_namespace_version, get_or_compute, make_key
+
+
+class GetOrComputeTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_computes_once_and_caches(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"value": 1}
+
+        self.assertEqual(get_or_compute("k", compute), {"value": 1})
+        self.assertEqual(get_or_compute("k", compute), {"value": 1})
+        self.assertEqual(len(calls), 1)
+
+    def test_none_is_cached(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+
+        get_or_compute("none", compute)
+        get_or_compute("none", compute)
+        self.assertEqual(len(calls), 1)
+
+    def test_concurrent_threads_compute_once(self):
+        calls = []
+        barrier = threading.Barrier(8)
+        results = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return "computed"
+
+        def worker():
+            barrier.wait()
+            results.append(get_or_compute("shared", compute))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["computed"] * 8)
+
+    def test_waits_for_other_process_result(self):
+        # 다른 프로세스가 계산 중인 상황 (락만 잡혀 있음)
+        cache.add("remote:lock", 1)
+        threading.Timer(0.1, cache.set, args=("remote", "from-other-worker")).start()
+
+        result = get_or_compute("remote", lambda: self.fail("다른 워커가 계산 중이면 다시 계산하지 않아야 함"))
+        self.assertEqual(result, "from-other-worker")
+
+    def test_takes_over_when_other_process_fails(self):
+        cache.add("failed:lock", 1)
+        threading.Timer(0.1, cache.delete, args=("failed:lock",)).start()
+
+        self.assertEqual(get_or_compute("failed", lambda: "recovered"), "recovered")
+        self.assertIsNone(cache.get("failed:lock"))
+
+    def test_lock_released_when_compute_raises(self):
+        def compute():
+            raise RuntimeError("계산 실패")
+
+        with self.assertRaises(RuntimeError):
+            get_or_compute("error", compute)
+        self.assertIsNone(cache.get("error:lock"))
+        self.assertEqual(get_or_compute("error", lambda: "ok"), "ok")
+
+
+class NamespaceTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_bump_invalidates_namespace_keys(self):
+        key = make_key("products", "list", 1)
+        cache.set(key, "old")
+
+        bump_namespace("products")
+
+        new_key = make_key("products", "list", 1)
+        self.assertNotEqual(key, new_key)
+        self.assertIsNone(cache.get(new_key))
+
+    def test_namespaces_are_independent(self):
+        faq_key = make_key("faq", "all")
+        bump_namespace("products")
+        self.assertEqual(make_key("faq", "all"), faq_key)
+
+    def test_evicted_version_does_not_resurrect_old_keys(self):
+        old_version = get_namespace_version("stats")
+        cache.delete("ns:stats:version")
+        time.sleep(0.002)
+
+        self.assertGreater(get_namespace_version("stats"), old_version)
+
+    def test_bump_without_version_key(self):
+        version = bump_namespace("fresh")
+        self.assertEqual(get_namespace_version("fresh"), version)
@@ -0,0 +1,152 @@
+import random
+from decimal import Decimal
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+
+from apps.orders.models import Order
+from apps.payments.models import Payment, PaymentMethod, PaymentStatus
+from apps.products.models import Product, ProductCategory
+from apps.support.models import FAQ, Inquiry
+
+User = get_user_model()
+
+
+@skipUnless(connection.vendor == "postgresql", "EXPLAIN 실행 계획 검증은 PostgreSQL 전용")
+class ListQueryIndexBenchmarkTest(TestCase):
+    """
+    목록 API가 사용하는 쿼리가 인덱스 스캔으로 실행되는지 EXPLAIN으로 확인
+    (시드 데이터 적재 후 ANALYZE → seq scan 비활성화 상태에서 인덱스 사용 여부 검사)
+    """
+
+    USER_COUNT = 50
+    ORDERS_PER_USER = 40
+    PRODUCT_COUNT = 2000
+
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(42)
+        categories = [choice for choice, _ in ProductCategory.choices]
+
+        users = User.objects.bulk_create(
+            [User(email=f"bench{i}@test.com", name=f"bench{i}", password="x") for i in range(cls.USER_COUNT)]
+        )
+        cls.user = users[0]
+
+        Product.objects.bulk_create(
+            [
+                Product(
+                    name=f"상품{i}",
+                    price=Decimal(rng.randint(1, 100) * 1000),
+                    stock=rng.randint(0, 50),
+                    category=rng.choice(categories),
+                )
+                for i in range(cls.PRODUCT_COUNT)
+            ]
+        )
+
+        orders = Order.objects.bulk_create(
+            [
+                Order(
+                    order_number=f"{u_idx:04d}{o_idx:08d}",
+                    user=user,
+                    total_price=Decimal("10000.00"),
+                    recipient_name="홍길동",
+                    recipient_phone="010-1111-2222",
+                    recipient_address="서울시 테스트구",
+                )
+                for u_idx, user in enumerate(users)
+                for o_idx in range(cls.ORDERS_PER_USER)
+            ]
+        )
+        cls.order = orders[0]
+
+        statuses = [choice for choice, _ in PaymentStatus.choices]
+        Payment.objects.bulk_create(
+            [
+                Payment(
+                    order=order,
+                    method=PaymentMethod.CARD,
+                    total_price=order.total_price,
+                    status=rng.choice(statuses),
+                )
+                for order in orders
+            ]
+        )
+
+        Inquiry.objects.bulk_create(
+            [
+                Inquiry(
+                    user=rng.choice(users),
+                    category="order",
+                    title=f"문의{i}",
+                    content="내용",
+                    status=rng.choice(["submitted", "in_progress", "completed", "on_hold"]),
+                )
+                for i in range(cls.USER_COUNT * 20)
+            ]
+        )
+
+        FAQ.objects.bulk_create(
+            [
+                FAQ(
+                    category=rng.choice(["order", "shipping", "product", "payment", "account", "other"]),
+                    question=f"질문{i}",
+                    answer="답변",
+                    is_active=rng.random() > 0.2,
+                    order=i,
+                )
+                for i in range(500)
+            ]
+        )
+
+        with connection.cursor() as cursor:
+            for model in (User, Product, Order, Payment, Inquiry, FAQ):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    def setUp(self):
+        # 소량 데이터에서도 플래너가 인덱스를 쓸 수 있는지 결정적으로 확인
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, msg=f"인덱스 {index_name} 미사용\n{plan}")
+
+    def test_order_list_uses_user_created_index(self):
+        qs = Order.objects.filter(user=self.user).order_by("-created_at")[:20]
+        self.assertUsesIndex(qs, "order_user_created_idx")
+
+    def test_payment_list_uses_status_created_index(self):
+        qs = Payment.objects.filter(status=PaymentStatus.SUCCESS).order_by("-created_at")[:20]
+        self.assertUsesIndex(qs, "payment_status_created_idx")
+
+    def test_payment_duplicate_check_uses_order_status_index(self):
+        qs = Payment.objects.filter(order=self.order, status=PaymentStatus.SUCCESS)
+        self.assertUsesIndex(qs, "payment_order_status_idx")
+
+    def test_inquiry_list_uses_user_created_index(self):
+        qs = Inquiry.objects.filter(user=self.user)[:20]
+        self.assertUsesIndex(qs, "inquiry_user_created_idx")
+
+    def test_admin_inquiry_list_uses_status_created_index(self):
+        qs = Inquiry.objects.filter(status="submitted")[:20]
+        self.assertUsesIndex(qs, "inquiry_status_created_idx")
+
+    def test_faq_list_uses_active_category_index(self):
+        qs = FAQ.objects.filter(is_active=True, category="order").order_by("order")
+        self.assertUsesIndex(qs, "faq_active_category_idx")
+
+    def test_product_category_filter_uses_category_price_index(self):
+        qs = Product.objects.filter(category=ProductCategory.NOVEL).order_by("price")[:20]
+        self.assertUsesIndex(qs, "product_category_price_idx")
+
+    def test_product_price_range_uses_price_index(self):
+        qs = Product.objects.filter(price__gte=10000, price__lte=20000).order_by("price")[:20]
+        self.assertUsesIndex(qs, "product_price_idx")
+
+    def test_stats_period_range_uses_created_index(self):
+        qs = Order.objects.filter(created_at__gte="2025-10-01T00:00:00Z", created_at__lt="2025-10-02T00:00:00Z")
+        self.assertUsesIndex(qs, "order_created_idx")
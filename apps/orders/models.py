@@ -24,6 +24,14 @@ class Order(TimestampModel):
     recipient_address = models.TextField(blank=False)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="주문 완료")
 
+    class Meta:
+        indexes = [
+            # 내 주문 목록: user 필터 + 최신순 정렬
+            models.Index(fields=["user", "-created_at"], name="order_user_created_idx"),
+            # 통계 기간 집계: created_at 범위 스캔
+            models.Index(fields=["created_at"], name="order_created_idx"),
+        ]
+
     def clean(self):
         if not (2 <= len(self.recipient_name) <= 10):
             raise ValidationError("수령자 이름은 2~10자여야 합니다.")
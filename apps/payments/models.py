@@ -21,5 +21,13 @@ class Payment(models.Model):
     status = models.CharField(max_length=10, choices=PaymentStatus.choices)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 주문별 결제 상태 확인 (order__user 조인 + 중복 결제 체크)
+            models.Index(fields=["order", "status", "-created_at"], name="payment_order_status_idx"),
+            # 관리자 결제 목록: 상태 + 기간 필터 + 최신순 정렬
+            models.Index(fields=["status", "-created_at"], name="payment_status_created_idx"),
+        ]
+
     def __str__(self):
         return f"[{self.id}] {self.method} - {self.total_price} ({self.status})"
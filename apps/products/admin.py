@@ -1,9 +1,21 @@
 from django.contrib import admin
 
-from .models import Product
+from .models import Product, RelatedProduct, StockAdjustment
 
 
 @admin.register(Product)
 class ProductAdmin(admin.ModelAdmin):
     list_display = ("id", "__str__", "price")
     list_display_links = ("__str__",)  # __str__ 컬럼 클릭 시 상세 페이지로 이동
+
+
+@admin.register(StockAdjustment)
+class StockAdjustmentAdmin(admin.ModelAdmin):
+    list_display = ("id", "product", "delta", "stock_after", "reason", "adjusted_by", "created_at")
+    list_select_related = ("product", "adjusted_by")
+
+
+@admin.register(RelatedProduct)
+class RelatedProductAdmin(admin.ModelAdmin):
+    list_display = ("id", "product", "rank", "related", "score")
+    list_select_related = ("product", "related")
@@ -5,6 +5,15 @@ from . import admin_views
 urlpatterns = [
     # 상품 생성
     path("create/", admin_views.admin_product_create, name="admin_product_create"),
+    # 카탈로그 대량 등록/수정
+    path("import/", admin_views.admin_product_import, name="admin_product_import"),
+    # 대량 재고 조정
+    path("stock/adjust/", admin_views.admin_product_stock_adjust, name="admin_product_stock_adjust"),
+    # 이미지 직접 업로드 URL 발급 / 개발용 로컬 업로드
+    path("images/uploads/", admin_views.admin_product_image_upload, name="admin_product_image_upload"),
+    path(
+        "images/uploads/local/", admin_views.admin_product_image_local_upload, name="admin_product_image_local_upload"
+    ),
     # 상품 상세조회 / 수정 / 삭제 (pk 공통)
     path("<int:pk>/", admin_views.admin_product_detail_update_delete, name="admin_product_detail_update_delete"),
 ]
@@ -1,13 +1,29 @@
+import csv
+import io
+
+from django.conf import settings
+from django.core import signing
+from django.core.files.storage import default_storage
 from django.shortcuts import get_object_or_404
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
-from rest_framework.decorators import api_view, parser_classes, permission_classes
+from rest_framework.decorators import api_view, authentication_classes, parser_classes, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
-from rest_framework.permissions import IsAdminUser
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 
+from .importer import import_products, iter_rows
 from .models import Product
-from .serializers import ProductSerializer
+from .serializers import (
+    ProductImageLocalUploadSerializer,
+    ProductImageUploadSerializer,
+    ProductImportSerializer,
+    ProductSerializer,
+    StockAdjustmentRequestSerializer,
+)
+from .stock import adjust_stock
+from .uploads import issue_upload, load_local_upload_policy
 
 
 # 상품 등록 (POST)
@@ -54,3 +70,90 @@ def admin_product_detail_update_delete(request, pk):
     elif request.method == "DELETE":
         product.delete()
         return Response({"message": "상품이 삭제되었습니다."}, status=status.HTTP_200_OK)
+
+
+# 상품 카탈로그 대량 등록/수정 (POST) - ISBN 기준 upsert, 행별 오류 보고
+# 10만 건 이상은 요청 타임아웃을 피하기 위해 import_products 명령 사용
+@swagger_auto_schema(method="post", request_body=ProductImportSerializer)
+@api_view(["POST"])
+@permission_classes([IsAdminUser])
+@parser_classes([MultiPartParser])
+def admin_product_import(request):
+    serializer = ProductImportSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response({"errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+    data = serializer.validated_data
+
+    # 업로드 파일을 한 번에 메모리로 읽지 않고 줄 단위로 디코딩
+    text_file = io.TextIOWrapper(data["file"].file, encoding="utf-8-sig", newline="")
+    try:
+        result = import_products(iter_rows(text_file, data["format"]), dry_run=data["dry_run"])
+    except (UnicodeDecodeError, csv.Error) as e:
+        # 오류 이전 청크는 이미 저장됨 (같은 파일을 다시 올려도 upsert라 안전)
+        return Response({"error": f"파일을 읽을 수 없습니다: {e}"}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response(result, status=status.HTTP_200_OK)
+
+
+# 대량 재고 조정 (POST) - 상품별 증감량을 UPDATE 한 번으로 적용하고 조정 기록 저장
+@swagger_auto_schema(method="post", request_body=StockAdjustmentRequestSerializer)
+@api_view(["POST"])
+@permission_classes([IsAdminUser])
+def admin_product_stock_adjust(request):
+    serializer = StockAdjustmentRequestSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response({"errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+    data = serializer.validated_data
+
+    try:
+        products = adjust_stock(data["adjustments"], reason=data["reason"], user=request.user)
+    except ValidationError as e:
+        return Response({"errors": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response({"adjusted": len(products), "products": products}, status=status.HTTP_200_OK)
+
+
+# 상품 이미지 업로드 URL 발급 (POST) - 파일은 클라이언트가 저장소에 직접 업로드
+@swagger_auto_schema(method="post", request_body=ProductImageUploadSerializer)
+@api_view(["POST"])
+@permission_classes([IsAdminUser])
+def admin_product_image_upload(request):
+    serializer = ProductImageUploadSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response({"errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    upload = issue_upload(request, serializer.validated_data["content_type"])
+    return Response(upload, status=status.HTTP_201_CREATED)
+
+
+# 개발용 로컬 업로드 (POST) - S3 presigned POST 대신 사용, 인증은 발급 시 서명한 policy로 대체
+@swagger_auto_schema(method="post", request_body=ProductImageLocalUploadSerializer)
+@api_view(["POST"])
+@authentication_classes([])
+@permission_classes([AllowAny])
+@parser_classes([MultiPartParser])
+def admin_product_image_local_upload(request):
+    if settings.PRODUCT_UPLOAD_BACKEND != "local":
+        return Response({"error": "로컬 업로드를 사용하지 않습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+    serializer = ProductImageLocalUploadSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response({"errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+    data = serializer.validated_data
+
+    try:
+        policy = load_local_upload_policy(data["policy"])
+    except signing.BadSignature:
+        return Response({"error": "업로드 URL이 만료되었거나 올바르지 않습니다."}, status=status.HTTP_403_FORBIDDEN)
+
+    file = data["file"]
+    if policy["key"] != data["key"] or file.content_type != policy["content_type"]:
+        return Response({"error": "발급받은 업로드 조건과 다릅니다."}, status=status.HTTP_403_FORBIDDEN)
+    if file.size > settings.PRODUCT_IMAGE_MAX_UPLOAD_SIZE:
+        return Response({"error": "이미지 파일이 너무 큽니다."}, status=status.HTTP_400_BAD_REQUEST)
+    # 같은 키 재업로드 금지 (S3 presigned POST와 달리 저장소가 다른 이름으로 바꿔 저장하므로)
+    if default_storage.exists(data["key"]):
+        return Response({"error": "이미 업로드된 키입니다."}, status=status.HTTP_409_CONFLICT)
+
+    default_storage.save(data["key"], file)
+    return Response(status=status.HTTP_204_NO_CONTENT)
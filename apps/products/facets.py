@@ -0,0 +1,73 @@
+"""
+상품 목록 패싯 (카테고리별 개수 + 가격대 히스토그램)
+
+- (카테고리, 가격 구간)으로 GROUP BY 한 번 → 카테고리별/가격대별 합계는 파이썬에서 계산
+- 같은 필터 조건은 정규화한 키로 캐시 (상품 추가/수정/삭제/대량 등록 시 네임스페이스 무효화)
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.db.models import Case, Count, IntegerField, Value, When
+
+from apps.core.cache import get_or_compute, make_key
+
+from .models import ProductCategory
+
+FACETS_NAMESPACE = "products:facets"
+
+
+def price_bucket_expression(bounds):
+    """가격 → 구간 번호 (bounds=[1만, 2만]이면 1만 미만 0, 2만 미만 1, 나머지 2)"""
+    return Case(
+        *(When(price__lt=bound, then=Value(index)) for index, bound in enumerate(bounds)),
+        default=Value(len(bounds)),
+        output_field=IntegerField(),
+    )
+
+
+def compute_facets(queryset):
+    bounds = settings.PRODUCT_FACET_PRICE_BOUNDS
+    rows = (
+        queryset.order_by()
+        .values("category", bucket=price_bucket_expression(bounds))
+        .annotate(count=Count("id"))
+        .values_list("category", "bucket", "count")
+    )
+
+    category_counts = dict.fromkeys(ProductCategory.values, 0)
+    bucket_counts = [0] * (len(bounds) + 1)
+    for category, bucket, count in rows:
+        category_counts[category] = category_counts.get(category, 0) + count
+        bucket_counts[bucket] += count
+
+    lower_bounds = [0, *bounds]
+    upper_bounds = [*bounds, None]
+    return {
+        "category": [{"value": value, "count": count} for value, count in category_counts.items()],
+        "price": [
+            {"min": lower, "max": upper, "count": count}
+            for lower, upper, count in zip(lower_bounds, upper_bounds, bucket_counts)
+        ],
+    }
+
+
+def get_facets_cache_key(filter_params):
+    """필터 값 순서/빈 값과 무관한 캐시 키 (검색어에 공백 등이 있어도 안전하도록 해시 사용)"""
+    normalized = sorted((name, value.strip()) for name, value in filter_params.items() if value.strip())
+    digest = hashlib.md5(json.dumps(normalized, ensure_ascii=False).encode()).hexdigest()
+    bounds = ",".join(map(str, settings.PRODUCT_FACET_PRICE_BOUNDS))
+    return make_key(FACETS_NAMESPACE, bounds, digest)
+
+
+def get_facets(queryset, filter_params):
+    """
+    필터가 적용된 queryset의 패싯 (캐시 적중 시 쿼리 없음)
+    - filter_params: 캐시 키에 쓸 필터 값 {이름: 값} (페이지/정렬 제외)
+    """
+    return get_or_compute(
+        get_facets_cache_key(filter_params),
+        lambda: compute_facets(queryset),
+        timeout=settings.PRODUCT_FACET_CACHE_TTL,
+    )
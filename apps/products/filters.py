@@ -1,7 +1,11 @@
 import django_filters
 from django.db.models import Q
 
-from .models import Product
+from .models import Product, ProductCategory
+
+
+class ChoiceInFilter(django_filters.BaseInFilter, django_filters.ChoiceFilter):
+    """쉼표로 구분한 여러 선택지 중 하나와 정확히 일치 (값마다 선택지 검증)"""
 
 
 class ProductFilter(django_filters.FilterSet):
@@ -9,7 +13,11 @@ class ProductFilter(django_filters.FilterSet):
     name = django_filters.CharFilter(field_name="name", lookup_expr="icontains")
     description = django_filters.CharFilter(field_name="description", lookup_expr="icontains")
     author = django_filters.CharFilter(field_name="author", lookup_expr="icontains")
-    category = django_filters.CharFilter(field_name="category", lookup_expr="icontains")
+    # 카테고리는 고정 선택지라 LIKE 대신 = / IN 조회 (category 인덱스 사용), 예: ?category=소설,요리
+    category = ChoiceInFilter(field_name="category", lookup_expr="in", choices=ProductCategory.choices)
+
+    # 재고 있는 상품만 (재고 있는 상품 부분 인덱스 사용)
+    in_stock = django_filters.BooleanFilter(method="filter_in_stock")
 
     # 가격 필터
     min_price = django_filters.NumberFilter(field_name="price", lookup_expr="gte")
@@ -20,7 +28,11 @@ class ProductFilter(django_filters.FilterSet):
 
     class Meta:
         model = Product
-        fields = ["name", "description", "author", "category", "min_price", "max_price"]
+        fields = ["name", "description", "author", "category", "min_price", "max_price", "in_stock"]
+
+    def filter_in_stock(self, queryset, name, value):
+        # 부분 인덱스 조건(stock > 0)과 같은 식이어야 인덱스가 쓰임
+        return queryset.filter(stock__gt=0) if value else queryset.filter(stock__lte=0)
 
     def filter_query(self, queryset, name, value):
         return queryset.filter(
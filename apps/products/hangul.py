@@ -0,0 +1,44 @@
+"""
+자동완성용 한글 처리 (초성 추출, 검색 키 정규화)
+
+- 완성형 음절(가~힣) → 초성 호환 자모(ㄱ~ㅎ): (코드 - 0xAC00) // 588
+- 검색 키는 공백 제거 + 소문자 → "해리 포터" / "해리포터" 모두 같은 키
+"""
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG_INTERVAL = 21 * 28
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+CHOSEONG_SET = frozenset(CHOSEONG)
+
+
+def normalize(text):
+    """검색 키: 공백 제거 + 소문자"""
+    return "".join(text.split()).lower()
+
+
+def choseong(text):
+    """완성형 음절은 초성으로 바꾸고 나머지 문자는 그대로 (정규화된 문자열 기준)"""
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            chars.append(CHOSEONG[(code - HANGUL_BASE) // CHOSEONG_INTERVAL])
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+
+def split_query(query):
+    """
+    입력 중인 검색어 → (키 접두어, 초성 접두어 또는 None)
+    - "파이썬"  → ("파이썬", None)           : 키 접두어만 비교
+    - "ㅍㅇㅆ"  → ("", "ㅍㅇㅆ")              : 초성만 비교
+    - "파이ㅆ"  → ("파이", "ㅍㅇㅆ")           : 입력 중인 마지막 글자는 초성으로 비교
+    """
+    normalized = normalize(query)
+    jamo_at = next((i for i, char in enumerate(normalized) if char in CHOSEONG_SET), None)
+    if jamo_at is None:
+        return normalized, None
+    return normalized[:jamo_at], choseong(normalized)
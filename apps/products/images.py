@@ -0,0 +1,130 @@
+import io
+from datetime import timedelta
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from .models import Product
+
+THUMBNAIL_DIR = "products/thumbs"
+
+# 처리 중 표시 유효 시간 (지나면 워커가 중단된 것으로 보고 다른 워커가 다시 처리)
+CLAIM_TIMEOUT = timedelta(minutes=10)
+
+# 포맷별 Pillow 저장 옵션
+THUMBNAIL_FORMATS = {
+    "webp": {"format": "WEBP", "method": 4},
+    "jpeg": {"format": "JPEG", "optimize": True, "progressive": True},
+}
+
+
+def thumbnail_key(source_name, width, fmt):
+    """원본 이미지 이름 + 너비 + 포맷으로 정해지는 썸네일 저장 키 (재생성해도 같은 키)"""
+    stem = PurePosixPath(source_name).stem
+    ext = "jpg" if fmt == "jpeg" else fmt
+    return f"{THUMBNAIL_DIR}/{stem}_{width}w.{ext}"
+
+
+def render_thumbnail(image, width, fmt):
+    """원본보다 크게 늘리지 않고 비율 유지 리사이즈 후 인코딩한 바이트 반환"""
+    resized = image.copy()
+    resized.thumbnail((width, resized.height), Image.Resampling.LANCZOS)
+
+    buffer = io.BytesIO()
+    resized.save(buffer, quality=settings.PRODUCT_THUMBNAIL_QUALITY, **THUMBNAIL_FORMATS[fmt])
+    return buffer.getvalue()
+
+
+def thumbnail_keys(thumbnails):
+    """{"너비": {"포맷": 키}} → 저장 키 집합"""
+    return {key for formats in thumbnails.values() for key in formats.values()}
+
+
+def generate_thumbnails(storage, source_name):
+    """
+    원본 이미지의 썸네일을 PRODUCT_THUMBNAIL_WIDTHS x PRODUCT_THUMBNAIL_FORMATS 조합으로 생성해서 저장
+    - 원본은 한 번만 읽어서 디코딩, 같은 키가 이미 있으면 덮어씀
+    - 반환: {"너비": {"포맷": 실제 저장된 이름}}
+    """
+
+    with storage.open(source_name, "rb") as f:
+        image = Image.open(f)
+        image = ImageOps.exif_transpose(image).convert("RGB")
+
+    thumbnails = {}
+    for width in settings.PRODUCT_THUMBNAIL_WIDTHS:
+        for fmt in settings.PRODUCT_THUMBNAIL_FORMATS:
+            key = thumbnail_key(source_name, width, fmt)
+            if storage.exists(key):
+                storage.delete(key)
+            # 저장소가 이름을 바꿔 저장할 수 있으므로 (중복 회피 등) save가 돌려준 실제 이름을 기록
+            thumbnails.setdefault(str(width), {})[fmt] = storage.save(
+                key, ContentFile(render_thumbnail(image, width, fmt))
+            )
+    return thumbnails
+
+
+def pending_thumbnail_products():
+    """이미지가 바뀌어 썸네일을 (다시) 만들어야 하는 상품 (thumbnails_pending 부분 인덱스만 조회)"""
+    return Product.objects.filter(thumbnails_pending=True)
+
+
+def claim_pending_thumbnails(batch_size):
+    """
+    대기 상품 한 배치를 처리 중으로 표시하고 [(id, 원본 이름, 이전 썸네일)] 반환
+    - 행 잠금은 표시하는 동안만 (skip_locked로 다른 워커와 겹치지 않음)
+    - 처리 중 워커가 죽어도 CLAIM_TIMEOUT이 지나면 다시 대상이 됨
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        claimed = list(
+            pending_thumbnail_products()
+            .filter(Q(thumbnails_claimed_at__isnull=True) | Q(thumbnails_claimed_at__lt=now - CLAIM_TIMEOUT))
+            .select_for_update(skip_locked=True)
+            .order_by("id")
+            .values_list("id", "image", "thumbnails")[:batch_size]
+        )
+        Product.objects.filter(pk__in=[product_id for product_id, _, _ in claimed]).update(thumbnails_claimed_at=now)
+    return claimed
+
+
+def process_pending_thumbnails(batch_size=20):
+    """
+    썸네일 대기 상품을 한 배치 처리하고 (생성 수, 실패 수)를 반환
+    - 짧은 트랜잭션으로 처리 중 표시만 하고, 저장소 읽기/쓰기와 리사이즈는 잠금 없이 실행
+      (관리자가 같은 상품을 수정해도 배치 전체를 기다리지 않음)
+    - 결과는 원본 이미지가 그대로일 때만 기록 (처리 중 이미지가 바뀌면 만든 썸네일은 버리고 다음 배치에서 다시 처리)
+    - 깨진 이미지 등 실패한 상품도 thumbnails_source를 기록해서 같은 업로드를 반복 시도하지 않음
+      (목록에서는 썸네일 없이 원본 이미지 사용)
+    """
+    generated = failed = 0
+    storage = Product._meta.get_field("image").storage
+
+    for product_id, source_name, previous in claim_pending_thumbnails(batch_size):
+        try:
+            thumbnails = generate_thumbnails(storage, source_name)
+            generated += 1
+        except Exception as e:
+            print(f"[WARN] 상품 {product_id} 썸네일 생성 실패: {e}")
+            thumbnails = {}
+            failed += 1
+
+        # update()는 save 시그널을 보내지 않으므로 이미지 파일명 변경 로직이 다시 돌지 않음
+        written = Product.objects.filter(pk=product_id, image=source_name).update(
+            thumbnails=thumbnails, thumbnails_source=source_name, thumbnails_claimed_at=None, thumbnails_pending=False
+        )
+        if written:
+            # 이전 업로드의 썸네일 정리 (새 키와 겹치는 건 남김)
+            stale_keys = thumbnail_keys(previous) - thumbnail_keys(thumbnails)
+        else:
+            Product.objects.filter(pk=product_id).update(thumbnails_claimed_at=None)
+            stale_keys = thumbnail_keys(thumbnails)
+        for key in stale_keys:
+            storage.delete(key)
+
+    return generated, failed
@@ -0,0 +1,162 @@
+"""
+상품 카탈로그 대량 등록/수정 (CSV, JSON Lines)
+
+- 파일을 한 줄씩 읽어 chunk_size 행마다 검증 → INSERT ... ON CONFLICT (isbn) DO UPDATE 한 번으로 저장
+  (행마다 save()/시그널을 실행하지 않으므로 10만 건도 몇 분 안에 처리)
+- 이미 있는 ISBN은 카탈로그 값으로 덮어씀 (이미지/썸네일/등록일은 유지)
+- 잘못된 행은 건너뛰고 행 번호와 오류를 보고, 나머지 행은 계속 처리
+"""
+
+import csv
+import json
+import re
+
+from django.db import transaction
+from rest_framework import serializers
+
+from apps.core.cache import bump_namespace
+
+from .facets import FACETS_NAMESPACE
+from .models import Product, ProductCategory
+from .related import RELATED_NAMESPACE
+from .suggestions import refresh_suggestion_terms
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+
+IMPORT_FORMATS = ("csv", "jsonl")
+ISBN_PATTERN = re.compile(r"^(\d{9}[\dX]|\d{13})$")
+
+# 기존 상품 갱신 시 덮어쓰는 필드
+UPDATE_FIELDS = ["name", "description", "author", "publisher", "price", "stock", "category", "updated_at"]
+
+
+def normalize_isbn(value):
+    """하이픈/공백 제거 + 대문자 (978-89-... → 97889..., 끝자리 x → X)"""
+    return value.replace("-", "").replace(" ", "").upper()
+
+
+class ProductImportRowSerializer(serializers.Serializer):
+    """
+    카탈로그 한 행 검증
+    - ModelSerializer를 쓰면 isbn 유니크 검사로 행마다 조회가 생기므로 일반 Serializer 사용
+    """
+
+    isbn = serializers.CharField(max_length=20)
+    name = serializers.CharField(max_length=255)
+    description = serializers.CharField(required=False, allow_blank=True, default="")
+    author = serializers.CharField(max_length=100, required=False, default="작자 미상")
+    publisher = serializers.CharField(max_length=100, required=False, allow_null=True, default=None)
+    price = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=0)
+    stock = serializers.IntegerField(min_value=0)
+    category = serializers.ChoiceField(choices=ProductCategory.choices)
+
+    def validate_isbn(self, value):
+        isbn = normalize_isbn(value)
+        if not ISBN_PATTERN.match(isbn):
+            raise serializers.ValidationError("ISBN은 10자리 또는 13자리여야 합니다.")
+        return isbn
+
+
+def detect_format(filename):
+    """파일 확장자로 형식 추정 (.csv → csv, .jsonl/.ndjson → jsonl)"""
+    suffix = filename.rsplit(".", 1)[-1].lower()
+    if suffix == "csv":
+        return "csv"
+    if suffix in ("jsonl", "ndjson"):
+        return "jsonl"
+    return None
+
+
+def iter_csv_rows(text_file):
+    """
+    (행 번호, dict) 순서대로 반환 - 첫 줄은 헤더
+    - 빈 칸은 값이 없는 것으로 보고 기본값 적용
+    """
+    for line_no, row in enumerate(csv.DictReader(text_file), start=2):
+        yield line_no, {key: value for key, value in row.items() if key and value not in ("", None)}
+
+
+def iter_jsonl_rows(text_file):
+    """(행 번호, dict) 순서대로 반환 - JSON 객체가 아닌 줄은 dict 대신 None"""
+    for line_no, line in enumerate(text_file, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            row = None
+        yield line_no, row if isinstance(row, dict) else None
+
+
+def iter_rows(text_file, fmt):
+    return iter_csv_rows(text_file) if fmt == "csv" else iter_jsonl_rows(text_file)
+
+
+def _save_chunk(products, dry_run):
+    """
+    ISBN 기준 upsert - (신규 수, 수정 수, 덮어쓰기 전 [(상품명, 작가명)]) 반환
+    - 같은 청크에 같은 ISBN이 여러 번 나오면 마지막 행 사용 (ON CONFLICT는 한 문장에서 같은 행을 두 번 갱신 불가)
+    """
+    previous = list(Product.objects.filter(isbn__in=products.keys()).values_list("name", "author"))
+    existing = len(previous)
+    if not dry_run:
+        with transaction.atomic():
+            # bulk_create는 save 시그널을 보내지 않으므로 이미지 시그널도 실행되지 않음
+            Product.objects.bulk_create(
+                products.values(),
+                update_conflicts=True,
+                unique_fields=["isbn"],
+                update_fields=UPDATE_FIELDS,
+            )
+    return len(products) - existing, existing, previous
+
+
+def import_products(rows, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False):
+    """
+    (행 번호, dict) 목록을 청크 단위로 검증/저장
+    - 반환: {"created", "updated", "failed", "errors": [{"row", "errors"}]} (errors는 앞의 MAX_REPORTED_ERRORS건만)
+    - dry_run이면 검증과 신규/수정 집계만 하고 저장하지 않음
+    """
+    result = {"created": 0, "updated": 0, "failed": 0, "errors": []}
+    chunk = {}
+
+    def fail(line_no, errors):
+        result["failed"] += 1
+        if len(result["errors"]) < MAX_REPORTED_ERRORS:
+            result["errors"].append({"row": line_no, "errors": errors})
+
+    def flush():
+        created, updated, previous = _save_chunk(chunk, dry_run)
+        result["created"] += created
+        result["updated"] += updated
+        if not dry_run:
+            # bulk_create는 시그널을 보내지 않으므로 패싯/추천 캐시와 자동완성 후보를 직접 갱신
+            # (청크마다 반영하므로 중간에 실패해도 저장된 청크는 반영됨)
+            bump_namespace(FACETS_NAMESPACE)
+            bump_namespace(RELATED_NAMESPACE)
+            # 이름/작가가 바뀐 상품은 이전 값의 가중치도 다시 집계 (0건이면 후보 삭제)
+            refresh_suggestion_terms(
+                names=[product.name for product in chunk.values()] + [name for name, _ in previous],
+                authors=[product.author for product in chunk.values()] + [author for _, author in previous],
+            )
+        chunk.clear()
+
+    for line_no, row in rows:
+        if row is None:
+            fail(line_no, {"non_field_errors": ["JSON 객체 형식이 아닙니다."]})
+            continue
+
+        serializer = ProductImportRowSerializer(data=row)
+        if not serializer.is_valid():
+            fail(line_no, serializer.errors)
+            continue
+
+        data = serializer.validated_data
+        chunk[data["isbn"]] = Product(**data)
+        if len(chunk) >= chunk_size:
+            flush()
+
+    if chunk:
+        flush()
+    return result
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from apps.products.related import build_related_products
+
+
+class Command(BaseCommand):
+    help = (
+        "주문 내역에서 함께 구매한 상품 추천 테이블을 다시 계산합니다. "
+        "cron 등으로 주기 실행하세요. 예: 0 4 * * * python manage.py build_related_products --days 180"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top-k", type=int, default=None, help="상품별 저장할 추천 수 (기본: PRODUCT_RELATED_TOP_K)"
+        )
+        parser.add_argument(
+            "--min-score", type=int, default=None, help="최소 동시 구매 주문 수 (기본: PRODUCT_RELATED_MIN_SCORE)"
+        )
+        parser.add_argument("--days", type=int, default=None, help="최근 N일 주문만 사용 (생략 시 전체)")
+
+    def handle(self, *args, **options):
+        total = build_related_products(top_k=options["top_k"], min_score=options["min_score"], days=options["days"])
+        self.stdout.write(self.style.SUCCESS(f"함께 구매한 상품 {total}건을 저장했습니다."))
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.products.images import process_pending_thumbnails
+
+
+class Command(BaseCommand):
+    help = "이미지가 새로 업로드된 상품의 썸네일을 생성합니다. --loop 옵션으로 워커처럼 계속 실행할 수 있습니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=20, help="한 배치에 처리할 상품 수 (기본 20)")
+        parser.add_argument("--loop", action="store_true", help="대기 상품을 계속 폴링하며 처리")
+        parser.add_argument("--interval", type=float, default=5, help="--loop 시 대기 상품이 없을 때 쉬는 시간(초)")
+
+    def handle(self, *args, **options):
+        while True:
+            generated, failed = process_pending_thumbnails(batch_size=options["batch_size"])
+            if generated or failed:
+                self.stdout.write(f"썸네일 생성 {generated}건, 실패 {failed}건")
+
+            if not options["loop"]:
+                break
+            # 배치가 꽉 찼으면 바로 다음 배치, 아니면 잠시 대기
+            if generated + failed < options["batch_size"]:
+                time.sleep(options["interval"])
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.products.importer import DEFAULT_CHUNK_SIZE, IMPORT_FORMATS, detect_format, import_products, iter_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "CSV(헤더 포함) 또는 JSON Lines 카탈로그 파일로 상품을 대량 등록/수정합니다 (ISBN 기준 upsert). "
+        "예: python manage.py import_products catalog.csv"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="카탈로그 파일 경로 (UTF-8)")
+        parser.add_argument("--format", choices=IMPORT_FORMATS, help="생략 시 확장자로 판단")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f"한 번에 저장할 행 수 (기본 {DEFAULT_CHUNK_SIZE})",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="검증만 하고 저장하지 않음")
+
+    def handle(self, *args, **options):
+        fmt = options["format"] or detect_format(options["path"])
+        if not fmt:
+            raise CommandError("파일 형식(csv/jsonl)을 알 수 없습니다. --format을 지정하세요.")
+
+        try:
+            with open(options["path"], encoding="utf-8-sig", newline="") as f:
+                result = import_products(
+                    iter_rows(f, fmt), chunk_size=options["chunk_size"], dry_run=options["dry_run"]
+                )
+        except OSError as e:
+            raise CommandError(f"파일을 열 수 없습니다: {e}")
+
+        for error in result["errors"]:
+            self.stdout.write(self.style.WARNING(f"{error['row']}행: {dict(error['errors'])}"))
+
+        prefix = "[dry-run] " if options["dry_run"] else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}신규 {result['created']}건, 수정 {result['updated']}건, 실패 {result['failed']}건"
+            )
+        )
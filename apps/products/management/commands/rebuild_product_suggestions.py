@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.products.suggestions import rebuild_suggestion_index
+
+
+class Command(BaseCommand):
+    help = (
+        "상품명/작가명 자동완성 후보를 전체 재구축합니다 (이름이 바뀐 상품의 이전 후보 정리). "
+        "cron 등으로 주기 실행하세요. 예: 0 5 * * * python manage.py rebuild_product_suggestions"
+    )
+
+    def handle(self, *args, **options):
+        total = rebuild_suggestion_index()
+        self.stdout.write(self.style.SUCCESS(f"자동완성 후보 {total}개를 다시 만들었습니다."))
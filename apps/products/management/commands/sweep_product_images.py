@@ -0,0 +1,59 @@
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.products.images import THUMBNAIL_DIR, thumbnail_keys
+from apps.products.models import DEFAULT_PRODUCT_IMAGE, Product
+
+PRODUCT_IMAGE_DIR = "products"
+
+
+class Command(BaseCommand):
+    help = (
+        "어떤 상품도 참조하지 않는 상품 이미지/썸네일 파일을 삭제합니다. "
+        "cron 등으로 주기 실행하세요. 예: 30 4 * * * python manage.py sweep_product_images"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-age-hours",
+            type=float,
+            default=24,
+            help="이 시간보다 오래된 파일만 삭제 (업로드 직후 아직 저장 전인 상품 보호, 기본 24)",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 출력")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options["min_age_hours"])
+
+        referenced = {DEFAULT_PRODUCT_IMAGE}
+        for image, thumbnails in Product.objects.values_list("image", "thumbnails").iterator():
+            referenced.add(image)
+            referenced |= thumbnail_keys(thumbnails or {})
+
+        candidates = [f"{PRODUCT_IMAGE_DIR}/{name}" for name in self.list_files(PRODUCT_IMAGE_DIR)]
+        candidates += [f"{THUMBNAIL_DIR}/{name}" for name in self.list_files(THUMBNAIL_DIR)]
+
+        deleted = 0
+        for name in candidates:
+            if name in referenced or default_storage.get_modified_time(name) > cutoff:
+                continue
+            if options["dry_run"]:
+                self.stdout.write(name)
+            else:
+                default_storage.delete(name)
+            deleted += 1
+
+        action = "삭제 대상" if options["dry_run"] else "삭제"
+        self.stdout.write(self.style.SUCCESS(f"참조되지 않는 이미지 {deleted}개 {action}"))
+
+    @staticmethod
+    def list_files(path):
+        # S3는 디렉터리 개념이 없어서 exists()로 확인하지 않고 바로 목록 조회
+        try:
+            _, files = default_storage.listdir(path)
+        except FileNotFoundError:
+            return []
+        return files
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_product_product_category_price_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='thumbnails',
+            field=models.JSONField(blank=True, default=dict, verbose_name='썸네일'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='thumbnails_source',
+            field=models.CharField(blank=True, default='', max_length=255, verbose_name='썸네일 원본 이미지'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:21
+
+import apps.products.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0007_product_thumbnails'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='image',
+            field=models.ImageField(default='products/product_default.jpg', upload_to=apps.products.models.product_image_upload_to, verbose_name='책 이미지'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0008_product_image_upload_to'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='isbn',
+            field=models.CharField(blank=True, max_length=20, null=True, unique=True, verbose_name='ISBN'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0009_product_isbn'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockAdjustment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('delta', models.IntegerField(verbose_name='증감 수량')),
+                ('stock_after', models.IntegerField(verbose_name='조정 후 재고')),
+                ('reason', models.CharField(blank=True, max_length=100, verbose_name='사유')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('adjusted_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='조정한 관리자')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stock_adjustments', to='products.product')),
+            ],
+            options={
+                'verbose_name': '재고 조정 기록',
+                'verbose_name_plural': '재고 조정 기록',
+                'indexes': [models.Index(fields=['product', '-created_at'], name='stock_adj_product_created_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0011_product_instock_category_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SuggestionTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('title', '상품명'), ('author', '작가')], max_length=10)),
+                ('text', models.CharField(max_length=255)),
+                ('weight', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': '자동완성 후보',
+                'verbose_name_plural': '자동완성 후보',
+                'constraints': [models.UniqueConstraint(fields=('kind', 'text'), name='suggestion_term_kind_text_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SuggestionKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255)),
+                ('choseong', models.CharField(max_length=255)),
+                ('term', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keys', to='products.suggestionterm')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['key'], name='suggestion_key_prefix_idx', opclasses=['varchar_pattern_ops']), models.Index(fields=['choseong'], name='suggestion_choseong_prefix_idx', opclasses=['varchar_pattern_ops'])],
+            },
+        ),
+    ]
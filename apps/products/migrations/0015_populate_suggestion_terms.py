@@ -0,0 +1,88 @@
+from django.db import migrations
+from django.db.models import Count
+
+BATCH_SIZE = 1000
+
+# 이 마이그레이션 작성 시점의 apps.products.suggestions / hangul 로직 복사본
+# (이후 코드가 바뀌어도 마이그레이션 결과가 달라지지 않도록 현재 코드를 import하지 않음)
+MAX_KEYS_PER_TERM = 8
+EXCLUDED_TEXTS = {"author": {"작자 미상"}}
+KIND_FIELDS = {"title": "name", "author": "author"}
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG_INTERVAL = 21 * 28
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+
+def normalize(text):
+    return "".join(text.split()).lower()
+
+
+def choseong(text):
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            chars.append(CHOSEONG[(code - HANGUL_BASE) // CHOSEONG_INTERVAL])
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+
+def build_keys(text):
+    words = text.split()
+    keys = []
+    for start in range(min(len(words), MAX_KEYS_PER_TERM)):
+        key = normalize("".join(words[start:]))[:255]
+        if key:
+            keys.append((key, choseong(key)))
+    return keys
+
+
+def populate_suggestion_terms(apps, schema_editor):
+    """
+    기존 상품으로 자동완성 후보 채우기 (배포 직후부터 /api/products/suggest/ 사용 가능)
+    - rebuild_product_suggestions 명령과 같은 결과, 과거 모델 기준으로 실행
+    """
+    Product = apps.get_model("products", "Product")
+    SuggestionTerm = apps.get_model("products", "SuggestionTerm")
+    SuggestionKey = apps.get_model("products", "SuggestionKey")
+
+    SuggestionTerm.objects.all().delete()
+    for kind, field in KIND_FIELDS.items():
+        excluded = EXCLUDED_TEXTS.get(kind, set())
+        counts = Product.objects.values_list(field).annotate(weight=Count("id")).order_by(field)
+
+        batch = []
+        for text, weight in counts.iterator():
+            if text and text not in excluded:
+                batch.append(SuggestionTerm(kind=kind, text=text, weight=weight))
+            if len(batch) >= BATCH_SIZE:
+                _save_terms(SuggestionTerm, SuggestionKey, batch)
+                batch = []
+        if batch:
+            _save_terms(SuggestionTerm, SuggestionKey, batch)
+
+
+def _save_terms(SuggestionTerm, SuggestionKey, terms):
+    terms = SuggestionTerm.objects.bulk_create(terms)
+    SuggestionKey.objects.bulk_create(
+        [
+            SuggestionKey(term_id=term.pk, key=key, choseong=key_choseong)
+            for term in terms
+            for key, key_choseong in build_keys(term.text)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0014_product_thumbnails_claimed_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_suggestion_terms, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:04
+
+from django.db import migrations, models
+from django.db.models import F
+
+DEFAULT_PRODUCT_IMAGE = "products/product_default.jpg"
+
+
+def mark_pending_thumbnails(apps, schema_editor):
+    """이미지는 있는데 썸네일이 현재 이미지 기준이 아닌 기존 상품을 대기로 표시"""
+    Product = apps.get_model("products", "Product")
+    Product.objects.exclude(image=DEFAULT_PRODUCT_IMAGE).exclude(image="").exclude(
+        thumbnails_source=F("image")
+    ).update(thumbnails_pending=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0015_populate_suggestion_terms'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='thumbnails_pending',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('thumbnails_pending', True)), fields=['id'], name='product_thumbs_pending_idx'),
+        ),
+        migrations.RunPython(mark_pending_thumbnails, reverse_code=migrations.RunPython.noop),
+    ]
@@ -1,7 +1,24 @@
+import uuid
+from datetime import datetime
+from pathlib import PurePosixPath
+
+from django.conf import settings
 from django.db import models
 
 from apps.core.models import TimestampModel
 
+DEFAULT_PRODUCT_IMAGE = "products/product_default.jpg"
+
+
+def product_image_upload_to(instance, filename):
+    """
+    상품 이미지 저장 키: products/{시각}_{랜덤}.{확장자}
+    - pk가 생기기 전에 키를 정해서 업로드 시점에 한 번만 저장 (저장 후 이름 변경/재업로드 없음)
+    """
+    ext = PurePosixPath(filename).suffix.lower() or ".jpg"
+    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    return f"products/{timestamp}_{uuid.uuid4().hex[:12]}{ext}"
+
 
 class ProductCategory(models.TextChoices):
     NOVEL = "소설", "소설"
@@ -28,6 +45,8 @@ class ProductCategory(models.TextChoices):
 
 
 class Product(TimestampModel):
+    # 외부 카탈로그 연동 키 (대량 등록 시 이 값으로 신규/수정 구분)
+    isbn = models.CharField(max_length=20, unique=True, null=True, blank=True, verbose_name="ISBN")
     name = models.CharField(max_length=255, verbose_name="상품명")
     description = models.TextField(verbose_name="상품 상세 설명", blank=True)
     author = models.CharField(max_length=100, verbose_name="작가", default="작자 미상")
@@ -35,7 +54,42 @@ class Product(TimestampModel):
     price = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="가격")
     stock = models.IntegerField(verbose_name="재고 수량")
     category = models.CharField(max_length=20, choices=ProductCategory.choices)
-    image = models.ImageField(upload_to="", verbose_name="책 이미지", default="products/product_default.jpg")
+    image = models.ImageField(
+        upload_to=product_image_upload_to, verbose_name="책 이미지", default=DEFAULT_PRODUCT_IMAGE
+    )
+    # 썸네일 - 워커(generate_thumbnails)가 업로드마다 한 번 생성 ({"너비": {"포맷": 저장 키}})
+    thumbnails = models.JSONField(default=dict, blank=True, verbose_name="썸네일")
+    thumbnails_source = models.CharField(max_length=255, blank=True, default="", verbose_name="썸네일 원본 이미지")
+    # 썸네일 워커가 처리 중으로 표시한 시각 (여러 워커의 중복 처리 방지, 오래되면 다시 처리 대상)
+    thumbnails_claimed_at = models.DateTimeField(null=True, blank=True, editable=False)
+    # 썸네일 생성 대기 - 이미지가 바뀔 때 save()에서 켜고 워커가 결과를 기록하면 끔 (부분 인덱스로 폴링)
+    thumbnails_pending = models.BooleanField(default=False, editable=False)
+
+    # DB에서 읽어온 시점의 값 (새 객체/지연 로딩이면 None)
+    # - 이미지 이름: 수정 시 기존 파일 정리용
+    # - (상품명, 작가명): 바뀐 경우에만 자동완성 후보 갱신
+    _loaded_image_name = None
+    _loaded_suggestion_texts = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        deferred = instance.get_deferred_fields()
+        if "image" not in deferred:
+            instance._loaded_image_name = instance.image.name
+        if not {"name", "author"} & deferred:
+            instance._loaded_suggestion_texts = (instance.name, instance.author)
+        return instance
+
+    def save(self, *args, **kwargs):
+        # 새 이미지가 연결되면 썸네일 생성 대기로 표시 (기본 이미지는 썸네일 없이 그대로 사용)
+        image_name = self.image.name
+        if image_name and image_name != DEFAULT_PRODUCT_IMAGE and image_name != self._loaded_image_name:
+            self.thumbnails_pending = True
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "image" in update_fields:
+                kwargs["update_fields"] = {*update_fields, "thumbnails_pending"}
+        super().save(*args, **kwargs)
 
     def __str__(self):
         """객체를 문자열로 표현할 때 사용"""
@@ -45,3 +99,98 @@ class Product(TimestampModel):
         verbose_name = "상품"
         verbose_name_plural = "상품 목록"
         ordering = ["-created_at"]  # 최신 상품이 먼저 보이도록 정렬
+        indexes = [
+            # 카테고리 필터 + 가격 범위/정렬
+            models.Index(fields=["category", "price"], name="product_category_price_idx"),
+            models.Index(fields=["price"], name="product_price_idx"),
+            # 카테고리 목록의 재고 있는 상품만 보기 (기본 정렬 id) - 품절 상품은 인덱스에서 제외
+            models.Index(
+                fields=["category", "id"], condition=models.Q(stock__gt=0), name="product_instock_category_idx"
+            ),
+            # 썸네일 워커 폴링 - 대기 상품만 인덱스에 포함
+            models.Index(fields=["id"], condition=models.Q(thumbnails_pending=True), name="product_thumbs_pending_idx"),
+        ]
+
+
+class StockAdjustment(models.Model):
+    """재고 증감 기록 (대량 재고 조정 API로 바뀐 재고의 감사 로그)"""
+
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="stock_adjustments")
+    delta = models.IntegerField(verbose_name="증감 수량")
+    stock_after = models.IntegerField(verbose_name="조정 후 재고")
+    reason = models.CharField(max_length=100, blank=True, verbose_name="사유")
+    adjusted_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, verbose_name="조정한 관리자"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.product_id}: {self.delta:+d} → {self.stock_after}"
+
+    class Meta:
+        verbose_name = "재고 조정 기록"
+        verbose_name_plural = "재고 조정 기록"
+        indexes = [
+            # 상품별 조정 이력 최신순 조회
+            models.Index(fields=["product", "-created_at"], name="stock_adj_product_created_idx"),
+        ]
+
+
+class SuggestionTerm(models.Model):
+    """자동완성 후보 (상품명/작가명 값 하나당 한 행, 가중치 = 그 값을 가진 상품 수)"""
+
+    class Kind(models.TextChoices):
+        TITLE = "title", "상품명"
+        AUTHOR = "author", "작가"
+
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    text = models.CharField(max_length=255)
+    weight = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.text}"
+
+    class Meta:
+        verbose_name = "자동완성 후보"
+        verbose_name_plural = "자동완성 후보"
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "text"], name="suggestion_term_kind_text_uniq"),
+        ]
+
+
+class SuggestionKey(models.Model):
+    """
+    자동완성 접두어 검색 키 (후보의 단어 시작 위치마다 한 행)
+    - "해리 포터" → key "해리포터"/"포터", choseong "ㅎㄹㅍㅌ"/"ㅍㅌ"
+    """
+
+    term = models.ForeignKey(SuggestionTerm, on_delete=models.CASCADE, related_name="keys")
+    key = models.CharField(max_length=255)
+    choseong = models.CharField(max_length=255)
+
+    class Meta:
+        indexes = [
+            # LIKE '접두어%' 조회용 (PostgreSQL은 pattern_ops가 있어야 로캘과 무관하게 인덱스 사용)
+            models.Index(fields=["key"], opclasses=["varchar_pattern_ops"], name="suggestion_key_prefix_idx"),
+            models.Index(fields=["choseong"], opclasses=["varchar_pattern_ops"], name="suggestion_choseong_prefix_idx"),
+        ]
+
+
+class RelatedProduct(models.Model):
+    """
+    함께 구매한 상품 (상품별 상위 k개, build_related_products 명령으로 주기 재계산)
+    - score: 두 상품이 같은 주문에 함께 담긴 주문 수
+    """
+
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="related_entries")
+    related = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="+")
+    score = models.PositiveIntegerField()
+    rank = models.PositiveSmallIntegerField()
+
+    class Meta:
+        verbose_name = "함께 구매한 상품"
+        verbose_name_plural = "함께 구매한 상품"
+        constraints = [
+            # 상품 상세의 추천 조회가 (product, rank) 인덱스 범위 조회 한 번
+            models.UniqueConstraint(fields=["product", "rank"], name="related_product_rank_uniq"),
+        ]
@@ -0,0 +1,94 @@
+"""
+함께 구매한 상품 추천 (co-purchase)
+
+- 같은 주문의 OrderItem 쌍을 DB에서 GROUP BY로 집계 (희소 행렬의 0이 아닌 칸만 계산)
+  → 상품 순서대로 스트리밍하며 상품별 상위 k개만 남겨 RelatedProduct에 저장
+- 조회는 (product, rank) 인덱스 한 번 + 캐시 (재계산/상품 변경 시 네임스페이스 무효화)
+"""
+
+from datetime import timedelta
+from itertools import groupby
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from apps.core.cache import bump_namespace, get_or_compute, make_key
+from apps.orders.models import OrderItem
+
+from .models import RelatedProduct
+
+RELATED_NAMESPACE = "products:related"
+BULK_BATCH_SIZE = 5000
+
+
+def co_purchase_counts(since=None, min_score=1):
+    """
+    (상품 id, 함께 산 상품 id, 함께 담긴 주문 수) - 상품 id 순, 같은 상품 안에서는 주문 수 내림차순
+    - 같은 주문에 같은 상품이 여러 줄이어도 주문 한 번으로 셈
+    """
+    items = OrderItem.objects.all()
+    if since is not None:
+        items = items.filter(order__created_at__gte=since)
+
+    return (
+        items.annotate(other=F("order__items__product_id"))
+        .filter(Q(other__lt=F("product_id")) | Q(other__gt=F("product_id")))
+        .values("product_id", "other")
+        .annotate(score=Count("order_id", distinct=True))
+        .filter(score__gte=min_score)
+        .order_by("product_id", "-score", "other")
+        .values_list("product_id", "other", "score")
+    )
+
+
+def iter_top_related(rows, top_k):
+    """정렬된 (상품, 함께 산 상품, 점수) 흐름에서 상품별 앞의 top_k개만 RelatedProduct로 변환"""
+    for product_id, group in groupby(rows, key=lambda row: row[0]):
+        for rank, (_, related_id, score) in enumerate(group, start=1):
+            if rank > top_k:
+                break
+            yield RelatedProduct(product_id=product_id, related_id=related_id, score=score, rank=rank)
+
+
+@transaction.atomic
+def build_related_products(top_k=None, min_score=None, days=None):
+    """
+    추천 테이블 전체 재계산 - 반환: 저장한 행 수
+    - days: 최근 N일 주문만 사용 (None이면 전체)
+    - 한 트랜잭션에서 교체하므로 재계산 중에도 다른 요청은 이전 추천을 조회
+    """
+    top_k = top_k or settings.PRODUCT_RELATED_TOP_K
+    min_score = min_score or settings.PRODUCT_RELATED_MIN_SCORE
+    since = timezone.now() - timedelta(days=days) if days else None
+
+    RelatedProduct.objects.all().delete()
+
+    total = 0
+    batch = []
+    rows = co_purchase_counts(since, min_score).iterator(chunk_size=BULK_BATCH_SIZE)
+    for entry in iter_top_related(rows, top_k):
+        batch.append(entry)
+        if len(batch) >= BULK_BATCH_SIZE:
+            RelatedProduct.objects.bulk_create(batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        RelatedProduct.objects.bulk_create(batch)
+        total += len(batch)
+
+    transaction.on_commit(lambda: bump_namespace(RELATED_NAMESPACE))
+    return total
+
+
+def get_related_products(product_id):
+    """추천 상품 목록 (rank 순, 상위 PRODUCT_RELATED_TOP_K개) - 캐시 적중 시 쿼리 없음"""
+    return get_or_compute(
+        make_key(RELATED_NAMESPACE, product_id),
+        lambda: [
+            entry.related
+            for entry in RelatedProduct.objects.filter(product_id=product_id).select_related("related").order_by("rank")
+        ],
+        timeout=settings.PRODUCT_RELATED_CACHE_TTL,
+    )
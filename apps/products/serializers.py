@@ -1,16 +1,129 @@
+from django.conf import settings
 from rest_framework import serializers
 
+from .importer import IMPORT_FORMATS, detect_format
 from .models import Product
+from .uploads import UPLOAD_CONTENT_TYPES, check_uploaded_key
 
 
 class ProductSerializer(serializers.ModelSerializer):
     """
     Product 모델을 위한 시리얼라이저입니다.
+    - thumbnails: {"너비": {"webp": URL, "jpeg": URL}} (생성 전이면 빈 객체 → image 원본 사용)
+    - image_key: 직접 업로드(presigned)로 올린 이미지의 저장 키 (image 파일 대신 사용)
     """
 
+    thumbnails = serializers.SerializerMethodField()
+    image_key = serializers.CharField(write_only=True, required=False, help_text="업로드 URL 발급 시 받은 key")
+
     class Meta:
         model = Product
-        fields = "__all__"
+        exclude = ["thumbnails_source", "thumbnails_claimed_at", "thumbnails_pending"]
+
+    def get_thumbnails(self, obj):
+        # 이미지가 바뀐 뒤 아직 재생성 전이면 이전 이미지의 썸네일이므로 노출하지 않음
+        if obj.thumbnails_source != obj.image.name:
+            return {}
+        storage = obj.image.storage
+        return {
+            width: {fmt: storage.url(key) for fmt, key in formats.items()} for width, formats in obj.thumbnails.items()
+        }
+
+    def validate_image_key(self, value):
+        error = check_uploaded_key(value)
+        if error:
+            raise serializers.ValidationError(error)
+        # 다른 상품의 이미지를 가리키면 그 상품 이미지 변경/삭제 시 함께 지워지므로 금지
+        others = Product.objects.filter(image=value)
+        if self.instance is not None:
+            others = others.exclude(pk=self.instance.pk)
+        if others.exists():
+            raise serializers.ValidationError("이미 다른 상품에서 사용 중인 이미지입니다.")
+        return value
+
+    def validate(self, attrs):
+        image_key = attrs.pop("image_key", None)
+        if image_key:
+            if attrs.get("image"):
+                raise serializers.ValidationError({"image_key": "image와 image_key는 함께 보낼 수 없습니다."})
+            # 이미 저장소에 있는 파일이므로 이름만 연결 (다시 업로드하지 않음)
+            attrs["image"] = image_key
+        return attrs
+
+
+class ProductImportSerializer(serializers.Serializer):
+    """상품 카탈로그 대량 등록 요청"""
+
+    file = serializers.FileField(help_text="CSV(헤더 포함) 또는 JSON Lines 파일 (UTF-8)")
+    format = serializers.ChoiceField(choices=IMPORT_FORMATS, required=False, help_text="생략 시 확장자로 판단")
+    dry_run = serializers.BooleanField(required=False, default=False, help_text="검증만 하고 저장하지 않음")
+
+    def validate(self, attrs):
+        attrs["format"] = attrs.get("format") or detect_format(attrs["file"].name)
+        if not attrs["format"]:
+            raise serializers.ValidationError({"format": "파일 형식(csv/jsonl)을 알 수 없습니다."})
+        return attrs
+
+
+class ProductSuggestQuerySerializer(serializers.Serializer):
+    """자동완성 요청 파라미터"""
+
+    q = serializers.CharField(max_length=50, trim_whitespace=True, help_text="입력 중인 검색어 (초성 가능)")
+    limit = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=settings.PRODUCT_SUGGEST_MAX_LIMIT,
+        default=settings.PRODUCT_SUGGEST_DEFAULT_LIMIT,
+    )
+
+
+class ProductRelatedQuerySerializer(serializers.Serializer):
+    """함께 구매한 상품 요청 파라미터"""
+
+    limit = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=settings.PRODUCT_RELATED_TOP_K,
+        default=settings.PRODUCT_RELATED_TOP_K,
+    )
+
+
+class StockAdjustmentItemSerializer(serializers.Serializer):
+    """재고 증감 한 건 - product_id 또는 isbn 중 하나로 상품 지정"""
+
+    product_id = serializers.IntegerField(required=False)
+    isbn = serializers.CharField(required=False, max_length=20)
+    delta = serializers.IntegerField(help_text="증감 수량 (입고 +, 출고 -)")
+
+    def validate(self, attrs):
+        if ("product_id" in attrs) == ("isbn" in attrs):
+            raise serializers.ValidationError("product_id와 isbn 중 하나만 지정해야 합니다.")
+        return attrs
+
+
+class StockAdjustmentRequestSerializer(serializers.Serializer):
+    """대량 재고 조정 요청"""
+
+    adjustments = serializers.ListField(
+        child=StockAdjustmentItemSerializer(),
+        allow_empty=False,
+        max_length=settings.PRODUCT_STOCK_ADJUST_MAX_ITEMS,
+    )
+    reason = serializers.CharField(required=False, allow_blank=True, max_length=100, default="")
+
+
+class ProductImageUploadSerializer(serializers.Serializer):
+    """상품 이미지 업로드 URL 발급 요청"""
+
+    content_type = serializers.ChoiceField(choices=list(UPLOAD_CONTENT_TYPES))
+
+
+class ProductImageLocalUploadSerializer(serializers.Serializer):
+    """개발용 로컬 업로드 (presigned POST 폼과 같은 필드)"""
+
+    key = serializers.CharField()
+    policy = serializers.CharField()
+    file = serializers.ImageField()
 
 
 # 상품 통계 serializer
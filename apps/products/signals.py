@@ -1,73 +1,90 @@
-from datetime import datetime
-
-from django.db.models.signals import post_delete, post_save, pre_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from .models import Product
-
-DEFAULT_PRODUCT_IMAGE = "products/product_default.jpg"
+from apps.core.cache import bump_namespace
 
+from .facets import FACETS_NAMESPACE
+from .images import thumbnail_keys
+from .models import DEFAULT_PRODUCT_IMAGE, Product
+from .related import RELATED_NAMESPACE
+from .suggestions import refresh_suggestion_terms
 
-@receiver(pre_save, sender=Product)
-def update_product_image_filename(sender, instance, **kwargs):
-    """
-    상품 수정 시: 기존 이미지 삭제 + 새 파일명 적용
-    """
-    # 신규 생성인데 아직 pk 없음
-    if not instance.pk:
-        return
 
-    # 기본 이미지면 업로드/변경 막기
-    if instance.image.name == DEFAULT_PRODUCT_IMAGE:
+def delete_image_file(storage, name):
+    """상품 이미지 파일 삭제 (기본 이미지는 공용이라 삭제하지 않음)"""
+    if not name or name == DEFAULT_PRODUCT_IMAGE:
         return
-
     try:
-        old_instance = Product.objects.get(pk=instance.pk)
-        old_image = old_instance.image
-    except Product.DoesNotExist:
-        old_image = None
-
-    # 기존 이미지가 기본 이미지라면 삭제하지 않음
-    if old_image and old_image.name == DEFAULT_PRODUCT_IMAGE:
-        old_image = None
-
-    # 이미지가 변경된 경우에만 처리
-    if instance.image and (not old_image or old_image.name != instance.image.name):
-        ext = instance.image.name.split(".")[-1]
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        instance.image.name = f"products/{instance.pk}_{timestamp}.{ext}"
-
-        if old_image and old_image.name and old_image != instance.image:
-            try:
-                old_image.delete(save=False)
-            except Exception as e:
-                print(f"[WARN] 기존 이미지 삭제 실패: {e}")
+        storage.delete(name)
+    except Exception as e:
+        print(f"[WARN] 기존 이미지 삭제 실패: {e}")
 
 
 @receiver(post_save, sender=Product)
-def rename_product_image_on_create(sender, instance, created, **kwargs):
+def delete_replaced_product_image(sender, instance, created, update_fields=None, **kwargs):
     """
-    상품 생성 시: pk가 생긴 이후 파일명 규칙 적용
+    상품 수정 시: 이미지가 바뀌었으면 기존 파일 삭제
+    - 새 파일은 ImageField가 upload_to 키로 이미 한 번 저장했으므로 이름 변경/재저장 없음
+    - 기존 이름은 조회해 둔 인스턴스 값(_loaded_image_name)과 비교 → 추가 조회 없음
+    - 트랜잭션이 롤백되면 기존 파일이 계속 쓰이므로 커밋 후에 삭제
     """
-    if instance.image.name == DEFAULT_PRODUCT_IMAGE:
+    if update_fields is not None and "image" not in update_fields:
         return
 
-    if created and instance.image:
-        ext = instance.image.name.split(".")[-1]
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        new_filename = f"products/{instance.pk}_{timestamp}.{ext}"
+    old_name = instance._loaded_image_name
+    new_name = instance.image.name
+    instance._loaded_image_name = new_name
+
+    if created or not old_name or old_name == new_name:
+        return
 
-        if instance.image.name != new_filename:
-            # 파일을 강제로 다시 저장해서 S3에 업로드
-            instance.image.storage.save(new_filename, instance.image.file)
-            instance.image.name = new_filename
-            instance.save(update_fields=["image"])
+    storage = instance.image.storage
+    transaction.on_commit(lambda: delete_image_file(storage, old_name))
 
 
 @receiver(post_delete, sender=Product)
 def delete_product_image_on_delete(sender, instance, **kwargs):
     """
-    상품 삭제 시 S3 이미지도 삭제
+    상품 삭제 시 S3 이미지와 썸네일도 삭제
     """
     if instance.image and instance.image.name != DEFAULT_PRODUCT_IMAGE:
+        for key in thumbnail_keys(instance.thumbnails):
+            instance.image.storage.delete(key)
         instance.image.delete(save=False)
+
+
+# 카테고리/가격이 바뀔 수 있으므로 상품 저장/삭제 시 패싯 캐시 무효화
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_product_facets(sender, instance, **kwargs):
+    bump_namespace(FACETS_NAMESPACE)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_related_products(sender, instance, **kwargs):
+    # 추천 캐시에 상품 정보(가격/재고)가 함께 들어 있으므로 상품이 바뀌면 무효화
+    bump_namespace(RELATED_NAMESPACE)
+
+
+@receiver(post_save, sender=Product)
+def refresh_product_suggestions(sender, instance, created, **kwargs):
+    """
+    상품명/작가명이 바뀌었으면 이전 값과 새 값의 자동완성 후보 가중치 다시 집계
+    - 재고/가격만 바뀐 저장은 추가 쿼리 없음 (조회해 둔 값과 비교)
+    - 이전 값을 모르는 경우(지연 로딩 등)는 새 값만 갱신, 이전 값은 rebuild 명령으로 정리
+    """
+    old = instance._loaded_suggestion_texts
+    new = (instance.name, instance.author)
+    instance._loaded_suggestion_texts = new
+
+    if not created and old == new:
+        return
+    old_name, old_author = old or (None, None)
+    refresh_suggestion_terms(names=[instance.name, old_name], authors=[instance.author, old_author])
+
+
+@receiver(post_delete, sender=Product)
+def refresh_product_suggestions_on_delete(sender, instance, **kwargs):
+    refresh_suggestion_terms(names=[instance.name], authors=[instance.author])
@@ -0,0 +1,98 @@
+"""
+대량 재고 조정 (창고 재고 동기화용)
+
+- 상품 수와 관계없이 UPDATE 1번으로 stock = stock + 증감량 적용 (CASE WHEN으로 상품별 증감량 지정)
+  → 상품마다 save()/이미지 시그널/조회를 실행하지 않고, 동시에 들어온 주문의 재고 차감도 덮어쓰지 않음
+- 조정 후 재고를 한 번 조회해서 감사 로그(StockAdjustment)를 bulk_create
+- 요청 전체가 하나의 트랜잭션: 없는 상품이 있거나 재고가 음수가 되면 전부 취소
+- queryset.update()는 시그널이 없으므로 재고를 담은 캐시(패싯, 함께 구매한 상품)는 커밋 후 직접 무효화
+"""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.core.cache import bump_namespace
+
+from .facets import FACETS_NAMESPACE
+from .importer import normalize_isbn
+from .models import Product, StockAdjustment
+from .related import RELATED_NAMESPACE
+
+
+def _resolve_product_ids(adjustments):
+    """
+    {"product_id" 또는 "isbn", "delta"} 목록 → {상품 id: 증감량 합계}
+    - 같은 상품이 여러 번 오면 증감량을 합산
+    - ISBN은 대량 등록과 같은 규칙으로 정규화해서 조회 (하이픈 포함 입력 허용)
+    """
+    isbns = {normalize_isbn(item["isbn"]) for item in adjustments if item.get("isbn")}
+    ids_by_isbn = dict(Product.objects.filter(isbn__in=isbns).values_list("isbn", "id")) if isbns else {}
+
+    missing_isbns = sorted(isbns - ids_by_isbn.keys())
+    if missing_isbns:
+        raise serializers.ValidationError({"isbn": [f"존재하지 않는 ISBN입니다: {', '.join(missing_isbns)}"]})
+
+    deltas = defaultdict(int)
+    for item in adjustments:
+        product_id = item.get("product_id") or ids_by_isbn[normalize_isbn(item["isbn"])]
+        deltas[product_id] += item["delta"]
+    return deltas
+
+
+def _invalidate_stock_caches():
+    bump_namespace(FACETS_NAMESPACE)
+    bump_namespace(RELATED_NAMESPACE)
+
+
+@transaction.atomic
+def adjust_stock(adjustments, reason="", user=None):
+    """
+    재고 증감 일괄 적용
+    - 반환: [{"product_id", "delta", "stock"}] (조정 후 재고)
+    - 실패 시 serializers.ValidationError (트랜잭션 롤백)
+    """
+    deltas = _resolve_product_ids(adjustments)
+    deltas = {product_id: delta for product_id, delta in deltas.items() if delta}
+    if not deltas:
+        return []
+
+    updated = Product.objects.filter(pk__in=deltas.keys()).update(
+        stock=F("stock")
+        + Case(
+            *(When(pk=product_id, then=Value(delta)) for product_id, delta in deltas.items()),
+            output_field=IntegerField(),
+        ),
+        updated_at=timezone.now(),
+    )
+
+    # UPDATE가 잡은 행 잠금이 트랜잭션 끝까지 유지되므로 다른 요청이 끼어들지 않은 조정 직후 값
+    stocks = dict(Product.objects.filter(pk__in=deltas.keys()).values_list("id", "stock"))
+
+    if updated != len(deltas):
+        missing_ids = sorted(set(deltas) - stocks.keys())
+        raise serializers.ValidationError({"product_id": [f"존재하지 않는 상품입니다: {missing_ids}"]})
+
+    negative = sorted(product_id for product_id, stock in stocks.items() if stock < 0)
+    if negative:
+        raise serializers.ValidationError({"delta": [f"재고가 0보다 작아지는 상품이 있습니다: {negative}"]})
+
+    StockAdjustment.objects.bulk_create(
+        [
+            StockAdjustment(
+                product_id=product_id,
+                delta=delta,
+                stock_after=stocks[product_id],
+                reason=reason,
+                adjusted_by=user,
+            )
+            for product_id, delta in deltas.items()
+        ]
+    )
+    transaction.on_commit(_invalidate_stock_caches)
+    return [
+        {"product_id": product_id, "delta": delta, "stock": stocks[product_id]} for product_id, delta in deltas.items()
+    ]
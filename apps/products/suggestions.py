@@ -0,0 +1,123 @@
+"""
+상품명/작가명 자동완성
+
+- 미리 만든 접두어 키(SuggestionKey)를 LIKE '접두어%' 인덱스 범위 조회 → 가중치 순 상위 k개
+- 상품 저장/삭제/대량 등록 시 바뀐 값만 다시 집계, 전체 재구축은 rebuild_product_suggestions 명령
+- 같은 검색어 결과는 캐시 (후보가 바뀌면 네임스페이스 무효화)
+"""
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+
+from apps.core.cache import bump_namespace, get_or_compute, make_key
+
+from .hangul import choseong, normalize, split_query
+from .models import Product, SuggestionKey, SuggestionTerm
+
+SUGGEST_NAMESPACE = "products:suggest"
+
+# 단어 시작 위치 키는 앞쪽 단어 몇 개까지만 (긴 제목의 키 폭증 방지)
+MAX_KEYS_PER_TERM = 8
+REFRESH_BATCH_SIZE = 1000
+
+# 후보로 쓰지 않는 값 (작가 기본값)
+EXCLUDED_TEXTS = {SuggestionTerm.Kind.AUTHOR: {"작자 미상"}}
+
+KIND_FIELDS = {SuggestionTerm.Kind.TITLE: "name", SuggestionTerm.Kind.AUTHOR: "author"}
+
+
+def build_keys(text):
+    """단어 시작 위치마다 (키, 초성 키) - 키 길이는 필드 길이로 자름"""
+    words = text.split()
+    keys = []
+    for start in range(min(len(words), MAX_KEYS_PER_TERM)):
+        key = normalize("".join(words[start:]))[:255]
+        if key:
+            keys.append((key, choseong(key)))
+    return keys
+
+
+def _refresh_kind(kind, texts):
+    """값 목록의 가중치를 다시 집계해서 후보 추가/갱신/삭제 - 새로 생긴 후보만 키 생성"""
+    texts = {text for text in texts if text} - EXCLUDED_TEXTS.get(kind, set())
+    if not texts:
+        return
+
+    field = KIND_FIELDS[kind]
+    counts = dict(
+        Product.objects.filter(**{f"{field}__in": texts})
+        .values(field)
+        .annotate(weight=Count("id"))
+        .values_list(field, "weight")
+    )
+    SuggestionTerm.objects.filter(kind=kind, text__in=texts - counts.keys()).delete()
+    if not counts:
+        return
+
+    existing_ids = set(SuggestionTerm.objects.filter(kind=kind, text__in=counts.keys()).values_list("id", flat=True))
+    terms = SuggestionTerm.objects.bulk_create(
+        [SuggestionTerm(kind=kind, text=text, weight=weight) for text, weight in counts.items()],
+        update_conflicts=True,
+        unique_fields=["kind", "text"],
+        update_fields=["weight"],
+    )
+    SuggestionKey.objects.bulk_create(
+        [
+            SuggestionKey(term_id=term.pk, key=key, choseong=key_choseong)
+            for term in terms
+            if term.pk not in existing_ids
+            for key, key_choseong in build_keys(term.text)
+        ]
+    )
+
+
+def refresh_suggestion_terms(names=(), authors=()):
+    """바뀐 상품명/작가명 후보만 다시 집계 (저장 시그널, 대량 등록 청크마다 호출)"""
+    names, authors = list(set(names)), list(set(authors))
+    with transaction.atomic():
+        for start in range(0, max(len(names), len(authors)), REFRESH_BATCH_SIZE):
+            _refresh_kind(SuggestionTerm.Kind.TITLE, names[start : start + REFRESH_BATCH_SIZE])
+            _refresh_kind(SuggestionTerm.Kind.AUTHOR, authors[start : start + REFRESH_BATCH_SIZE])
+    bump_namespace(SUGGEST_NAMESPACE)
+
+
+@transaction.atomic
+def rebuild_suggestion_index():
+    """전체 후보 재구축 - 반환: 후보 수 (재구축 중에도 다른 트랜잭션은 이전 후보를 조회)"""
+    SuggestionTerm.objects.all().delete()
+    names = Product.objects.values_list("name", flat=True).distinct().order_by()
+    authors = Product.objects.values_list("author", flat=True).distinct().order_by()
+    refresh_suggestion_terms(names.iterator(), authors.iterator())
+    return SuggestionTerm.objects.count()
+
+
+def _find_suggestions(prefix, choseong_prefix, limit):
+    keys = SuggestionKey.objects.all()
+    if prefix:
+        keys = keys.filter(key__startswith=prefix)
+    if choseong_prefix:
+        keys = keys.filter(choseong__startswith=choseong_prefix)
+
+    return list(
+        SuggestionTerm.objects.filter(id__in=keys.values("term_id"))
+        .order_by("-weight", "text")
+        .values("text", "kind")[:limit]
+    )
+
+
+def suggest(query, limit):
+    """
+    검색어 접두어로 시작하는(단어 시작 포함) 상품명/작가명 상위 limit개
+    - 초성만(ㅍㅇㅆ) 또는 마지막 글자 입력 중(파이ㅆ)인 검색어도 매칭
+    """
+    prefix, choseong_prefix = split_query(query)
+    if not prefix and not choseong_prefix:
+        return []
+
+    key = make_key(SUGGEST_NAMESPACE, limit, prefix, choseong_prefix or "")
+    return get_or_compute(
+        key,
+        lambda: _find_suggestions(prefix, choseong_prefix, limit),
+        timeout=settings.PRODUCT_SUGGEST_CACHE_TTL,
+    )
@@ -0,0 +1,109 @@
+import io
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .importer import import_products, iter_csv_rows
+from .models import Product, ProductCategory
+
+
+def group_by_queries(queries):
+    return [q for q in queries if "GROUP BY" in q["sql"]]
+
+
+@override_settings(PRODUCT_FACET_PRICE_BOUNDS=[10000, 20000])
+class ProductFacetsTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for name, price, category in [
+            ("파이썬 입문", "8000", ProductCategory.PROGRAMMING),
+            ("파이썬 심화", "25000", ProductCategory.PROGRAMMING),
+            ("장고 실전", "15000", ProductCategory.PROGRAMMING),
+            ("여름 소설", "12000", ProductCategory.NOVEL),
+            ("겨울 소설", "9000", ProductCategory.NOVEL),
+        ]:
+            Product.objects.create(name=name, price=Decimal(price), stock=1, category=category)
+        cls.url = reverse("products:product-list")
+
+    def setUp(self):
+        cache.clear()
+
+    def get_facets(self, **params):
+        response = self.client.get(self.url, {"facets": 1, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["facets"]
+
+    @staticmethod
+    def category_counts(facets):
+        return {item["value"]: item["count"] for item in facets["category"] if item["count"]}
+
+    def test_facets_not_included_by_default(self):
+        response = self.client.get(self.url)
+
+        self.assertNotIn("facets", response.data)
+
+    def test_category_counts_and_price_histogram(self):
+        facets = self.get_facets()
+
+        self.assertEqual(self.category_counts(facets), {ProductCategory.PROGRAMMING: 3, ProductCategory.NOVEL: 2})
+        # 모든 카테고리가 0 포함 고정 순서로 반환
+        self.assertEqual([item["value"] for item in facets["category"]], ProductCategory.values)
+        self.assertEqual(
+            facets["price"],
+            [
+                {"min": 0, "max": 10000, "count": 2},
+                {"min": 10000, "max": 20000, "count": 2},
+                {"min": 20000, "max": None, "count": 1},
+            ],
+        )
+
+    def test_facets_follow_current_filter(self):
+        facets = self.get_facets(query="파이썬")
+
+        self.assertEqual(self.category_counts(facets), {ProductCategory.PROGRAMMING: 2})
+        self.assertEqual([bucket["count"] for bucket in facets["price"]], [1, 0, 1])
+
+    def test_single_group_by_and_cached_per_filter(self):
+        with CaptureQueriesContext(connection) as first:
+            self.get_facets(min_price=9000, query="")
+        with CaptureQueriesContext(connection) as second:
+            # 순서/빈 값만 다른 같은 조건 → 캐시 적중
+            self.get_facets(query="", min_price=9000, page=1)
+
+        self.assertEqual(len(group_by_queries(first)), 1)
+        self.assertEqual(len(group_by_queries(second)), 0)
+
+    def test_different_filter_uses_own_entry(self):
+        self.get_facets()
+
+        facets = self.get_facets(category=ProductCategory.NOVEL)
+
+        self.assertEqual(self.category_counts(facets), {ProductCategory.NOVEL: 2})
+
+    def test_product_change_invalidates(self):
+        self.get_facets()
+        product = Product.objects.get(name="겨울 소설")
+        product.category = ProductCategory.POETRY_ESSAY
+        product.save()
+
+        facets = self.get_facets()
+
+        self.assertEqual(self.category_counts(facets)[ProductCategory.NOVEL], 1)
+        self.assertEqual(self.category_counts(facets)[ProductCategory.POETRY_ESSAY], 1)
+
+    def test_bulk_import_invalidates(self):
+        self.get_facets()
+
+        import_products(
+            iter_csv_rows(io.StringIO("isbn,name,price,stock,category\n9788900000011,대량 등록 책,30000,1,여행\n"))
+        )
+
+        facets = self.get_facets()
+        self.assertEqual(self.category_counts(facets)[ProductCategory.TRAVEL], 1)
+        self.assertEqual(facets["price"][-1]["count"], 2)
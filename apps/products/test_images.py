@@ -0,0 +1,269 @@
+import io
+import shutil
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APIClient
+
+from .images import (
+    CLAIM_TIMEOUT,
+    claim_pending_thumbnails,
+    generate_thumbnails,
+    pending_thumbnail_products,
+    process_pending_thumbnails,
+    thumbnail_key,
+)
+from .models import DEFAULT_PRODUCT_IMAGE, Product, ProductCategory
+
+
+def make_image_file(name="cover.png", size=(1200, 1600)):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color=(200, 30, 30)).save(buffer, format="PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+class TempMediaMixin:
+    """테스트마다 빈 임시 MEDIA_ROOT에 파일 저장"""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def stored_files(self, path="products"):
+        return sorted(default_storage.listdir(path)[1])
+
+
+@override_settings(PRODUCT_THUMBNAIL_WIDTHS=[200, 400], PRODUCT_THUMBNAIL_FORMATS=["webp", "jpeg"])
+class ProductThumbnailTest(TempMediaMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.product = Product.objects.create(
+            name="썸네일 책",
+            price=Decimal("10000"),
+            stock=5,
+            category=ProductCategory.NOVEL,
+            image=make_image_file(),
+        )
+
+    def test_thumbnail_key_is_deterministic(self):
+        self.assertEqual(thumbnail_key("products/3_20250101.png", 200, "webp"), "products/thumbs/3_20250101_200w.webp")
+        self.assertEqual(thumbnail_key("products/3_20250101.png", 400, "jpeg"), "products/thumbs/3_20250101_400w.jpg")
+
+    def test_upload_is_pending_until_worker_runs(self):
+        self.assertIn(self.product, pending_thumbnail_products())
+
+        self.assertEqual(process_pending_thumbnails(), (1, 0))
+
+        self.product.refresh_from_db()
+        self.assertNotIn(self.product, pending_thumbnail_products())
+        self.assertEqual(self.product.thumbnails_source, self.product.image.name)
+        # 한 번 처리한 업로드는 다시 처리하지 않음
+        self.assertEqual(process_pending_thumbnails(), (0, 0))
+
+    def test_thumbnails_resized_per_width_and_format(self):
+        process_pending_thumbnails()
+        self.product.refresh_from_db()
+
+        for width in ("200", "400"):
+            for fmt, pil_format in (("webp", "WEBP"), ("jpeg", "JPEG")):
+                key = self.product.thumbnails[width][fmt]
+                self.assertEqual(key, thumbnail_key(self.product.image.name, int(width), fmt))
+                with default_storage.open(key, "rb") as f:
+                    thumb = Image.open(f)
+                    self.assertEqual(thumb.format, pil_format)
+                    self.assertEqual(thumb.width, int(width))
+                    self.assertAlmostEqual(thumb.height, int(width) * 4 / 3, delta=1)
+
+    def test_records_name_returned_by_storage(self):
+        """저장소가 키와 다른 이름으로 저장하면 그 이름을 기록"""
+        original_save = default_storage.save
+
+        def save_with_suffix(name, content, *args, **kwargs):
+            return original_save(name.replace("w.", "w_x."), content, *args, **kwargs)
+
+        with patch.object(default_storage, "save", side_effect=save_with_suffix):
+            thumbnails = generate_thumbnails(default_storage, self.product.image.name)
+
+        key = thumbnails["200"]["webp"]
+        self.assertNotEqual(key, thumbnail_key(self.product.image.name, 200, "webp"))
+        self.assertTrue(default_storage.exists(key))
+
+    def test_image_change_with_update_fields_marks_pending(self):
+        process_pending_thumbnails()
+        self.product.refresh_from_db()
+        self.assertFalse(self.product.thumbnails_pending)
+
+        # 재고만 저장하면 대기로 바뀌지 않음
+        self.product.stock = 3
+        self.product.save(update_fields=["stock"])
+        self.assertFalse(pending_thumbnail_products().exists())
+
+        self.product.image = make_image_file("new.png")
+        self.product.save(update_fields=["image"])
+        self.assertIn(self.product, pending_thumbnail_products())
+
+    def test_default_image_is_skipped(self):
+        Product.objects.create(name="기본", price=Decimal("1000"), stock=1, category=ProductCategory.NOVEL)
+        self.assertEqual(pending_thumbnail_products().count(), 1)
+
+    def test_image_change_regenerates_and_removes_old_thumbnails(self):
+        process_pending_thumbnails()
+        self.product.refresh_from_db()
+        old_keys = [key for formats in self.product.thumbnails.values() for key in formats.values()]
+
+        self.product.image = make_image_file("new.png", size=(800, 800))
+        self.product.save()
+        self.assertIn(self.product, pending_thumbnail_products())
+
+        process_pending_thumbnails()
+        self.product.refresh_from_db()
+        for key in old_keys:
+            self.assertFalse(default_storage.exists(key))
+        self.assertTrue(default_storage.exists(self.product.thumbnails["200"]["webp"]))
+
+    def test_broken_image_is_not_retried(self):
+        Product.objects.filter(pk=self.product.pk).update(image="products/missing.png", thumbnails_pending=True)
+
+        self.assertEqual(process_pending_thumbnails(), (0, 1))
+        self.assertEqual(process_pending_thumbnails(), (0, 0))
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.thumbnails, {})
+
+    def test_claimed_product_is_skipped_until_claim_expires(self):
+        self.assertEqual(len(claim_pending_thumbnails(batch_size=5)), 1)
+        self.assertEqual(claim_pending_thumbnails(batch_size=5), [])  # 다른 워커가 처리 중
+
+        Product.objects.update(thumbnails_claimed_at=timezone.now() - CLAIM_TIMEOUT - timedelta(seconds=1))
+        self.assertEqual(process_pending_thumbnails(), (1, 0))
+
+    def test_image_changed_during_processing_discards_result(self):
+        new_name = default_storage.save("products/changed.png", make_image_file("changed.png"))
+
+        def change_image_then_generate(storage, source_name):
+            Product.objects.filter(pk=self.product.pk).update(image=new_name, thumbnails_pending=True)
+            return generate_thumbnails(storage, source_name)
+
+        with patch("apps.products.images.generate_thumbnails", side_effect=change_image_then_generate):
+            process_pending_thumbnails()
+
+        self.product.refresh_from_db()
+        self.assertEqual((self.product.thumbnails, self.product.thumbnails_source), ({}, ""))
+        self.assertIsNone(self.product.thumbnails_claimed_at)
+        self.assertEqual(self.stored_files("products/thumbs"), [])
+
+        # 바뀐 이미지는 다음 배치에서 처리
+        self.assertEqual(process_pending_thumbnails(), (1, 0))
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.thumbnails_source, new_name)
+
+    def test_list_exposes_thumbnail_urls_only_when_current(self):
+        client = APIClient()
+        url = reverse("products:product-list")
+
+        item = client.get(url).json()["results"][0]
+        self.assertEqual(item["thumbnails"], {})
+        self.assertNotIn("thumbnails_source", item)
+
+        process_pending_thumbnails()
+        item = client.get(url).json()["results"][0]
+        self.assertTrue(item["thumbnails"]["200"]["webp"].endswith("_200w.webp"))
+        self.assertTrue(item["thumbnails"]["400"]["jpeg"].endswith("_400w.jpg"))
+
+    def test_delete_removes_thumbnails(self):
+        process_pending_thumbnails()
+        self.product.refresh_from_db()
+        key = self.product.thumbnails["200"]["webp"]
+
+        self.product.delete()
+        self.assertFalse(default_storage.exists(key))
+
+    def test_command(self):
+        call_command("generate_thumbnails", batch_size=5, stdout=io.StringIO())
+        self.assertFalse(pending_thumbnail_products().exists())
+
+
+class ProductImageUploadTest(TempMediaMixin, TestCase):
+    def create_product(self, **kwargs):
+        return Product.objects.create(
+            name="업로드 책", price=Decimal("10000"), stock=5, category=ProductCategory.NOVEL, **kwargs
+        )
+
+    def test_create_writes_image_once_under_generated_key(self):
+        product = self.create_product(image=make_image_file("My Cover.PNG"))
+
+        self.assertRegex(product.image.name, r"^products/\d{14}_[0-9a-f]{12}\.png$")
+        # 업로드 원본 이름으로 남는 고아 파일 없이 최종 키 하나만 저장
+        self.assertEqual(self.stored_files(), [product.image.name.removeprefix("products/")])
+
+    def test_create_without_image_uses_default(self):
+        product = self.create_product()
+
+        self.assertEqual(product.image.name, DEFAULT_PRODUCT_IMAGE)
+
+    def test_image_change_deletes_old_file_after_commit_without_extra_query(self):
+        product = Product.objects.get(pk=self.create_product(image=make_image_file()).pk)
+        old_name = product.image.name
+
+        product.image = make_image_file("new.jpg")
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(1):  # UPDATE만 실행 (기존 이미지 조회 없음)
+                product.save()
+
+        self.assertFalse(default_storage.exists(old_name))
+        self.assertTrue(default_storage.exists(product.image.name))
+        self.assertEqual(self.stored_files(), [product.image.name.removeprefix("products/")])
+
+    def test_other_field_change_keeps_image(self):
+        product = Product.objects.get(pk=self.create_product(image=make_image_file()).pk)
+
+        product.stock = 1
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save()
+
+        self.assertTrue(default_storage.exists(product.image.name))
+
+    def test_replacing_default_image_does_not_delete_it(self):
+        product = Product.objects.get(pk=self.create_product().pk)
+        default_storage.save(DEFAULT_PRODUCT_IMAGE, make_image_file("default.jpg"))
+
+        product.image = make_image_file()
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save()
+
+        self.assertTrue(default_storage.exists(DEFAULT_PRODUCT_IMAGE))
+
+    def test_sweep_deletes_only_unreferenced_files(self):
+        product = self.create_product(image=make_image_file())
+        product.thumbnails = {"200": {"webp": "products/thumbs/kept_200w.webp"}}
+        product.save(update_fields=["thumbnails"])
+        default_storage.save("products/thumbs/kept_200w.webp", make_image_file())
+        default_storage.save("products/orphan.png", make_image_file())
+        default_storage.save("products/thumbs/orphan_200w.webp", make_image_file())
+
+        call_command("sweep_product_images", min_age_hours=0, dry_run=True, stdout=io.StringIO())
+        self.assertTrue(default_storage.exists("products/orphan.png"))
+
+        call_command("sweep_product_images", min_age_hours=0, stdout=io.StringIO())
+        self.assertFalse(default_storage.exists("products/orphan.png"))
+        self.assertFalse(default_storage.exists("products/thumbs/orphan_200w.webp"))
+        self.assertTrue(default_storage.exists(product.image.name))
+        self.assertTrue(default_storage.exists("products/thumbs/kept_200w.webp"))
+
+    def test_sweep_keeps_recent_files(self):
+        default_storage.save("products/in_flight.png", make_image_file())
+
+        call_command("sweep_product_images", stdout=io.StringIO())
+
+        self.assertTrue(default_storage.exists("products/in_flight.png"))
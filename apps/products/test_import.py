@@ -0,0 +1,211 @@
+import io
+import json
+import os
+import tempfile
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.core.cache import get_namespace_version
+
+from .facets import FACETS_NAMESPACE
+from .importer import import_products, iter_csv_rows, iter_jsonl_rows
+from .models import DEFAULT_PRODUCT_IMAGE, Product, ProductCategory
+from .related import RELATED_NAMESPACE
+
+User = get_user_model()
+
+CSV_HEADER = "isbn,name,author,publisher,price,stock,category,description\n"
+
+
+def csv_rows(text):
+    return iter_csv_rows(io.StringIO(text))
+
+
+class ProductImporterTest(TestCase):
+    def test_csv_creates_products(self):
+        result = import_products(
+            csv_rows(
+                CSV_HEADER
+                + "978-89-0000-001-1,첫 책,홍길동,출판사,15000,3,소설,소개\n"
+                + "8900000022,둘째 책,,,9000.5,0,프로그래밍,\n"
+            )
+        )
+
+        self.assertEqual(result, {"created": 2, "updated": 0, "failed": 0, "errors": []})
+        first = Product.objects.get(isbn="9788900000011")
+        self.assertEqual((first.name, first.price, first.stock), ("첫 책", Decimal("15000"), 3))
+        # 빈 칸은 모델 기본값
+        second = Product.objects.get(isbn="8900000022")
+        self.assertEqual(
+            (second.author, second.publisher, second.image.name), ("작자 미상", None, DEFAULT_PRODUCT_IMAGE)
+        )
+
+    def test_existing_isbn_is_updated_in_place(self):
+        product = Product.objects.create(
+            isbn="9788900000011",
+            name="이전 이름",
+            price=Decimal("1000"),
+            stock=1,
+            category=ProductCategory.NOVEL,
+            image="products/20250101000000_aaaaaaaaaaaa.png",
+        )
+
+        result = import_products(csv_rows(CSV_HEADER + "9788900000011,새 이름,작가,,2000,7,인문,\n"))
+
+        self.assertEqual((result["created"], result["updated"]), (0, 1))
+        updated = Product.objects.get(pk=product.pk)
+        self.assertEqual((updated.name, updated.stock, updated.category), ("새 이름", 7, ProductCategory.HUMANITIES))
+        # 카탈로그에 없는 값(이미지, 등록일)은 유지
+        self.assertEqual(updated.image.name, product.image.name)
+        self.assertEqual(updated.created_at, product.created_at)
+        self.assertEqual(Product.objects.count(), 1)
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        result = import_products(
+            csv_rows(
+                CSV_HEADER
+                + "123,잘못된 ISBN,,,1000,1,소설,\n"
+                + "9788900000011,정상,,,1000,1,소설,\n"
+                + "9788900000028,음수 재고,,,1000,-1,소설,\n"
+                + "9788900000035,없는 카테고리,,,1000,1,만화,\n"
+            )
+        )
+
+        self.assertEqual((result["created"], result["failed"]), (1, 3))
+        self.assertEqual([error["row"] for error in result["errors"]], [2, 4, 5])
+        self.assertIn("isbn", result["errors"][0]["errors"])
+        self.assertIn("stock", result["errors"][1]["errors"])
+        self.assertIn("category", result["errors"][2]["errors"])
+        self.assertTrue(Product.objects.filter(isbn="9788900000011").exists())
+
+    def test_jsonl_rows(self):
+        lines = [
+            json.dumps({"isbn": "9788900000011", "name": "JSON 책", "price": "1000", "stock": 1, "category": "소설"}),
+            "{깨진 줄",
+            "",
+            json.dumps(["배열"]),
+        ]
+
+        result = import_products(iter_jsonl_rows(io.StringIO("\n".join(lines) + "\n")))
+
+        self.assertEqual((result["created"], result["failed"]), (1, 2))
+        self.assertEqual([error["row"] for error in result["errors"]], [2, 4])
+
+    def test_duplicate_isbn_in_file_keeps_last_row(self):
+        result = import_products(
+            csv_rows(CSV_HEADER + "9788900000011,처음,,,1000,1,소설,\n" + "9788900000011,마지막,,,1000,2,소설,\n")
+        )
+
+        self.assertEqual(result["created"], 1)
+        self.assertEqual(Product.objects.get(isbn="9788900000011").name, "마지막")
+
+    def test_query_count_does_not_grow_per_row(self):
+        rows = "".join(f"97889{i:08d},책 {i},,,1000,1,소설,\n" for i in range(300))
+
+        with CaptureQueriesContext(connection) as queries:
+            result = import_products(csv_rows(CSV_HEADER + rows), chunk_size=100)
+
+        self.assertEqual(result["created"], 300)
+        # 행 수(300)가 아니라 청크 수(3)에 비례
+        # (청크마다 기존 값 조회 + 세이브포인트 + upsert + 자동완성 후보 갱신, SQLite는 변수 제한으로 INSERT 분할)
+        self.assertLess(len(queries), 40)
+
+    def test_query_count_per_chunk_is_fixed(self):
+        def count_queries(offset, count):
+            rows = "".join(f"97889{i:08d},책 {i},,,1000,1,소설,\n" for i in range(offset, offset + count))
+            with CaptureQueriesContext(connection) as queries:
+                result = import_products(csv_rows(CSV_HEADER + rows))
+            self.assertEqual(result["created"], count)
+            return len(queries)
+
+        # 한 청크 안에서는 행 수와 무관하게 쿼리 수 고정 (자동완성 후보 갱신 포함)
+        self.assertEqual(count_queries(0, 20), count_queries(20, 60))
+
+    def test_invalidates_facet_and_related_caches(self):
+        versions = [get_namespace_version(ns) for ns in (FACETS_NAMESPACE, RELATED_NAMESPACE)]
+
+        import_products(csv_rows(CSV_HEADER + "9788900000011,책,,,1000,1,소설,\n"))
+
+        self.assertEqual(
+            [get_namespace_version(ns) for ns in (FACETS_NAMESPACE, RELATED_NAMESPACE)],
+            [version + 1 for version in versions],
+        )
+
+    def test_dry_run_does_not_write(self):
+        result = import_products(csv_rows(CSV_HEADER + "9788900000011,책,,,1000,1,소설,\n"), dry_run=True)
+
+        self.assertEqual(result["created"], 1)
+        self.assertFalse(Product.objects.exists())
+
+    def test_command(self):
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(CSV_HEADER + "9788900000011,명령 책,,,1000,1,소설,\n" + "bad,,,,,,,\n")
+
+        out = io.StringIO()
+        call_command("import_products", path, chunk_size=10, stdout=out)
+
+        self.assertTrue(Product.objects.filter(isbn="9788900000011").exists())
+        self.assertIn("신규 1건, 수정 0건, 실패 1건", out.getvalue())
+        self.assertIn("3행", out.getvalue())
+
+
+class ProductImportViewTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_superuser(email="admin@example.com", name="관리자", password="adminpass")
+        cls.normal_user = User.objects.create_user(email="user@example.com", name="일반사용자", password="userpass")
+        cls.url = reverse("products_admin:admin_product_import")
+
+    def upload(self, name, content, **data):
+        return self.client.post(self.url, {"file": SimpleUploadedFile(name, content), **data}, format="multipart")
+
+    def test_admin_imports_csv(self):
+        self.client.force_authenticate(user=self.admin_user)
+        content = ("\ufeff" + CSV_HEADER + "9788900000011,업로드 책,,,1000,1,소설,\n" + "x,,,,,,,\n").encode()
+
+        response = self.upload("catalog.csv", content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data["created"], response.data["failed"]), (1, 1))
+        self.assertEqual(response.data["errors"][0]["row"], 3)
+
+    def test_dry_run_and_explicit_format(self):
+        self.client.force_authenticate(user=self.admin_user)
+        line = json.dumps({"isbn": "9788900000011", "name": "책", "price": "1", "stock": 1, "category": "소설"})
+
+        response = self.upload("catalog.txt", line.encode(), format="jsonl", dry_run="true")
+
+        self.assertEqual(response.data["created"], 1)
+        self.assertFalse(Product.objects.exists())
+
+    def test_unknown_format_is_rejected(self):
+        self.client.force_authenticate(user=self.admin_user)
+
+        response = self.upload("catalog.xlsx", b"data")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_non_utf8_file_is_rejected(self):
+        self.client.force_authenticate(user=self.admin_user)
+
+        response = self.upload("catalog.csv", (CSV_HEADER + "9788900000011,책,,,1000,1,소설,\n").encode("cp949"))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_requires_admin(self):
+        self.client.force_authenticate(user=self.normal_user)
+
+        response = self.upload("catalog.csv", CSV_HEADER.encode())
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
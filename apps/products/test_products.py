@@ -7,6 +7,7 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from .filters import ProductFilter
 from .models import Product, ProductCategory
 
 User = get_user_model()
@@ -175,6 +176,33 @@ class ProductSearchAndOrderingTest(BaseProductTestCase):
         self.assertEqual(len(response.data["results"]), 1)
         self.assertEqual(response.data["results"][0]["category"], ProductCategory.HUMANITIES)
 
+    def test_filter_by_multiple_categories(self):
+        """쉼표로 여러 카테고리 필터 (정확히 일치)"""
+        response = self.client.get(
+            self.list_url, {"category": f"{ProductCategory.HUMANITIES},{ProductCategory.COMPUTER_IT}"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual({item["name"] for item in response.data["results"]}, {"철학 입문", "데이터베이스 설계"})
+
+    def test_filter_by_category_is_exact_match(self):
+        """카테고리 필터는 부분 일치(LIKE) 대신 = / IN 조회"""
+        queryset = ProductFilter({"category": ProductCategory.NOVEL}, queryset=Product.objects.all()).qs
+        self.assertNotIn("LIKE", str(queryset.query))
+
+        response = self.client.get(self.list_url, {"category": "소"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_filter_in_stock(self):
+        """재고 있는 상품만 필터"""
+        Product.objects.filter(pk=self.product1.pk).update(stock=0)
+
+        response = self.client.get(self.list_url, {"category": ProductCategory.NOVEL, "in_stock": "true"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["name"] for item in response.data["results"]], [self.product.name])
+
+        response = self.client.get(self.list_url, {"in_stock": "false"})
+        self.assertEqual([item["name"] for item in response.data["results"]], ["해리포터"])
+
     def test_filter_by_price_range(self):
         """가격 범위 필터"""
         response = self.client.get(self.list_url, {"min_price": "12000", "max_price": "20000"})
@@ -0,0 +1,126 @@
+import io
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.orders.models import Order, OrderItem
+
+from .models import Product, ProductCategory, RelatedProduct
+from .related import build_related_products
+
+User = get_user_model()
+
+
+@override_settings(PRODUCT_RELATED_MIN_SCORE=1)
+class RelatedProductTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="buyer@example.com", name="구매자", password="pass")
+        cls.a, cls.b, cls.c, cls.d = [
+            Product.objects.create(name=name, price=Decimal("10000"), stock=10, category=ProductCategory.NOVEL)
+            for name in ["A", "B", "C", "D"]
+        ]
+        # A-B 3회, A-C 2회, A-D 1회 (같은 주문에 같은 상품 두 줄도 한 번으로)
+        cls.order([cls.a, cls.b, cls.c])
+        cls.order([cls.a, cls.b, cls.c, cls.c])
+        cls.order([cls.a, cls.b, cls.d])
+        cls.order([cls.d])
+
+    @classmethod
+    def order(cls, products):
+        order = Order.objects.create(
+            user=cls.user, recipient_name="홍길동", recipient_phone="010-1234-5678", recipient_address="서울"
+        )
+        for product in products:
+            OrderItem.objects.create(order=order, product=product, quantity=1, unit_price=product.price)
+        return order
+
+    def setUp(self):
+        cache.clear()
+
+    def related(self, product, **params):
+        response = self.client.get(reverse("products:product-related", args=[product.pk]), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item["name"] for item in response.data]
+
+    def neighbors(self, product):
+        return list(
+            RelatedProduct.objects.filter(product=product).order_by("rank").values_list("related__name", "score")
+        )
+
+    def test_ranked_by_co_purchase_count(self):
+        self.assertEqual(build_related_products(), 10)
+
+        self.assertEqual(self.neighbors(self.a), [("B", 3), ("C", 2), ("D", 1)])
+        self.assertEqual(self.neighbors(self.c), [("A", 2), ("B", 2)])
+        self.assertEqual(self.neighbors(self.d), [("A", 1), ("B", 1)])
+
+    def test_top_k_and_min_score(self):
+        build_related_products(top_k=1, min_score=2)
+
+        self.assertEqual(self.neighbors(self.a), [("B", 3)])
+        self.assertEqual(self.neighbors(self.c), [("A", 2)])
+        self.assertEqual(self.neighbors(self.d), [])
+
+    def test_days_window(self):
+        Order.objects.filter(items__product=self.c).update(created_at=timezone.now() - timedelta(days=30))
+
+        build_related_products(days=7)
+
+        self.assertEqual(self.neighbors(self.a), [("B", 1), ("D", 1)])
+
+    def test_rebuild_replaces_previous_rows(self):
+        build_related_products()
+        self.order([self.c, self.d])
+        self.order([self.c, self.d])
+        self.order([self.c, self.d])
+
+        build_related_products()
+
+        self.assertEqual(self.neighbors(self.c)[0], ("D", 3))
+
+    def test_endpoint_single_cached_lookup(self):
+        build_related_products()
+        self.assertEqual(self.related(self.a), ["B", "C", "D"])
+        self.assertEqual(self.related(self.a, limit=2), ["B", "C"])
+
+        with self.assertNumQueries(0):
+            self.related(self.a, limit=1)
+
+    def test_endpoint_cache_invalidated(self):
+        build_related_products()
+        self.assertEqual(self.related(self.a), ["B", "C", "D"])
+
+        self.b.name = "B2"
+        self.b.save()
+        self.assertEqual(self.related(self.a), ["B2", "C", "D"])
+
+        # 재계산 후 커밋 시점에 캐시 무효화
+        with self.captureOnCommitCallbacks(execute=True):
+            build_related_products(top_k=1)
+        self.assertEqual(self.related(self.a), ["B2"])
+
+    def test_endpoint_empty_and_missing_product(self):
+        self.assertEqual(self.related(self.a), [])
+
+        response = self.client.get(reverse("products:product-related", args=[999999]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(reverse("products:product-related", args=[self.a.pk]), {"limit": 100})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_command(self):
+        out = io.StringIO()
+
+        call_command("build_related_products", "--top-k", "2", stdout=out)
+
+        self.assertIn("8건", out.getvalue())
+        self.assertEqual(self.neighbors(self.a), [("B", 3), ("C", 2)])
@@ -0,0 +1,147 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.core.cache import get_namespace_version
+
+from .facets import FACETS_NAMESPACE
+from .models import Product, ProductCategory, StockAdjustment
+from .related import RELATED_NAMESPACE
+
+User = get_user_model()
+
+
+class StockAdjustViewTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_superuser(email="admin@example.com", name="관리자", password="adminpass")
+        cls.normal_user = User.objects.create_user(email="user@example.com", name="일반사용자", password="userpass")
+        cls.products = [
+            Product.objects.create(
+                isbn=f"978890000{i:04d}",
+                name=f"재고 책 {i}",
+                price=Decimal("1000"),
+                stock=10,
+                category=ProductCategory.NOVEL,
+            )
+            for i in range(30)
+        ]
+        cls.url = reverse("products_admin:admin_product_stock_adjust")
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.admin_user)
+
+    def adjust(self, adjustments, **data):
+        return self.client.post(self.url, {"adjustments": adjustments, **data}, format="json")
+
+    def stock_of(self, product):
+        return Product.objects.values_list("stock", flat=True).get(pk=product.pk)
+
+    def test_adjusts_by_id_and_isbn(self):
+        first, second = self.products[:2]
+
+        response = self.adjust(
+            [{"product_id": first.pk, "delta": 5}, {"isbn": second.isbn, "delta": -4}], reason="창고 동기화"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["adjusted"], 2)
+        self.assertEqual((self.stock_of(first), self.stock_of(second)), (15, 6))
+
+        log = StockAdjustment.objects.get(product=second)
+        self.assertEqual(
+            (log.delta, log.stock_after, log.reason, log.adjusted_by), (-4, 6, "창고 동기화", self.admin_user)
+        )
+
+    def test_single_update_regardless_of_product_count(self):
+        adjustments = [{"product_id": product.pk, "delta": 1} for product in self.products]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.adjust(adjustments)
+
+        self.assertEqual(response.data["adjusted"], 30)
+        product_updates = [q for q in queries if q["sql"].startswith('UPDATE "products_product"')]
+        self.assertEqual(len(product_updates), 1)
+        self.assertEqual(StockAdjustment.objects.count(), 30)
+        self.assertTrue(all(self.stock_of(product) == 11 for product in self.products))
+
+    def test_invalidates_stock_caches_on_commit(self):
+        versions = [get_namespace_version(ns) for ns in (FACETS_NAMESPACE, RELATED_NAMESPACE)]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.adjust([{"product_id": self.products[0].pk, "delta": 1}])
+
+        self.assertEqual(
+            [get_namespace_version(ns) for ns in (FACETS_NAMESPACE, RELATED_NAMESPACE)],
+            [version + 1 for version in versions],
+        )
+
+    def test_applies_on_top_of_current_stock(self):
+        product = self.products[0]
+        # 다른 요청(주문)이 먼저 재고를 바꿔도 덮어쓰지 않고 증감만 반영
+        Product.objects.filter(pk=product.pk).update(stock=3)
+
+        self.adjust([{"product_id": product.pk, "delta": 2}])
+
+        self.assertEqual(self.stock_of(product), 5)
+
+    def test_same_product_deltas_are_summed(self):
+        product = self.products[0]
+
+        response = self.adjust([{"product_id": product.pk, "delta": 3}, {"isbn": product.isbn, "delta": -1}])
+
+        self.assertEqual(response.data["products"], [{"product_id": product.pk, "delta": 2, "stock": 12}])
+        self.assertEqual(StockAdjustment.objects.get().delta, 2)
+
+    def test_negative_stock_rolls_back_whole_request(self):
+        first, second = self.products[:2]
+
+        response = self.adjust([{"product_id": first.pk, "delta": 1}, {"product_id": second.pk, "delta": -11}])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("delta", response.data["errors"])
+        self.assertEqual((self.stock_of(first), self.stock_of(second)), (10, 10))
+        self.assertFalse(StockAdjustment.objects.exists())
+
+    def test_unknown_product_rolls_back(self):
+        response = self.adjust([{"product_id": self.products[0].pk, "delta": 1}, {"product_id": 999999, "delta": 1}])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("product_id", response.data["errors"])
+        self.assertEqual(self.stock_of(self.products[0]), 10)
+
+    def test_isbn_is_normalized_like_import(self):
+        product = self.products[0]
+
+        response = self.adjust([{"isbn": "978-89-0000-000-0", "delta": 2}])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.stock_of(product), 12)
+
+    def test_unknown_isbn_is_rejected(self):
+        response = self.adjust([{"isbn": "0000000000", "delta": 1}])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("isbn", response.data["errors"])
+
+    def test_item_needs_exactly_one_identifier(self):
+        product = self.products[0]
+
+        response = self.adjust([{"product_id": product.pk, "isbn": product.isbn, "delta": 1}])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_empty_request_is_rejected(self):
+        self.assertEqual(self.adjust([]).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_requires_admin(self):
+        self.client.force_authenticate(user=self.normal_user)
+
+        response = self.adjust([{"product_id": self.products[0].pk, "delta": 1}])
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
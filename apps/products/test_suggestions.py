@@ -0,0 +1,149 @@
+import io
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .hangul import choseong, normalize, split_query
+from .importer import import_products, iter_csv_rows
+from .models import Product, ProductCategory, SuggestionTerm
+
+
+class HangulTest(SimpleTestCase):
+    def test_choseong(self):
+        self.assertEqual(choseong("파이썬"), "ㅍㅇㅆ")
+        self.assertEqual(choseong("django장고"), "djangoㅈㄱ")
+
+    def test_normalize(self):
+        self.assertEqual(normalize(" 해리 포터 "), "해리포터")
+        self.assertEqual(normalize("Django 입문"), "django입문")
+
+    def test_split_query(self):
+        self.assertEqual(split_query("파이썬"), ("파이썬", None))
+        self.assertEqual(split_query("ㅍㅇㅆ"), ("", "ㅍㅇㅆ"))
+        self.assertEqual(split_query("파이ㅆ"), ("파이", "ㅍㅇㅆ"))
+        self.assertEqual(split_query("해리 ㅍ"), ("해리", "ㅎㄹㅍ"))
+
+
+class ProductSuggestTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for name, author in [
+            ("해리 포터와 마법사의 돌", "조앤 롤링"),
+            ("해리 포터와 비밀의 방", "조앤 롤링"),
+            ("파이썬 코딩의 기술", "브렛 슬라킨"),
+            ("파이썬 입문", "작자 미상"),
+        ]:
+            Product.objects.create(
+                name=name, author=author, price=Decimal("10000"), stock=1, category=ProductCategory.NOVEL
+            )
+        cls.url = reverse("products:product-suggest")
+
+    def setUp(self):
+        cache.clear()
+
+    def suggest(self, q, **params):
+        response = self.client.get(self.url, {"q": q, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [(item["text"], item["kind"]) for item in response.data["suggestions"]]
+
+    def test_title_prefix(self):
+        self.assertEqual(
+            self.suggest("해리"),
+            [("해리 포터와 마법사의 돌", "title"), ("해리 포터와 비밀의 방", "title")],
+        )
+
+    def test_matches_word_start_and_ignores_spaces(self):
+        self.assertEqual(self.suggest("비밀의"), [("해리 포터와 비밀의 방", "title")])
+        self.assertEqual(self.suggest("해리포터와비"), [("해리 포터와 비밀의 방", "title")])
+
+    def test_choseong_query(self):
+        self.assertEqual(self.suggest("ㅍㅇㅆ"), [("파이썬 입문", "title"), ("파이썬 코딩의 기술", "title")])
+
+    def test_partially_typed_last_syllable(self):
+        self.assertEqual(self.suggest("파이썬 ㅋ"), [("파이썬 코딩의 기술", "title")])
+
+    def test_author_ranked_by_product_count(self):
+        # 작가(책 2권)가 상품명(각 1권)보다 먼저, 기본 작가명은 후보에서 제외
+        self.assertEqual(self.suggest("ㅈ")[0], ("조앤 롤링", "author"))
+        self.assertEqual(self.suggest("작자"), [])
+        self.assertEqual(SuggestionTerm.objects.get(text="조앤 롤링").weight, 2)
+
+    def test_limit(self):
+        self.assertEqual(len(self.suggest("해리", limit=1)), 1)
+
+        response = self.client.get(self.url, {"q": "해리", "limit": 100})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_query_required(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cached_and_cacheable_response(self):
+        response = self.client.get(self.url, {"q": "파이"})
+        self.assertIn("max-age=", response["Cache-Control"])
+        self.assertIn("public", response["Cache-Control"])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url, {"q": "파이"})
+        self.assertFalse([q for q in queries if "products_suggestion" in q["sql"]])
+
+    def test_rename_replaces_suggestion(self):
+        self.suggest("파이썬")
+        product = Product.objects.get(name="파이썬 입문")
+        product.name = "자바 입문"
+        product.save()
+
+        self.assertEqual(self.suggest("파이썬"), [("파이썬 코딩의 기술", "title")])
+        self.assertEqual(self.suggest("자바"), [("자바 입문", "title")])
+
+    def test_stock_change_does_not_touch_index(self):
+        product = Product.objects.get(name="파이썬 입문")
+        product.stock = 5
+
+        with CaptureQueriesContext(connection) as queries:
+            product.save()
+
+        self.assertFalse([q for q in queries if "products_suggestion" in q["sql"]])
+
+    def test_delete_updates_weight(self):
+        Product.objects.get(name="해리 포터와 비밀의 방").delete()
+
+        self.assertEqual(SuggestionTerm.objects.get(text="조앤 롤링").weight, 1)
+        self.assertEqual(self.suggest("해리"), [("해리 포터와 마법사의 돌", "title")])
+
+    def test_bulk_import_adds_suggestions(self):
+        import_products(
+            iter_csv_rows(
+                io.StringIO("isbn,name,author,price,stock,category\n9788900000011,장고 실전,김장고,1,1,소설\n")
+            )
+        )
+
+        self.assertEqual(self.suggest("ㅈㄱ"), [("장고 실전", "title")])
+        self.assertEqual(self.suggest("김"), [("김장고", "author")])
+
+    def test_bulk_import_rename_removes_previous_suggestion(self):
+        csv_text = "isbn,name,author,price,stock,category\n9788900000011,{name},{author},1,1,소설\n"
+        import_products(iter_csv_rows(io.StringIO(csv_text.format(name="장고 실전", author="김장고"))))
+
+        import_products(iter_csv_rows(io.StringIO(csv_text.format(name="플라스크 실전", author="이플라"))))
+
+        self.assertEqual(self.suggest("장고"), [])
+        self.assertEqual(self.suggest("김장고"), [])
+        self.assertFalse(SuggestionTerm.objects.filter(text__in=["장고 실전", "김장고"]).exists())
+        self.assertEqual(self.suggest("플라스크"), [("플라스크 실전", "title")])
+
+    def test_rebuild_command(self):
+        SuggestionTerm.objects.all().delete()
+
+        call_command("rebuild_product_suggestions", stdout=io.StringIO())
+
+        self.assertEqual(SuggestionTerm.objects.count(), 6)
+        self.assertEqual(len(self.suggest("해리")), 2)
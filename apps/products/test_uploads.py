@@ -0,0 +1,165 @@
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from .models import Product, ProductCategory
+from .test_images import TempMediaMixin, make_image_file
+from .uploads import issue_upload
+
+User = get_user_model()
+
+
+class ProductImageDirectUploadTest(TempMediaMixin, APITestCase):
+    """업로드 URL 발급 → 로컬 업로드 → image_key로 상품 연결"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_superuser(email="admin@example.com", name="관리자", password="adminpass")
+        cls.issue_url = reverse("products_admin:admin_product_image_upload")
+        cls.create_url = reverse("products_admin:admin_product_create")
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(user=self.admin_user)
+        # 직접 업로드는 인증 없이 서명된 policy만으로 동작해야 함
+        self.uploader = APIClient()
+
+    def issue(self, content_type="image/png"):
+        response = self.client.post(self.issue_url, {"content_type": content_type}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data
+
+    def upload(self, upload, file=None):
+        return self.uploader.post(upload["url"], {**upload["fields"], "file": file or make_image_file()})
+
+    def product_data(self, **kwargs):
+        return {"name": "직접 업로드 책", "price": "12000.00", "stock": 3, "category": ProductCategory.NOVEL, **kwargs}
+
+    def test_upload_and_create_product_with_key(self):
+        upload = self.issue()
+        self.assertRegex(upload["key"], r"^products/\d{14}_[0-9a-f]{12}\.png$")
+        self.assertTrue(upload["url"].endswith(reverse("products_admin:admin_product_image_local_upload")))
+
+        self.assertEqual(self.upload(upload).status_code, status.HTTP_204_NO_CONTENT)
+        response = self.client.post(self.create_url, self.product_data(image_key=upload["key"]), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        product = Product.objects.get(name="직접 업로드 책")
+        self.assertEqual(product.image.name, upload["key"])
+        # 연결 시 다시 업로드하지 않으므로 저장소에는 파일 하나만 존재
+        self.assertEqual(self.stored_files(), [upload["key"].removeprefix("products/")])
+
+    def test_update_product_with_key_replaces_old_image(self):
+        first, second = self.issue(), self.issue()
+        self.upload(first)
+        self.upload(second)
+        product = Product.objects.create(image=first["key"], **self.product_data())
+        url = reverse("products_admin:admin_product_detail_update_delete", args=[product.pk])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(url, self.product_data(image_key=second["key"]), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        product.refresh_from_db()
+        self.assertEqual(product.image.name, second["key"])
+        self.assertFalse(default_storage.exists(first["key"]))
+
+    def test_key_not_uploaded_yet_is_rejected(self):
+        upload = self.issue()
+
+        response = self.client.post(self.create_url, self.product_data(image_key=upload["key"]), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("image_key", response.data["errors"])
+
+    def test_key_outside_upload_prefix_is_rejected(self):
+        default_storage.save("products/product_default.jpg", make_image_file())
+
+        response = self.client.post(
+            self.create_url, self.product_data(image_key="products/product_default.jpg"), format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_key_used_by_other_product_is_rejected(self):
+        upload = self.issue()
+        self.upload(upload)
+        Product.objects.create(image=upload["key"], **self.product_data(name="기존 상품"))
+
+        response = self.client.post(self.create_url, self.product_data(image_key=upload["key"]), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unsupported_content_type_is_rejected(self):
+        response = self.client.post(self.issue_url, {"content_type": "application/pdf"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_issue_requires_admin(self):
+        response = self.uploader.post(self.issue_url, {"content_type": "image/png"}, format="json")
+
+        self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+
+    def test_local_upload_rejects_tampered_key(self):
+        upload = self.issue()
+        upload["fields"]["key"] = "products/20250101000000_000000000000.png"
+
+        self.assertEqual(self.upload(upload).status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(default_storage.exists("products/20250101000000_000000000000.png"))
+
+    def test_local_upload_rejects_expired_policy(self):
+        upload = self.issue()
+
+        with patch("django.core.signing.time.time", return_value=4_000_000_000):
+            response = self.upload(upload)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_local_upload_rejects_other_content_type(self):
+        upload = self.issue("image/jpeg")
+
+        self.assertEqual(self.upload(upload).status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(PRODUCT_IMAGE_MAX_UPLOAD_SIZE=100)
+    def test_local_upload_rejects_large_file(self):
+        upload = self.issue()
+
+        self.assertEqual(self.upload(upload).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_local_upload_cannot_overwrite(self):
+        upload = self.issue()
+        self.upload(upload)
+
+        self.assertEqual(self.upload(upload).status_code, status.HTTP_409_CONFLICT)
+
+    @override_settings(PRODUCT_UPLOAD_BACKEND="s3")
+    def test_local_upload_disabled_with_s3(self):
+        response = self.uploader.post(reverse("products_admin:admin_product_image_local_upload"), {})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(PRODUCT_UPLOAD_BACKEND="s3", PRODUCT_IMAGE_MAX_UPLOAD_SIZE=1000, PRODUCT_UPLOAD_URL_EXPIRES=60)
+class S3PresignedUploadTest(APITestCase):
+    def test_presigned_post_limits_size_and_content_type(self):
+        storage = MagicMock(bucket_name="bucket")
+        storage.connection.meta.client.generate_presigned_post.return_value = {
+            "url": "https://bucket.s3.amazonaws.com/",
+            "fields": {"key": "k", "policy": "p"},
+        }
+
+        with patch("apps.products.uploads.default_storage", storage):
+            upload = issue_upload(None, "image/webp")
+
+        args, kwargs = storage.connection.meta.client.generate_presigned_post.call_args
+        self.assertEqual(args, ("bucket", upload["key"]))
+        self.assertTrue(upload["key"].endswith(".webp"))
+        self.assertIn(["content-length-range", 1, 1000], kwargs["Conditions"])
+        self.assertIn({"Content-Type": "image/webp"}, kwargs["Conditions"])
+        self.assertEqual(kwargs["ExpiresIn"], 60)
+        self.assertEqual(upload["url"], "https://bucket.s3.amazonaws.com/")
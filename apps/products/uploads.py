@@ -0,0 +1,77 @@
+"""
+상품 이미지 직접 업로드 (presigned upload)
+
+1. 관리자가 업로드 URL 발급 요청 → 저장 키 + 업로드 URL/폼 필드 반환
+2. 클라이언트가 파일을 저장소에 직접 업로드 (앱 워커를 거치지 않음)
+3. 상품 생성/수정 시 image_key로 저장 키를 전달하면 서버가 업로드 여부만 확인하고 연결
+
+- s3   : S3 presigned POST (크기/Content-Type 조건은 S3가 검사)
+- local: 개발용 대체 - 서명된 policy를 검사하는 로컬 업로드 엔드포인트로 같은 흐름 재현
+"""
+
+import re
+
+from django.conf import settings
+from django.core import signing
+from django.core.files.storage import default_storage
+from django.urls import reverse
+
+from .models import product_image_upload_to
+
+UPLOAD_POLICY_SALT = "products.image-upload"
+
+# 허용 Content-Type → 저장 확장자
+UPLOAD_CONTENT_TYPES = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
+
+# product_image_upload_to가 만드는 키 형식
+UPLOAD_KEY_PATTERN = re.compile(r"^products/\d{14}_[0-9a-f]{12}\.(jpg|png|webp|gif)$")
+
+
+def issue_upload(request, content_type):
+    """
+    새 저장 키를 만들고 클라이언트가 직접 업로드할 URL/폼 필드를 반환
+    - 반환: {"key", "url", "fields", "expires_in"} → 클라이언트는 fields + file(마지막)을 multipart로 url에 POST
+    """
+    key = product_image_upload_to(None, f"upload{UPLOAD_CONTENT_TYPES[content_type]}")
+    expires_in = settings.PRODUCT_UPLOAD_URL_EXPIRES
+    max_size = settings.PRODUCT_IMAGE_MAX_UPLOAD_SIZE
+
+    if settings.PRODUCT_UPLOAD_BACKEND == "s3":
+        presigned = default_storage.connection.meta.client.generate_presigned_post(
+            default_storage.bucket_name,
+            key,
+            Fields={"Content-Type": content_type},
+            Conditions=[{"Content-Type": content_type}, ["content-length-range", 1, max_size]],
+            ExpiresIn=expires_in,
+        )
+        url, fields = presigned["url"], presigned["fields"]
+    else:
+        policy = signing.dumps({"key": key, "content_type": content_type}, salt=UPLOAD_POLICY_SALT)
+        url = request.build_absolute_uri(reverse("products_admin:admin_product_image_local_upload"))
+        fields = {"key": key, "policy": policy}
+
+    return {"key": key, "url": url, "fields": fields, "expires_in": expires_in}
+
+
+def load_local_upload_policy(policy):
+    """로컬 업로드 policy 검증 - 위조/만료면 signing.BadSignature 발생"""
+    return signing.loads(policy, salt=UPLOAD_POLICY_SALT, max_age=settings.PRODUCT_UPLOAD_URL_EXPIRES)
+
+
+def check_uploaded_key(key):
+    """
+    image_key로 받은 저장 키 확인 - 문제가 있으면 오류 메시지, 정상이면 None
+    - 파일 내용은 다시 내려받지 않고 존재 여부/크기만 확인
+    """
+    if not UPLOAD_KEY_PATTERN.match(key):
+        return "발급받은 업로드 키가 아닙니다."
+    if not default_storage.exists(key):
+        return "업로드가 완료되지 않았습니다."
+    if default_storage.size(key) > settings.PRODUCT_IMAGE_MAX_UPLOAD_SIZE:
+        return "이미지 파일이 너무 큽니다."
+    return None
@@ -1,15 +1,24 @@
+from django.conf import settings
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_cache_control
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework import viewsets
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
 
 from apps.core.pagination import CustomPagination
 
+from .facets import get_facets
 from .filters import ProductFilter
 from .models import Product
-from .serializers import ProductSerializer
+from .related import get_related_products
+from .serializers import ProductRelatedQuerySerializer, ProductSerializer, ProductSuggestQuerySerializer
+from .suggestions import suggest
 
 
 class ProductViewSet(viewsets.ReadOnlyModelViewSet):
@@ -44,7 +53,14 @@ class ProductViewSet(viewsets.ReadOnlyModelViewSet):
                 "author", openapi.IN_QUERY, description="저자명", type=openapi.TYPE_STRING, required=False
             ),
             openapi.Parameter(
-                "category", openapi.IN_QUERY, description="카테고리", type=openapi.TYPE_STRING, required=False
+                "category",
+                openapi.IN_QUERY,
+                description="카테고리 (정확히 일치, 쉼표로 여러 개 지정 예: 소설,요리)",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
+            openapi.Parameter(
+                "in_stock", openapi.IN_QUERY, description="재고 있는 상품만", type=openapi.TYPE_BOOLEAN, required=False
             ),
             openapi.Parameter(
                 "min_price", openapi.IN_QUERY, description="최소 가격", type=openapi.TYPE_NUMBER, required=False
@@ -59,7 +75,58 @@ class ProductViewSet(viewsets.ReadOnlyModelViewSet):
                 type=openapi.TYPE_STRING,
                 required=False,
             ),
+            openapi.Parameter(
+                "facets",
+                openapi.IN_QUERY,
+                description="1이면 현재 필터 기준 카테고리별 개수/가격대 히스토그램(facets)을 함께 반환",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
         ]
     )
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        response = super().list(request, *args, **kwargs)
+
+        # 카테고리마다 따로 요청하지 않도록 패싯을 목록 응답에 포함 (GROUP BY 1회, 필터별 캐시)
+        if request.query_params.get("facets") in ("1", "true"):
+            queryset = self.filter_queryset(self.get_queryset())
+            filter_params = {name: request.query_params.get(name, "") for name in self.filterset_class.base_filters}
+            response.data["facets"] = get_facets(queryset, filter_params)
+        return response
+
+    @swagger_auto_schema(query_serializer=ProductSuggestQuerySerializer)
+    @action(detail=False, methods=["get"], pagination_class=None, filter_backends=[])
+    def suggest(self, request):
+        """검색창 자동완성 - 상품명/작가명 접두어(초성 포함) 매칭 상위 limit개"""
+        serializer = ProductSuggestQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response({"errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+
+        response = Response({"query": data["q"], "suggestions": suggest(data["q"], data["limit"])})
+        # 키 입력마다 호출되므로 브라우저/CDN에서도 잠시 캐시
+        patch_cache_control(response, public=True, max_age=settings.PRODUCT_SUGGEST_CACHE_TTL)
+        return response
+
+    @swagger_auto_schema(query_serializer=ProductRelatedQuerySerializer, responses={200: ProductSerializer(many=True)})
+    @action(detail=True, methods=["get"], pagination_class=None, filter_backends=[])
+    def related(self, request, pk=None):
+        """함께 구매한 상품 - 미리 계산한 추천 테이블에서 rank 순 상위 limit개 (build_related_products 명령으로 갱신)"""
+        serializer = ProductRelatedQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response({"errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            product_id = int(pk)
+        except ValueError:
+            raise Http404 from None
+
+        products = get_related_products(product_id)
+        # 추천이 없을 때만 상품 존재 여부 확인 (추천이 있으면 상품 조회 생략)
+        if not products:
+            get_object_or_404(Product, pk=product_id)
+
+        data = ProductSerializer(
+            products[: serializer.validated_data["limit"]], many=True, context={"request": request}
+        )
+        return Response(data.data)
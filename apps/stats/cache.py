@@ -0,0 +1,88 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from apps.core.cache import get_or_compute, make_key
+
+from . import services
+from .serializers import DashboardSerializer
+
+DASHBOARD_NAMESPACE = "stats:dashboard"
+
+# 백그라운드 갱신 중인 키 (같은 프로세스에서 중복 갱신 방지)
+_locks_guard = threading.Lock()
+_refreshing = set()
+
+
+def get_dashboard_cache_key(base_date, days, granularity):
+    return make_key(DASHBOARD_NAMESPACE, settings.STATS_TIME_ZONE, base_date.isoformat(), days, granularity)
+
+
+def _compute_snapshot(base_date, days, granularity):
+    data = DashboardSerializer(services.get_dashboard_data(base_date, days, granularity)).data
+    return {"data": data, "computed_at": time.time()}
+
+
+def _compute_and_store(key, base_date, days, granularity):
+    snapshot = _compute_snapshot(base_date, days, granularity)
+    cache.set(key, snapshot, timeout=settings.STATS_DASHBOARD_CACHE_TTL)
+    return snapshot
+
+
+def _refresh_in_background(key, base_date, days, granularity):
+    try:
+        _compute_and_store(key, base_date, days, granularity)
+    finally:
+        with _locks_guard:
+            _refreshing.discard(key)
+        cache.delete(f"{key}:refresh-lock")
+        if not getattr(settings, "TESTING", False):
+            # 백그라운드 스레드가 연 DB 커넥션 정리
+            connections.close_all()
+
+
+def _schedule_refresh(key, base_date, days, granularity):
+    """스냅샷이 오래됐으면 백그라운드에서 한 번만 갱신 (프로세스 간 중복은 cache.add 락으로 방지)"""
+    with _locks_guard:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    if not cache.add(f"{key}:refresh-lock", 1, timeout=settings.STATS_DASHBOARD_REFRESH_INTERVAL or 1):
+        with _locks_guard:
+            _refreshing.discard(key)
+        return
+
+    if getattr(settings, "TESTING", False):
+        # 순차 실행 (테스트 환경)
+        _refresh_in_background(key, base_date, days, granularity)
+        return
+
+    threading.Thread(target=_refresh_in_background, args=(key, base_date, days, granularity), daemon=True).start()
+
+
+def get_dashboard_snapshot(base_date, days=30, granularity="day", fresh=False):
+    """
+    대시보드 스냅샷 조회 (직렬화된 응답 데이터)
+    - 캐시 적중: 즉시 반환, REFRESH_INTERVAL보다 오래됐으면 백그라운드 갱신 예약
+    - 캐시 없음: 동기 계산 (같은 키 동시 요청은 워커 전체에서 하나만 계산)
+    - fresh=True: 캐시를 무시하고 다시 계산해서 저장
+    """
+    key = get_dashboard_cache_key(base_date, days, granularity)
+
+    if fresh:
+        return _compute_and_store(key, base_date, days, granularity)["data"]
+
+    snapshot = cache.get(key)
+    if snapshot is not None:
+        if time.time() - snapshot["computed_at"] >= settings.STATS_DASHBOARD_REFRESH_INTERVAL:
+            _schedule_refresh(key, base_date, days, granularity)
+        return snapshot["data"]
+
+    snapshot = get_or_compute(
+        key, lambda: _compute_snapshot(base_date, days, granularity), timeout=settings.STATS_DASHBOARD_CACHE_TTL
+    )
+    return snapshot["data"]
@@ -0,0 +1,21 @@
+from django.db import models
+
+
+class DailySales(models.Model):
+    """
+    마감된 영업일의 판매 집계
+    - 지난 날짜는 한 번 계산해서 저장하고, 추세 조회 시 오늘 버킷만 다시 집계
+    - 영업일 경계는 time_zone 기준 (STATS_TIME_ZONE 변경 시 별도 행으로 관리)
+    """
+
+    time_zone = models.CharField(max_length=64)
+    date = models.DateField()
+    quantity = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["time_zone", "date"], name="unique_daily_sales_date")]
+
+    def __str__(self):
+        return f"{self.date} ({self.time_zone}) - {self.quantity}개 / {self.revenue}원"
@@ -12,6 +12,14 @@ class TrendSerializer(serializers.Serializer):
     revenue = serializers.DecimalField(max_digits=12, decimal_places=2)
 
 
+class TrendQuerySerializer(serializers.Serializer):
+    """대시보드 추세 조회 쿼리 파라미터"""
+
+    days = serializers.IntegerField(min_value=1, max_value=365, default=30)
+    granularity = serializers.ChoiceField(choices=["day", "week", "month"], default="day")
+    fresh = serializers.BooleanField(default=False)
+
+
 class DashboardSerializer(serializers.Serializer):
     total_users = serializers.IntegerField()
     total_revenue = serializers.DecimalField(max_digits=15, decimal_places=2)
@@ -1,15 +1,20 @@
 # apps/stats/services.py
 from concurrent.futures import ThreadPoolExecutor
-from datetime import timedelta
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import connections
 from django.db.models import Sum
 from django.db.models.functions import TruncDate
+from django.utils import timezone
 
 from apps.orders.models import Order, OrderItem
 from apps.products.models import Product
 
+from .models import DailySales
+
 User = get_user_model()
 
 
@@ -25,23 +30,42 @@ def get_total_stock():
     return Product.objects.aggregate(total=Sum("stock"))["total"] or 0
 
 
-def get_today_orders(base_date):
-    return Order.objects.filter(created_at__date=base_date).count()
+def get_reporting_timezone():
+    """통계 집계 기준 타임존 (settings.STATS_TIME_ZONE)"""
+    return ZoneInfo(settings.STATS_TIME_ZONE)
 
 
-def get_daily_sales(base_date):
-    qs = OrderItem.objects.filter(order__created_at__date=base_date)
-    result = qs.aggregate(quantity=Sum("quantity"), revenue=Sum("total_price"))
-    return {
-        "quantity": result["quantity"] or 0,
-        "revenue": result["revenue"] or 0,
-    }
+def get_reporting_date():
+    """리포팅 타임존 기준 오늘 날짜"""
+    return timezone.localdate(timezone=get_reporting_timezone())
 
 
-def get_weekly_sales(base_date):
+def _day_start(day):
+    """해당 날짜의 00:00 (리포팅 타임존 기준 aware datetime)"""
+    return timezone.make_aware(datetime.combine(day, time.min), get_reporting_timezone())
+
+
+def get_day_range(base_date):
+    """하루 구간 [당일 00:00, 다음날 00:00)"""
+    return _day_start(base_date), _day_start(base_date + timedelta(days=1))
+
+
+def get_week_range(base_date):
+    """주간 구간 [월요일 00:00, 다음주 월요일 00:00)"""
     week_start = base_date - timedelta(days=base_date.weekday())
-    week_end = week_start + timedelta(days=6)
-    qs = OrderItem.objects.filter(order__created_at__date__range=[week_start, week_end])
+    return _day_start(week_start), _day_start(week_start + timedelta(days=7))
+
+
+def get_month_range(base_date):
+    """월간 구간 [1일 00:00, 다음달 1일 00:00)"""
+    month_start = base_date.replace(day=1)
+    next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+    return _day_start(month_start), _day_start(next_month_start)
+
+
+def _get_sales_summary(start, end):
+    # created_at__date 같은 함수 호출 대신 반열린 구간으로 필터 → created_at 인덱스 범위 스캔
+    qs = OrderItem.objects.filter(order__created_at__gte=start, order__created_at__lt=end)
     result = qs.aggregate(quantity=Sum("quantity"), revenue=Sum("total_price"))
     return {
         "quantity": result["quantity"] or 0,
@@ -49,48 +73,110 @@ def get_weekly_sales(base_date):
     }
 
 
+def get_today_orders(base_date):
+    start, end = get_day_range(base_date)
+    return Order.objects.filter(created_at__gte=start, created_at__lt=end).count()
+
+
+def get_daily_sales(base_date):
+    return _get_sales_summary(*get_day_range(base_date))
+
+
+def get_weekly_sales(base_date):
+    return _get_sales_summary(*get_week_range(base_date))
+
+
 def get_monthly_sales(base_date):
-    qs = OrderItem.objects.filter(
-        order__created_at__year=base_date.year,
-        order__created_at__month=base_date.month,
-    )
-    result = qs.aggregate(quantity=Sum("quantity"), revenue=Sum("total_price"))
-    return {
-        "quantity": result["quantity"] or 0,
-        "revenue": result["revenue"] or 0,
-    }
+    return _get_sales_summary(*get_month_range(base_date))
 
 
-def get_trend(base_date, days=30):
-    """
-    최근 N일간 추세 (단일 쿼리 + 빠진 날짜는 0으로 채우기)
-    """
-    trend_qs = (
-        OrderItem.objects.filter(order__created_at__date__gte=base_date - timedelta(days=days - 1))
-        .annotate(date=TruncDate("order__created_at"))
+def _aggregate_daily_sales(start_date, end_date):
+    """[start_date, end_date] 일별 판매 집계 (단일 GROUP BY 쿼리)"""
+    start, _ = get_day_range(start_date)
+    _, end = get_day_range(end_date)
+    qs = (
+        OrderItem.objects.filter(order__created_at__gte=start, order__created_at__lt=end)
+        .annotate(date=TruncDate("order__created_at", tzinfo=get_reporting_timezone()))
         .values("date")
         .annotate(quantity=Sum("quantity"), revenue=Sum("total_price"))
         .order_by("date")
     )
+    return {row["date"]: {"quantity": row["quantity"] or 0, "revenue": row["revenue"] or 0} for row in qs}
+
+
+def _get_closed_daily_sales(start_date, end_date):
+    """
+    마감된 날짜들의 일별 집계
+    저장된 DailySales를 사용하고, 없는 날짜만 한 번 집계해서 저장
+    """
+    time_zone = settings.STATS_TIME_ZONE
+    stored = {
+        row.date: {"quantity": row.quantity, "revenue": row.revenue}
+        for row in DailySales.objects.filter(time_zone=time_zone, date__range=(start_date, end_date))
+    }
+
+    total_days = (end_date - start_date).days + 1
+    missing = [start_date + timedelta(days=i) for i in range(total_days)]
+    missing = [d for d in missing if d not in stored]
+    if missing:
+        computed = _aggregate_daily_sales(missing[0], missing[-1])
+        empty = {"quantity": 0, "revenue": 0}
+        new_rows = [DailySales(time_zone=time_zone, date=d, **computed.get(d, empty)) for d in missing]
+        DailySales.objects.bulk_create(new_rows, ignore_conflicts=True)
+        stored.update({d: computed.get(d, empty) for d in missing})
+
+    return stored
+
+
+def _bucket_start(day, granularity):
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
 
-    trend_map = {t["date"]: t for t in trend_qs}
 
-    result = []
+def get_trend(base_date, days=30, granularity="day"):
+    """
+    최근 N일간 추세 (빠진 날짜는 0으로 채우기)
+    - 마감된 날짜는 DailySales 저장값을 재사용하고, 오늘(미마감) 버킷만 매번 집계
+    - granularity: day / week / month (버킷 시작일이 조회 구간보다 앞서면 구간 시작일로 표시)
+    """
+    start_date = base_date - timedelta(days=days - 1)
+    today = get_reporting_date()
+
+    daily = {}
+    closed_end = min(base_date, today - timedelta(days=1))
+    if start_date <= closed_end:
+        daily.update(_get_closed_daily_sales(start_date, closed_end))
+    open_start = max(start_date, today)
+    if open_start <= base_date:
+        daily.update(_aggregate_daily_sales(open_start, base_date))
+
+    buckets = {}
     for i in range(days):
-        d = base_date - timedelta(days=days - 1 - i)  # 과거 → 오늘 순서
-        record = trend_map.get(d, {"quantity": 0, "revenue": 0})
-        result.append(
-            {
-                "date": d,
-                "quantity": record["quantity"] or 0,
-                "revenue": record["revenue"] or 0,
-            }
-        )
+        d = start_date + timedelta(days=i)  # 과거 → 오늘 순서
+        key = max(_bucket_start(d, granularity), start_date)
+        record = daily.get(d, {"quantity": 0, "revenue": 0})
+        bucket = buckets.setdefault(key, {"date": key, "quantity": 0, "revenue": 0})
+        bucket["quantity"] += record["quantity"]
+        bucket["revenue"] += record["revenue"]
+
+    return list(buckets.values())
 
-    return result
+
+def _run_in_thread(func, *args):
+    """
+    워커 스레드에서 집계 실행 후 스레드의 DB 커넥션 반납
+    - Django 커넥션은 스레드별이라 닫지 않으면 풀 커넥션을 계속 점유하거나 (풀 미사용 시) 연결이 누수됨
+    """
+    try:
+        return func(*args)
+    finally:
+        connections.close_all()
 
 
-def get_dashboard_data(base_date):
+def get_dashboard_data(base_date, days=30, granularity="day"):
     """
     대시보드 전체 통계 (ThreadPoolExecutor로 병렬 처리)
     """
@@ -105,18 +191,18 @@ def get_dashboard_data(base_date):
             "daily_sales": get_daily_sales(base_date),
             "weekly_sales": get_weekly_sales(base_date),
             "monthly_sales": get_monthly_sales(base_date),
-            "trend": get_trend(base_date),
+            "trend": get_trend(base_date, days, granularity),
         }
 
-    with ThreadPoolExecutor() as executor:
+    with ThreadPoolExecutor(max_workers=settings.STATS_DASHBOARD_MAX_WORKERS) as executor:
         futures = {
-            "total_users": executor.submit(get_total_users),
-            "total_revenue": executor.submit(get_total_revenue),
-            "total_stock": executor.submit(get_total_stock),
-            "today_orders": executor.submit(get_today_orders, base_date),
-            "daily_sales": executor.submit(get_daily_sales, base_date),
-            "weekly_sales": executor.submit(get_weekly_sales, base_date),
-            "monthly_sales": executor.submit(get_monthly_sales, base_date),
-            "trend": executor.submit(get_trend, base_date),
+            "total_users": executor.submit(_run_in_thread, get_total_users),
+            "total_revenue": executor.submit(_run_in_thread, get_total_revenue),
+            "total_stock": executor.submit(_run_in_thread, get_total_stock),
+            "today_orders": executor.submit(_run_in_thread, get_today_orders, base_date),
+            "daily_sales": executor.submit(_run_in_thread, get_daily_sales, base_date),
+            "weekly_sales": executor.submit(_run_in_thread, get_weekly_sales, base_date),
+            "monthly_sales": executor.submit(_run_in_thread, get_monthly_sales, base_date),
+            "trend": executor.submit(_run_in_thread, get_trend, base_date, days, granularity),
         }
         return {key: f.result() for key, f in futures.items()}
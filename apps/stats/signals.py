@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.core.cache import bump_namespace
+from apps.orders.models import Order, OrderItem
+
+from .cache import DASHBOARD_NAMESPACE
+from .models import DailySales
+from .services import get_reporting_date, get_reporting_timezone
+
+
+def invalidate_order_date(created_at):
+    """지난 날짜 주문이 바뀌면 저장된 그날 일별 집계와 대시보드 스냅샷을 무효화 (다음 조회 때 재계산)"""
+    if not created_at:
+        return
+
+    order_date = timezone.localdate(created_at, get_reporting_timezone())
+    if order_date < get_reporting_date():
+        DailySales.objects.filter(time_zone=settings.STATS_TIME_ZONE, date=order_date).delete()
+        bump_namespace(DASHBOARD_NAMESPACE)
+
+
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+def invalidate_daily_sales(sender, instance, **kwargs):
+    invalidate_order_date(instance.created_at)
+
+
+# 주문 아이템 수정/삭제(상품 삭제 시 CASCADE 포함)도 주문 날짜 매출을 바꿈
+# - 메모리의 주문 객체는 오래된 값일 수 있으므로 주문 날짜는 DB에서 조회 (주문째 삭제 중이면 위 시그널이 처리)
+@receiver(post_save, sender=OrderItem)
+@receiver(post_delete, sender=OrderItem)
+def invalidate_daily_sales_for_item(sender, instance, **kwargs):
+    created_at = Order.objects.filter(pk=instance.order_id).values_list("created_at", flat=True).first()
+    invalidate_order_date(created_at)
@@ -1,12 +1,16 @@
-from datetime import datetime
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
 
 from apps.orders.models import Order, OrderItem
 from apps.products.models import Product
+from apps.stats import services
+from apps.stats.models import DailySales
 
 User = get_user_model()
 
@@ -53,6 +57,7 @@ class BaseStatsTestCase(TestCase):
 
     def setUp(self):
         """각 테스트 실행 전에 client를 superuser로 인증"""
+        cache.clear()  # 대시보드 스냅샷 캐시 초기화
         self.client = APIClient()
         self.client.force_authenticate(user=self.admin)
 
@@ -72,6 +77,177 @@ class DashboardAPITest(BaseStatsTestCase):
         self.assertEqual(data["daily_sales"]["revenue"], "40000.00")
 
 
+class DashboardCacheTest(BaseStatsTestCase):
+    def add_item(self):
+        OrderItem.objects.create(order=self.order, product=self.p1, quantity=1, unit_price=self.p1.price)
+
+    def test_cached_snapshot_skips_database(self):
+        url = reverse("admin-dashboard")
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.json()["daily_sales"]["quantity"], 3)
+
+    def test_fresh_param_bypasses_cache(self):
+        url = reverse("admin-dashboard")
+        self.client.get(url)
+        self.add_item()
+
+        self.assertEqual(self.client.get(url).json()["daily_sales"]["quantity"], 3)
+        self.assertEqual(self.client.get(url, {"fresh": 1}).json()["daily_sales"]["quantity"], 4)
+        # fresh 결과로 캐시도 갱신됨
+        self.assertEqual(self.client.get(url).json()["daily_sales"]["quantity"], 4)
+
+    @override_settings(STATS_DASHBOARD_REFRESH_INTERVAL=0)
+    def test_stale_snapshot_is_refreshed(self):
+        url = reverse("admin-dashboard")
+        self.client.get(url)
+        self.add_item()
+
+        # 오래된 스냅샷을 먼저 돌려주고 갱신은 뒤에서 처리
+        self.assertEqual(self.client.get(url).json()["daily_sales"]["quantity"], 3)
+        self.assertEqual(self.client.get(url).json()["daily_sales"]["quantity"], 4)
+
+
+class DashboardThreadConnectionTest(BaseStatsTestCase):
+    def test_worker_thread_returns_connection(self):
+        with patch("apps.stats.services.connections.close_all") as close_all:
+            self.assertEqual(services._run_in_thread(services.get_total_users), User.objects.count())
+        close_all.assert_called_once()
+
+    def test_worker_thread_returns_connection_on_error(self):
+        def fail():
+            raise RuntimeError("집계 실패")
+
+        with patch("apps.stats.services.connections.close_all") as close_all, self.assertRaises(RuntimeError):
+            services._run_in_thread(fail)
+        close_all.assert_called_once()
+
+
+class PeriodRangeTest(BaseStatsTestCase):
+    def test_month_range_rolls_over_year(self):
+        start, end = services.get_month_range(date(2025, 12, 15))
+        self.assertEqual(start.date(), date(2025, 12, 1))
+        self.assertEqual(end.date(), date(2026, 1, 1))
+
+    def test_week_range_starts_on_monday(self):
+        start, end = services.get_week_range(date(2025, 10, 2))  # 목요일
+        self.assertEqual(start.date(), date(2025, 9, 29))
+        self.assertEqual(end - start, timedelta(days=7))
+
+    def test_day_range_is_half_open(self):
+        base_date = date(2025, 10, 1)
+        start, end = services.get_day_range(base_date)
+        Order.objects.filter(pk=self.order.pk).update(created_at=end)
+
+        self.assertEqual(services.get_today_orders(base_date), 0)
+        self.assertEqual(services.get_today_orders(base_date + timedelta(days=1)), 1)
+
+        Order.objects.filter(pk=self.order.pk).update(created_at=start)
+        self.assertEqual(services.get_daily_sales(base_date)["quantity"], 3)
+
+
+@override_settings(STATS_TIME_ZONE="Asia/Seoul")
+class ReportingTimeZoneTest(BaseStatsTestCase):
+    def setUp(self):
+        super().setUp()
+        # UTC 1/1 16:00 = KST 1/2 01:00 → 한국 영업일 기준 1월 2일 주문
+        Order.objects.filter(pk=self.order.pk).update(created_at=datetime(2025, 1, 1, 16, 0, tzinfo=UTC))
+
+    def test_day_range_uses_reporting_timezone(self):
+        self.assertEqual(services.get_today_orders(date(2025, 1, 1)), 0)
+        self.assertEqual(services.get_today_orders(date(2025, 1, 2)), 1)
+
+    def test_trend_buckets_by_reporting_date(self):
+        trend = services.get_trend(date(2025, 1, 2), days=2)
+
+        self.assertEqual([t["date"] for t in trend], [date(2025, 1, 1), date(2025, 1, 2)])
+        self.assertEqual(trend[0]["quantity"], 0)
+        self.assertEqual(trend[1]["quantity"], 3)
+
+
+class IncrementalTrendTest(BaseStatsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.today = services.get_reporting_date()
+        self.past_date = self.today - timedelta(days=3)
+        start, _ = services.get_day_range(self.past_date)
+        Order.objects.filter(pk=self.order.pk).update(created_at=start + timedelta(hours=1))
+
+    def test_closed_days_are_stored_once(self):
+        trend = services.get_trend(self.today, days=7)
+
+        self.assertEqual(len(trend), 7)
+        self.assertEqual(DailySales.objects.count(), 6)  # 오늘 제외 마감된 6일
+        self.assertEqual(DailySales.objects.get(date=self.past_date).quantity, 3)
+
+        # 두 번째 조회: 저장된 집계 1회 + 오늘 버킷 1회
+        with self.assertNumQueries(2):
+            again = services.get_trend(self.today, days=7)
+        self.assertEqual(again, trend)
+
+    def test_week_granularity_sums_daily_buckets(self):
+        trend = services.get_trend(self.today, days=28, granularity="week")
+
+        self.assertEqual(sum(t["quantity"] for t in trend), 3)
+        self.assertLessEqual(len(trend), 5)
+        self.assertEqual(trend[0]["date"], self.today - timedelta(days=27))
+
+    def test_past_order_change_invalidates_stored_day(self):
+        services.get_trend(self.today, days=7)
+        self.order.refresh_from_db()
+        self.order.save()
+
+        self.assertFalse(DailySales.objects.filter(date=self.past_date).exists())
+
+    def test_past_order_change_invalidates_dashboard_snapshot(self):
+        url = reverse("admin-dashboard")
+        trend_quantity = lambda: sum(t["quantity"] for t in self.client.get(url).json()["trend"])  # noqa: E731
+        self.assertEqual(trend_quantity(), 3)
+
+        Order.objects.filter(pk=self.order.pk).update(recipient_name="김철수")
+        self.assertEqual(trend_quantity(), 3)  # 스냅샷 캐시
+
+        OrderItem.objects.create(order=self.order, product=self.p1, quantity=1, unit_price=self.p1.price)
+        self.assertEqual(trend_quantity(), 4)  # 지난 날짜 주문에 아이템 추가 → 대시보드 네임스페이스 무효화
+
+        self.order.refresh_from_db()
+        self.order.save()  # 지난 날짜 주문 변경 → 대시보드 네임스페이스 무효화
+        self.assertEqual(trend_quantity(), 4)
+
+    def test_past_order_item_delete_invalidates_stored_day(self):
+        services.get_trend(self.today, days=7)
+
+        OrderItem.objects.filter(order=self.order, product=self.p2).delete()
+
+        self.assertFalse(DailySales.objects.filter(date=self.past_date).exists())
+        self.assertEqual(services.get_trend(self.today, days=7)[-4]["quantity"], 2)
+
+    def test_product_delete_invalidates_stored_day(self):
+        services.get_trend(self.today, days=7)
+
+        self.p1.delete()  # OrderItem CASCADE 삭제
+
+        self.assertFalse(DailySales.objects.filter(date=self.past_date).exists())
+        self.assertEqual(services.get_trend(self.today, days=7)[-4]["quantity"], 1)
+
+    def test_dashboard_trend_query_params(self):
+        response = self.client.get(reverse("admin-dashboard"), {"days": 90, "granularity": "month"})
+
+        self.assertEqual(response.status_code, 200)
+        trend = response.json()["trend"]
+        self.assertLessEqual(len(trend), 4)
+        self.assertEqual(sum(t["quantity"] for t in trend), 3)
+
+    def test_dashboard_invalid_trend_query_params(self):
+        response = self.client.get(reverse("admin-dashboard"), {"days": 0, "granularity": "year"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("days", response.json())
+        self.assertIn("granularity", response.json())
+
+
 class ProductRankingAPITest(BaseStatsTestCase):
     def test_product_ranking(self):
         url = reverse("product-ranking")
@@ -1,18 +1,20 @@
-from datetime import datetime
-
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
 from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 
 from apps.stats import services
-from apps.stats.serializers import DashboardSerializer
+from apps.stats.cache import get_dashboard_snapshot
+from apps.stats.serializers import DashboardSerializer, TrendQuerySerializer
 
 
 class DashboardAPIView(GenericAPIView):
     """
     관리자 대시보드 통계 조회
-    GET /api/admin/stats/dashboard
+    GET /api/admin/stats/dashboard?days=90&granularity=week
+    - 보고 날짜별 스냅샷을 캐시하고 백그라운드에서 주기적으로 갱신 (?fresh=1 이면 즉시 재계산)
     """
 
     permission_classes = [IsAdminUser]
@@ -20,8 +22,28 @@ class DashboardAPIView(GenericAPIView):
     pagination_class = None
     filter_backends = []
 
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "days", openapi.IN_QUERY, description="추세 조회 기간 (1~365일, 기본 30)", type=openapi.TYPE_INTEGER
+            ),
+            openapi.Parameter(
+                "granularity",
+                openapi.IN_QUERY,
+                description="추세 집계 단위 (day, week, month)",
+                type=openapi.TYPE_STRING,
+                enum=["day", "week", "month"],
+            ),
+            openapi.Parameter(
+                "fresh", openapi.IN_QUERY, description="1이면 캐시를 건너뛰고 즉시 재계산", type=openapi.TYPE_BOOLEAN
+            ),
+        ]
+    )
     def get(self, request, *args, **kwargs):
-        base_date = datetime.today().date()
-        data = services.get_dashboard_data(base_date)
-        serializer = self.get_serializer(data)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        query = TrendQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        base_date = services.get_reporting_date()
+        # 직렬화까지 끝난 스냅샷을 캐시에서 바로 반환
+        data = get_dashboard_snapshot(base_date, **query.validated_data)
+        return Response(data, status=status.HTTP_200_OK)
@@ -1,5 +1,3 @@
-from datetime import datetime
-
 from django.db.models import Sum
 from rest_framework import status
 from rest_framework.generics import GenericAPIView
@@ -7,6 +5,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 from apps.orders.models import OrderItem
+from apps.stats import services
 from apps.stats.serializers import ProductRankingResponseSerializer
 
 
@@ -22,10 +21,11 @@ class ProductRankingAPIView(GenericAPIView):
     filter_backends = []  # ordering filter 비활성화
 
     def get(self, request, *args, **kwargs):
-        today = datetime.today().date()
+        today = services.get_reporting_date()
+        start, end = services.get_day_range(today)
 
         qs = (
-            OrderItem.objects.filter(order__created_at__date=today)
+            OrderItem.objects.filter(order__created_at__gte=start, order__created_at__lt=end)
             .values("product_id", "product__name")
             .annotate(quantity=Sum("quantity"), revenue=Sum("total_price"))
             .order_by("-quantity")[:10]
@@ -3,10 +3,12 @@ from google import genai
 
 
 class GeminiService:
+    FALLBACK_REPLY = "문의해 주셔서 감사합니다. 빠른 시일 내에 답변드리겠습니다."
+
     def __init__(self):
         self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
 
-    def generate_auto_reply(self, question, category):
+    def _build_prompt(self, question, category):
         category_map = {
             "order": "주문",
             "shipping": "배송",
@@ -16,7 +18,7 @@ class GeminiService:
             "other": "기타",
         }
 
-        prompt = f"""
+        return f"""
         고객 문의 카테고리: {category_map.get(category, "기타")}
         고객 문의 내용: {question}
 
@@ -25,11 +27,24 @@ class GeminiService:
         답변은 200자 이내로 간결하게 작성하고, 고객서비스 톤앤매너를 유지해주세요.
         """
 
+    def generate_auto_reply(self, question, category):
+        prompt = self._build_prompt(question, category)
+
         try:
             response = self.client.models.generate_content(model="gemini-2.0-flash", contents=prompt)
             return response.text
         except Exception:
-            return "문의해 주셔서 감사합니다. 빠른 시일 내에 답변드리겠습니다."
+            return self.FALLBACK_REPLY
+
+    async def agenerate_auto_reply(self, question, category):
+        """generate_auto_reply의 async 버전 (genai aio 클라이언트 사용)"""
+        prompt = self._build_prompt(question, category)
+
+        try:
+            response = await self.client.aio.models.generate_content(model="gemini-2.0-flash", contents=prompt)
+            return response.text
+        except Exception:
+            return self.FALLBACK_REPLY
 
 
 gemini_service = GeminiService()
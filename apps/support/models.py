@@ -30,6 +30,11 @@ class Inquiry(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # 내 문의 목록 / 관리자 상태별 목록 (최신순)
+            models.Index(fields=["user", "-created_at"], name="inquiry_user_created_idx"),
+            models.Index(fields=["status", "-created_at"], name="inquiry_status_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.user.email}"
@@ -69,6 +74,10 @@ class FAQ(models.Model):
 
     class Meta:
         ordering = ["order", "-created_at"]
+        indexes = [
+            # 공개 FAQ 목록: 활성 + 카테고리 필터 + 노출 순서
+            models.Index(fields=["is_active", "category", "order"], name="faq_active_category_idx"),
+        ]
 
     def __str__(self):
         return self.question
@@ -1,7 +1,7 @@
 from rest_framework import serializers
 
-from .gemini_service import gemini_service
 from .models import FAQ, Inquiry, InquiryReply
+from .services import create_inquiry
 
 
 class InquiryReplySerializer(serializers.ModelSerializer):
@@ -64,18 +64,8 @@ class InquiryCreateSerializer(serializers.ModelSerializer):
         fields = ["category", "title", "content"]
 
     def create(self, validated_data):
-        validated_data["user"] = self.context["request"].user
-        inquiry = super().create(validated_data)
-
-        # 문의 생성 즉시 AI 자동응답 생성
-        ai_reply_content = gemini_service.generate_auto_reply(inquiry.content, inquiry.category)
-
-        InquiryReply.objects.create(inquiry=inquiry, content=ai_reply_content, is_admin_reply=True, author=None)
-
-        inquiry.status = "completed"
-        inquiry.save()
-
-        return inquiry
+        # 문의 생성 즉시 AI 자동응답 생성 (async 뷰와 같은 서비스 함수 사용)
+        return create_inquiry(self.context["request"].user.id, validated_data)
 
 
 class FAQSerializer(serializers.ModelSerializer):
@@ -0,0 +1,36 @@
+"""
+문의 생성 + AI 자동응답 (DRF 뷰와 async 뷰 공통)
+
+- 문의 저장 → Gemini 자동응답 생성 → 답변 저장 및 문의 완료 처리
+- async 버전은 ORM 단계만 sync_to_async로 실행하고 Gemini 호출은 await로 기다림
+"""
+
+from asgiref.sync import sync_to_async
+
+from .gemini_service import gemini_service
+from .models import Inquiry, InquiryReply
+
+
+def _save_inquiry(user_id, data):
+    return Inquiry.objects.create(user_id=user_id, **data)
+
+
+def _complete_with_reply(inquiry, reply_content):
+    InquiryReply.objects.create(inquiry=inquiry, content=reply_content, is_admin_reply=True, author=None)
+    inquiry.status = "completed"
+    inquiry.save()
+
+
+def create_inquiry(user_id, data):
+    """문의 생성 즉시 AI 자동응답까지 저장 - data: InquiryCreateSerializer.validated_data"""
+    inquiry = _save_inquiry(user_id, data)
+    _complete_with_reply(inquiry, gemini_service.generate_auto_reply(inquiry.content, inquiry.category))
+    return inquiry
+
+
+async def acreate_inquiry(user_id, data):
+    """create_inquiry의 async 버전 (Gemini 응답을 기다리는 동안 이벤트 루프를 막지 않음)"""
+    inquiry = await sync_to_async(_save_inquiry)(user_id, data)
+    reply_content = await gemini_service.agenerate_auto_reply(inquiry.content, inquiry.category)
+    await sync_to_async(_complete_with_reply)(inquiry, reply_content)
+    return inquiry
@@ -0,0 +1,80 @@
+import json
+from unittest.mock import AsyncMock, patch
+
+from django.contrib.auth import get_user_model
+from django.test import AsyncRequestFactory, TestCase
+from rest_framework import status
+
+from apps.support.models import Inquiry
+from apps.support.views import InquiryListCreateAsyncView
+from apps.users.tokens import UserRefreshToken
+
+User = get_user_model()
+
+
+class InquiryListCreateAsyncViewTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="async@example.com", name="비동기유저", password="testpass123", is_active=True
+        )
+        self.factory = AsyncRequestFactory()
+        self.view = InquiryListCreateAsyncView.as_view()
+        self.access_token = str(UserRefreshToken.for_user(self.user).access_token)
+
+    def post(self, data, authenticated=True):
+        request = self.factory.post("/api/support/inquiries/", data=data, content_type="application/json")
+        if authenticated:
+            request.COOKIES["access_token"] = self.access_token
+        return request
+
+    @patch("apps.support.services.gemini_service.agenerate_auto_reply", new_callable=AsyncMock)
+    async def test_create_inquiry_with_async_ai_reply(self, mock_ai_reply):
+        mock_ai_reply.return_value = "AI 자동 응답입니다."
+        data = {"category": "payment", "title": "새로운 문의", "content": "새로운 문의 내용"}
+
+        response = await self.view(self.post(data))
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(json.loads(response.content), data)
+        inquiry = await Inquiry.objects.select_related("user").aget(title="새로운 문의")
+        self.assertEqual(inquiry.user, self.user)
+        self.assertEqual(inquiry.status, "completed")
+        reply = await inquiry.replies.afirst()
+        self.assertEqual(reply.content, "AI 자동 응답입니다.")
+        self.assertTrue(reply.is_admin_reply)
+        mock_ai_reply.assert_awaited_once_with("새로운 문의 내용", "payment")
+
+    async def test_unauthenticated(self):
+        response = await self.view(self.post({"category": "order", "title": "t", "content": "c"}, authenticated=False))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("WWW-Authenticate", response)
+        self.assertEqual(await Inquiry.objects.acount(), 0)
+
+    async def test_invalid_token(self):
+        request = self.post({"category": "order", "title": "t", "content": "c"}, authenticated=False)
+        request.COOKIES["access_token"] = "invalid"
+
+        response = await self.view(request)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @patch("apps.support.services.gemini_service.agenerate_auto_reply", new_callable=AsyncMock)
+    async def test_invalid_data(self, mock_ai_reply):
+        response = await self.view(self.post({"category": "invalid", "title": "", "content": ""}))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = json.loads(response.content)
+        self.assertIn("category", errors)
+        self.assertIn("title", errors)
+        mock_ai_reply.assert_not_awaited()
+
+    async def test_get_delegates_to_list_view(self):
+        await Inquiry.objects.acreate(user=self.user, category="order", title="기존 문의", content="내용")
+        request = self.factory.get("/api/support/inquiries/")
+        request.COOKIES["access_token"] = self.access_token
+
+        response = await self.view(request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["title"], "기존 문의")
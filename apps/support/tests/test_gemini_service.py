@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from django.conf import settings
 from django.test import TestCase
@@ -222,3 +222,32 @@ class GeminiServiceTest(TestCase):
         call_kwargs = mock_client_instance.models.generate_content.call_args[1]
         prompt = call_kwargs["contents"]
         self.assertIn("기타", prompt)
+
+    @patch("apps.support.gemini_service.genai.Client")
+    async def test_agenerate_auto_reply_uses_aio_client(self, mock_client):
+        """async 자동 응답 생성 테스트 (aio 클라이언트 사용)"""
+        mock_client_instance = MagicMock()
+        mock_client.return_value = mock_client_instance
+        mock_response = MagicMock()
+        mock_response.text = "비동기 응답"
+        mock_client_instance.aio.models.generate_content = AsyncMock(return_value=mock_response)
+
+        service = GeminiService()
+        result = await service.agenerate_auto_reply("배송은 언제 되나요?", "shipping")
+
+        self.assertEqual(result, "비동기 응답")
+        prompt = mock_client_instance.aio.models.generate_content.call_args[1]["contents"]
+        self.assertIn("배송은 언제 되나요?", prompt)
+        mock_client_instance.models.generate_content.assert_not_called()
+
+    @patch("apps.support.gemini_service.genai.Client")
+    async def test_agenerate_auto_reply_fallback(self, mock_client):
+        """async 자동 응답 생성 실패 시 기본 응답"""
+        mock_client_instance = MagicMock()
+        mock_client.return_value = mock_client_instance
+        mock_client_instance.aio.models.generate_content = AsyncMock(side_effect=Exception("API Error"))
+
+        service = GeminiService()
+        result = await service.agenerate_auto_reply("질문입니다", "order")
+
+        self.assertEqual(result, GeminiService.FALLBACK_REPLY)
@@ -55,7 +55,7 @@ class InquiryListCreateAPIViewTest(APITestCase):
         self.assertEqual(len(response.data["results"]), 1)
         self.assertEqual(response.data["results"][0]["id"], self.inquiry.id)
 
-    @patch("apps.support.serializers.gemini_service.generate_auto_reply")
+    @patch("apps.support.services.gemini_service.generate_auto_reply")
     def test_create_inquiry_success(self, mock_ai_reply):
         """문의 생성 성공 테스트"""
         mock_ai_reply.return_value = "AI 자동 응답입니다."
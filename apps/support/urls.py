@@ -1,10 +1,14 @@
+from django.conf import settings
 from django.urls import path
 
 from . import views
 
+# ASYNC_VIEWS: 문의 생성(Gemini 호출)을 async 뷰로 처리 (ASGI 배포)
+inquiry_list_create_view = views.InquiryListCreateAsyncView if settings.ASYNC_VIEWS else views.InquiryListCreateAPIView
+
 urlpatterns = [
     # 문의 관련
-    path("inquiries/", views.InquiryListCreateAPIView.as_view(), name="inquiry-list-create"),
+    path("inquiries/", inquiry_list_create_view.as_view(), name="inquiry-list-create"),
     path("inquiries/<int:pk>/", views.InquiryDetailAPIView.as_view(), name="inquiry-detail"),
     # FAQ
     path("faqs/", views.FAQListAPIView.as_view(), name="faq-list"),
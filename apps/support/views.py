@@ -1,4 +1,13 @@
-from rest_framework import generics, permissions
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import generics, permissions, status
+from rest_framework.exceptions import AuthenticationFailed, NotAuthenticated
+
+from apps.users.middleware import CookieJWTAuthentication
 
 from .models import FAQ, Inquiry
 from .serializers import (
@@ -7,6 +16,7 @@ from .serializers import (
     InquiryDetailSerializer,
     InquiryListSerializer,
 )
+from .services import acreate_inquiry
 
 
 class InquiryListCreateAPIView(generics.ListCreateAPIView):
@@ -21,6 +31,57 @@ class InquiryListCreateAPIView(generics.ListCreateAPIView):
         return Inquiry.objects.filter(user=self.request.user)
 
 
+class InquiryListCreateAsyncView(View):
+    """
+    문의 목록/생성 (async, ASGI 배포용)
+    - POST: Gemini 자동응답을 await로 기다리는 동안 워커가 다른 요청을 처리 (응답 형식은 DRF 뷰와 동일)
+    - GET: 기존 DRF 목록 뷰에 위임
+    - 인증은 쿠키 JWT만 지원 (DRF 뷰와 같이 CSRF 검사 없음)
+    """
+
+    authentication = CookieJWTAuthentication()
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def get(self, request, *args, **kwargs):
+        return await sync_to_async(InquiryListCreateAPIView.as_view())(request, *args, **kwargs)
+
+    def unauthorized(self, detail):
+        response = JsonResponse({"detail": str(detail)}, status=status.HTTP_401_UNAUTHORIZED)
+        response["WWW-Authenticate"] = self.authentication.authenticate_header(request=None)
+        return response
+
+    def parse_data(self, request):
+        if request.content_type == "application/json":
+            return json.loads(request.body or b"{}")
+        return request.POST
+
+    async def post(self, request, *args, **kwargs):
+        try:
+            # 토큰 검증 + (경량 모드가 아니면) 사용자 조회
+            auth = await sync_to_async(self.authentication.authenticate)(request)
+        except AuthenticationFailed as e:
+            return self.unauthorized(e.detail)
+        if auth is None:
+            return self.unauthorized(NotAuthenticated.default_detail)
+        user = auth[0]
+
+        try:
+            data = self.parse_data(request)
+        except ValueError:
+            return JsonResponse({"detail": "잘못된 JSON 형식입니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = InquiryCreateSerializer(data=data)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        # 문의 생성 즉시 AI 자동응답 생성 (DRF 뷰와 같은 서비스 함수의 async 버전)
+        inquiry = await acreate_inquiry(user.id, serializer.validated_data)
+        return JsonResponse(InquiryCreateSerializer(inquiry).data, status=status.HTTP_201_CREATED)
+
+
 class InquiryDetailAPIView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = InquiryDetailSerializer
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunableArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    비용 파라미터를 설정값(PASSWORD_ARGON2_*)으로 조정하는 Argon2id 해셔
+    - 기존 PBKDF2 해시나 다른 비용으로 만든 해시는 로그인 성공 시 자동으로 재해시됨 (must_update)
+    """
+
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2_PARALLELISM
@@ -0,0 +1,113 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+# sending 표시 후 이 시간 안에 결과가 저장되지 않으면 워커가 죽은 것으로 보고 다시 발송
+CLAIM_TIMEOUT = timedelta(minutes=10)
+
+
+def queue_mail(subject, message, from_email, recipient_list):
+    """send_mail과 같은 인자로 아웃박스에 저장 (요청 경로에서 SMTP 대기 없음)"""
+    return OutboundEmail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL or "",
+        to=list(recipient_list),
+    )
+
+
+def _retry_delay(attempts):
+    # 지수 백오프: base, base*2, base*4 ...
+    return timedelta(seconds=settings.EMAIL_OUTBOX_RETRY_BACKOFF * 2 ** (attempts - 1))
+
+
+def claim_queued_emails(batch_size):
+    """
+    발송할 메일 한 배치를 sending으로 표시하고 반환
+    - 행 잠금은 표시하는 동안만 (skip_locked로 다른 워커와 겹치지 않음)
+    - 발송 중 워커가 죽어도 CLAIM_TIMEOUT이 지나면 다시 대상이 됨
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=OutboundEmail.Status.PENDING, next_attempt_at__lte=now)
+                | Q(status=OutboundEmail.Status.SENDING, claimed_at__lt=now - CLAIM_TIMEOUT)
+            )
+            .order_by("id")[:batch_size]
+        )
+        OutboundEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+            status=OutboundEmail.Status.SENDING, claimed_at=now
+        )
+    return emails
+
+
+def _mark_sent(email):
+    OutboundEmail.objects.filter(pk=email.pk, status=OutboundEmail.Status.SENDING).update(
+        status=OutboundEmail.Status.SENT,
+        attempts=email.attempts + 1,
+        sent_at=timezone.now(),
+        claimed_at=None,
+    )
+
+
+def _mark_failed(email, error):
+    attempts = email.attempts + 1
+    if attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        status, next_attempt_at = OutboundEmail.Status.FAILED, email.next_attempt_at
+    else:
+        status, next_attempt_at = OutboundEmail.Status.PENDING, timezone.now() + _retry_delay(attempts)
+    OutboundEmail.objects.filter(pk=email.pk, status=OutboundEmail.Status.SENDING).update(
+        status=status,
+        attempts=attempts,
+        next_attempt_at=next_attempt_at,
+        last_error=str(error),
+        claimed_at=None,
+    )
+
+
+def send_queued_emails(batch_size=100):
+    """
+    대기 중인 메일을 한 배치 발송하고 (발송 수, 실패 수)를 반환
+    - 짧은 트랜잭션으로 sending 표시만 하고, SMTP 발송은 트랜잭션/행 잠금 없이 실행
+    - 배치 전체를 SMTP 연결 하나로 발송, 결과는 메일마다 바로 저장
+    - 실패한 메일은 백오프 후 재시도, EMAIL_OUTBOX_MAX_ATTEMPTS 초과 시 failed 처리
+    """
+    sent = failed = 0
+
+    emails = claim_queued_emails(batch_size)
+    if not emails:
+        return sent, failed
+
+    connection = get_connection()
+    try:
+        connection.open()
+        connection_error = None
+    except Exception as e:
+        connection_error = e
+
+    try:
+        for email in emails:
+            try:
+                if connection_error:
+                    raise connection_error
+                message = EmailMessage(email.subject, email.body, email.from_email or None, email.to)
+                connection.send_messages([message])
+            except Exception as e:
+                _mark_failed(email, e)
+                failed += 1
+            else:
+                _mark_sent(email)
+                sent += 1
+    finally:
+        if not connection_error:
+            connection.close()
+
+    return sent, failed
@@ -0,0 +1,30 @@
+import time
+
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "설정된 비밀번호 해셔별 검증 시간을 측정합니다 (코어당 초당 로그인 수로 로그인 용량 산정). "
+        "예: python manage.py benchmark_login --iterations 50"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20, help="해셔별 검증 반복 횟수 (기본 20)")
+        parser.add_argument("--password", default="BenchmarkPass123!", help="측정에 사용할 비밀번호")
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        password = options["password"]
+
+        self.stdout.write(f"{'hasher':<36} {'ms/login':>10} {'logins/s/core':>15}")
+        for hasher in get_hashers():
+            encoded = hasher.encode(password, hasher.salt())
+
+            started = time.perf_counter()
+            for _ in range(iterations):
+                hasher.verify(password, encoded)
+            elapsed = (time.perf_counter() - started) / iterations
+
+            self.stdout.write(f"{type(hasher).__name__:<36} {elapsed * 1000:>10.1f} {1 / elapsed:>15.1f}")
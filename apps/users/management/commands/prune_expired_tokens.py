@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+
+class Command(BaseCommand):
+    help = (
+        "만료된 리프레시 토큰(OutstandingToken/BlacklistedToken)을 배치 단위로 삭제합니다. "
+        "cron 등으로 주기 실행하세요. 예: 0 4 * * * python manage.py prune_expired_tokens"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000, help="한 번에 삭제할 토큰 수 (기본 5000)")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        now = aware_utcnow()
+        total = 0
+
+        # 한 번에 전부 지우면 긴 트랜잭션/락이 생기므로 pk 기준으로 나눠서 삭제
+        while True:
+            ids = list(
+                OutstandingToken.objects.filter(expires_at__lte=now)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            # BlacklistedToken은 CASCADE로 함께 삭제
+            OutstandingToken.objects.filter(id__in=ids).delete()
+            total += len(ids)
+
+        self.stdout.write(self.style.SUCCESS(f"만료된 토큰 {total}개를 삭제했습니다."))
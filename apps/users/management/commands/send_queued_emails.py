@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.users.mail import send_queued_emails
+
+
+class Command(BaseCommand):
+    help = "아웃박스(OutboundEmail)에 쌓인 메일을 배치로 발송합니다. --loop 옵션으로 워커처럼 계속 실행할 수 있습니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100, help="한 배치에 발송할 메일 수 (기본 100)")
+        parser.add_argument("--loop", action="store_true", help="대기 메일을 계속 폴링하며 발송")
+        parser.add_argument("--interval", type=float, default=5, help="--loop 시 대기 메일이 없을 때 쉬는 시간(초)")
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = send_queued_emails(batch_size=options["batch_size"])
+            if sent or failed:
+                self.stdout.write(f"메일 발송 {sent}건, 실패 {failed}건")
+
+            if not options["loop"]:
+                break
+            # 배치가 꽉 찼으면 바로 다음 배치, 아니면 잠시 대기
+            if sent + failed < options["batch_size"]:
+                time.sleep(options["interval"])
@@ -1,4 +1,91 @@
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.functional import SimpleLazyObject, empty
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+User = get_user_model()
+
+# 경량 사용자 모드에서 토큰에 반드시 있어야 하는 클레임
+TOKEN_USER_CLAIMS = ("is_admin", "is_active")
+
+
+class UserCache:
+    """
+    프로세스 단위 사용자 캐시 (짧은 TTL)
+    - 행 값만 보관하고 조회할 때마다 새 모델 인스턴스를 만들어 요청 간 객체 공유를 막음
+    """
+
+    MAX_SIZE = 10000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rows = {}
+        self._fields = None
+
+    @property
+    def fields(self):
+        if self._fields is None:
+            self._fields = [field.attname for field in User._meta.concrete_fields]
+        return self._fields
+
+    def get(self, user_id):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._rows.get(user_id)
+
+        if entry is None or entry[0] <= now:
+            row = User.objects.filter(pk=user_id).values_list(*self.fields).first()
+            if row is None:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+            entry = (now + settings.JWT_USER_CACHE_TTL, row)
+            with self._lock:
+                if len(self._rows) >= self.MAX_SIZE:
+                    self._rows = {k: v for k, v in self._rows.items() if v[0] > now}
+                self._rows[user_id] = entry
+
+        return User.from_db(DEFAULT_DB_ALIAS, self.fields, entry[1])
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._rows.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._rows.clear()
+
+
+user_cache = UserCache()
+
+
+class TokenClaimsUser(SimpleLazyObject):
+    """
+    토큰 클레임만으로 답할 수 있는 속성(id, is_admin, is_staff, is_active)은 DB 조회 없이 반환하고,
+    그 외 속성이 필요할 때만 사용자 캐시에서 모델을 불러오는 지연 사용자 객체
+    """
+
+    def __init__(self, user_id, claims):
+        super().__init__(lambda: user_cache.get(user_id))
+        self.__dict__["_claims"] = {
+            "id": user_id,
+            "pk": user_id,
+            "is_admin": claims["is_admin"],
+            "is_staff": claims["is_admin"],
+            "is_active": claims["is_active"],
+            "is_authenticated": True,
+            "is_anonymous": False,
+        }
+
+    def __getattr__(self, name):
+        claims = self.__dict__["_claims"]
+        if self._wrapped is empty and name in claims:
+            return claims[name]
+        return super().__getattr__(name)
 
 
 class CookieJWTAuthentication(JWTAuthentication):
@@ -8,9 +95,19 @@ class CookieJWTAuthentication(JWTAuthentication):
             return None
 
         validated_token = self.get_validated_token(raw_token)
-        user = self.get_user(validated_token)
+        if settings.JWT_LIGHTWEIGHT_USER and all(claim in validated_token for claim in TOKEN_USER_CLAIMS):
+            user = self.get_token_user(validated_token)
+        else:
+            user = self.get_user(validated_token)
 
         return (user, validated_token)
 
     def get_raw_token(self, request):
         return request.COOKIES.get("access_token")
+
+    def get_token_user(self, validated_token):
+        """users 테이블 조회 없이 토큰 클레임으로 사용자 구성 (클레임이 없는 이전 토큰은 get_user 사용)"""
+        if not validated_token["is_active"]:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        user_id = User._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM])
+        return TokenClaimsUser(user_id, validated_token)
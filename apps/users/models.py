@@ -1,6 +1,7 @@
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils import timezone
 
 from apps.core.models import TimestampModel
 
@@ -81,3 +82,37 @@ class User(AbstractBaseUser, PermissionsMixin, TimestampModel):
 
         if not self.is_social and not self.password:
             raise ValidationError({"password": "일반 회원가입 시 비밀번호는 필수입니다."})
+
+
+class OutboundEmail(models.Model):
+    """
+    발송 대기 메일 (아웃박스)
+    요청 처리 중에는 저장만 하고, send_queued_emails 워커가 SMTP 연결 하나로 묶어서 발송
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "대기"
+        SENDING = "sending", "발송 중"
+        SENT = "sent", "발송 완료"
+        FAILED = "failed", "발송 실패"
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255, blank=True)
+    to = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # 워커 폴링: 대기 상태 + 재시도 시각 도래
+            models.Index(fields=["status", "next_attempt_at"], name="outbound_email_pending_idx"),
+        ]
+
+    def __str__(self):
+        return f"[{self.status}] {self.subject} → {', '.join(self.to)}"
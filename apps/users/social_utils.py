@@ -1,17 +1,73 @@
+import asyncio
+import weakref
+
+import httpx
 import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from rest_framework_simplejwt.tokens import RefreshToken
+from django.db import transaction
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from apps.carts.models import Cart
+
+from .tokens import UserRefreshToken
 
 User = get_user_model()
 
 
+def build_oauth_session():
+    """
+    OAuth 제공자 호출용 공유 세션 (keep-alive 커넥션 풀 재사용으로 TCP/TLS 핸드셰이크 생략)
+    - 연결 실패는 모든 메서드 재시도, 5xx 응답은 GET만 재시도 (인가 코드는 일회용이라 POST 재전송 금지)
+    """
+    retry = Retry(
+        total=settings.SOCIAL_OAUTH_MAX_RETRIES,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=settings.SOCIAL_OAUTH_POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+oauth_session = build_oauth_session()
+
+# async 뷰용 클라이언트 - 커넥션 풀이 이벤트 루프에 묶이므로 루프마다 하나씩 만들어 재사용
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_oauth_client():
+    """현재 이벤트 루프의 OAuth AsyncClient (연결 실패만 재시도, 응답 재시도 없음)"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        transport = httpx.AsyncHTTPTransport(
+            retries=settings.SOCIAL_OAUTH_MAX_RETRIES,
+            limits=httpx.Limits(max_keepalive_connections=settings.SOCIAL_OAUTH_POOL_SIZE),
+        )
+        client = _async_clients[loop] = httpx.AsyncClient(transport=transport)
+    return client
+
+
+def get_oauth_timeout():
+    """(연결, 읽기) 타임아웃"""
+    return (settings.SOCIAL_OAUTH_CONNECT_TIMEOUT, settings.SOCIAL_OAUTH_READ_TIMEOUT)
+
+
+def get_async_oauth_timeout():
+    return httpx.Timeout(settings.SOCIAL_OAUTH_READ_TIMEOUT, connect=settings.SOCIAL_OAUTH_CONNECT_TIMEOUT)
+
+
 class NaverOAuth:
     @staticmethod
-    def get_access_token(code, state):
-        """네이버 인증 코드로 액세스 토큰 받기"""
-        url = "https://nid.naver.com/oauth2.0/token"
-        data = {
+    def _token_request_data(code, state):
+        return {
             "grant_type": "authorization_code",
             "client_id": settings.NAVER_CLIENT_ID,
             "client_secret": settings.NAVER_CLIENT_SECRET,
@@ -20,8 +76,14 @@ class NaverOAuth:
             "state": state,
         }
 
+    @staticmethod
+    def get_access_token(code, state):
+        """네이버 인증 코드로 액세스 토큰 받기"""
+        url = settings.NAVER_TOKEN_URL
+        data = NaverOAuth._token_request_data(code, state)
+
         try:
-            response = requests.post(url, data=data, timeout=10)
+            response = oauth_session.post(url, data=data, timeout=get_oauth_timeout())
             response.raise_for_status()
             return response.json()
         except requests.RequestException:
@@ -30,23 +92,49 @@ class NaverOAuth:
     @staticmethod
     def get_user_info(access_token):
         """네이버 액세스 토큰으로 사용자 정보 받기"""
-        url = "https://openapi.naver.com/v1/nid/me"
+        url = settings.NAVER_USERINFO_URL
         headers = {"Authorization": f"Bearer {access_token}"}
 
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = oauth_session.get(url, headers=headers, timeout=get_oauth_timeout())
             response.raise_for_status()
             return response.json()
         except requests.RequestException:
             return {"resultcode": "network_error"}
 
+    @staticmethod
+    async def aget_access_token(code, state):
+        """get_access_token의 async 버전"""
+        data = NaverOAuth._token_request_data(code, state)
+
+        try:
+            response = await get_async_oauth_client().post(
+                settings.NAVER_TOKEN_URL, data=data, timeout=get_async_oauth_timeout()
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError:
+            return {"error": "network_error"}
+
+    @staticmethod
+    async def aget_user_info(access_token):
+        """get_user_info의 async 버전"""
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        try:
+            response = await get_async_oauth_client().get(
+                settings.NAVER_USERINFO_URL, headers=headers, timeout=get_async_oauth_timeout()
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError:
+            return {"resultcode": "network_error"}
+
 
 class GoogleOAuth:
     @staticmethod
-    def get_access_token(code):
-        """구글 인증 코드로 액세스 토큰 받기"""
-        url = "https://oauth2.googleapis.com/token"
-        data = {
+    def _token_request_data(code):
+        return {
             "grant_type": "authorization_code",
             "client_id": settings.GOOGLE_CLIENT_ID,
             "client_secret": settings.GOOGLE_CLIENT_SECRET,
@@ -54,8 +142,14 @@ class GoogleOAuth:
             "redirect_uri": settings.GOOGLE_REDIRECT_URI,
         }
 
+    @staticmethod
+    def get_access_token(code):
+        """구글 인증 코드로 액세스 토큰 받기"""
+        url = settings.GOOGLE_TOKEN_URL
+        data = GoogleOAuth._token_request_data(code)
+
         try:
-            response = requests.post(url, data=data, timeout=10)
+            response = oauth_session.post(url, data=data, timeout=get_oauth_timeout())
             response.raise_for_status()
             return response.json()
         except requests.RequestException:
@@ -64,34 +158,78 @@ class GoogleOAuth:
     @staticmethod
     def get_user_info(access_token):
         """구글 액세스 토큰으로 사용자 정보 받기"""
-        url = f"https://www.googleapis.com/oauth2/v2/userinfo?access_token={access_token}"
+        url = f"{settings.GOOGLE_USERINFO_URL}?access_token={access_token}"
 
         try:
-            response = requests.get(url, timeout=10)
+            response = oauth_session.get(url, timeout=get_oauth_timeout())
             response.raise_for_status()
             return response.json()
         except requests.RequestException:
             return {"error": "network_error"}
 
+    @staticmethod
+    async def aget_access_token(code):
+        """get_access_token의 async 버전"""
+        data = GoogleOAuth._token_request_data(code)
+
+        try:
+            response = await get_async_oauth_client().post(
+                settings.GOOGLE_TOKEN_URL, data=data, timeout=get_async_oauth_timeout()
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError:
+            return {"error": "network_error"}
+
+    @staticmethod
+    async def aget_user_info(access_token):
+        """get_user_info의 async 버전"""
+        url = f"{settings.GOOGLE_USERINFO_URL}?access_token={access_token}"
+
+        try:
+            response = await get_async_oauth_client().get(url, timeout=get_async_oauth_timeout())
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError:
+            return {"error": "network_error"}
+
 
 class SocialAuthService:
     @staticmethod
+    @transaction.atomic
     def create_or_get_user(email, name):
-        """소셜 정보로 사용자 생성 또는 가져오기"""
-        try:
-            # 이메일로 기존 사용자 찾기
-            user = User.objects.get(email=email)
-        except User.DoesNotExist:
-            # 새 사용자 생성
-            user = User.objects.create_user(email=email, name=name, is_social=True, is_active=True)
+        """
+        소셜 정보로 사용자 생성 또는 가져오기
+        - INSERT ... ON CONFLICT (email)로 조회/생성을 한 번에 처리 → 콜백이 동시에 와도 중복 생성 오류 없음
+        - bulk_create는 post_save 시그널을 보내지 않으므로 장바구니도 같은 트랜잭션에서 직접 생성
+        - 쿼리 수 고정: 사용자 upsert 1 + 장바구니 insert 1 + 저장된 사용자 조회 1
+        """
+        email = User.objects.normalize_email(email)
+        (user,) = User.objects.bulk_create(
+            [User(email=email, name=name, password=None, is_social=True, is_active=True)],
+            update_conflicts=True,
+            unique_fields=["email"],
+            update_fields=["email"],  # 기존 행은 값 변경 없이 id만 반환받기 위한 no-op 갱신
+        )
+        Cart.objects.bulk_create([Cart(user_id=user.pk)], ignore_conflicts=True)
 
-        return user
+        # 기존 사용자였다면 메모리의 값(name 등)이 실제 저장값과 다르므로 다시 조회
+        return User.objects.get(pk=user.pk)
 
     @staticmethod
     def generate_jwt_tokens(user):
         """JWT 토큰 생성"""
-        refresh = RefreshToken.for_user(user)
+        refresh = UserRefreshToken.for_user(user)
         return {
             "refresh": str(refresh),
             "access": str(refresh.access_token),
         }
+
+    # async 뷰용 - 트랜잭션(atomic)과 토큰 발급 기록(OutstandingToken)은 동기 ORM이라 스레드에서 실행
+    @staticmethod
+    async def acreate_or_get_user(email, name):
+        return await sync_to_async(SocialAuthService.create_or_get_user)(email, name)
+
+    @staticmethod
+    async def agenerate_jwt_tokens(user):
+        return await sync_to_async(SocialAuthService.generate_jwt_tokens)(user)
@@ -1,13 +1,42 @@
+import math
 import secrets
 
 from django.conf import settings
-from django.http import HttpResponseRedirect
+from django.http import HttpResponseRedirect, JsonResponse
 from django.shortcuts import redirect
+from django.views import View
 from rest_framework import status
+from rest_framework.exceptions import Throttled
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from .social_utils import GoogleOAuth, NaverOAuth, SocialAuthService
+from .throttles import AuthIPThrottle
+
+
+def login_redirect(tokens):
+    """JWT를 쿠키로 설정하고 프론트엔드로 리다이렉트"""
+    access_lifetime = settings.SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"].total_seconds()
+    refresh_lifetime = settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].total_seconds()
+
+    response = redirect(settings.FRONT_BASE_URL)
+    response.set_cookie(
+        "access_token",
+        tokens["access"],
+        max_age=int(access_lifetime),
+        httponly=True,
+        secure=settings.COOKIE_SECURE,
+        samesite=settings.COOKIE_SAMESITE,
+    )
+    response.set_cookie(
+        "refresh_token",
+        tokens["refresh"],
+        max_age=int(refresh_lifetime),
+        httponly=True,
+        secure=settings.COOKIE_SECURE,
+        samesite=settings.COOKIE_SAMESITE,
+    )
+    return response
 
 
 class NaverLoginStartView(APIView):
@@ -30,6 +59,8 @@ class NaverLoginStartView(APIView):
 
 
 class NaverLoginCallbackView(APIView):
+    throttle_classes = [AuthIPThrottle]
+
     def get(self, request):
         """네이버 OAuth 콜백 처리"""
         code = request.GET.get("code")
@@ -70,28 +101,7 @@ class NaverLoginCallbackView(APIView):
             # 4. JWT 토큰 생성
             tokens = SocialAuthService.generate_jwt_tokens(user)
 
-            # 쿠키로 토큰 설정
-            access_lifetime = settings.SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"].total_seconds()
-            refresh_lifetime = settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].total_seconds()
-
-            response = redirect(settings.FRONT_BASE_URL)
-            response.set_cookie(
-                "access_token",
-                tokens["access"],
-                max_age=int(access_lifetime),
-                httponly=True,
-                secure=settings.COOKIE_SECURE,
-                samesite=settings.COOKIE_SAMESITE,
-            )
-            response.set_cookie(
-                "refresh_token",
-                tokens["refresh"],
-                max_age=int(refresh_lifetime),
-                httponly=True,
-                secure=settings.COOKIE_SECURE,
-                samesite=settings.COOKIE_SAMESITE,
-            )
-            return response
+            return login_redirect(tokens)
 
         except Exception:
             return Response(
@@ -124,6 +134,8 @@ class GoogleLoginStartView(APIView):
 
 
 class GoogleLoginCallbackView(APIView):
+    throttle_classes = [AuthIPThrottle]
+
     def get(self, request):
         """구글 OAuth 콜백 처리"""
         code = request.GET.get("code")
@@ -161,28 +173,7 @@ class GoogleLoginCallbackView(APIView):
             # 4. JWT 토큰 생성
             tokens = SocialAuthService.generate_jwt_tokens(user)
 
-            # 쿠키로 토큰 설정
-            access_lifetime = settings.SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"].total_seconds()
-            refresh_lifetime = settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].total_seconds()
-
-            response = redirect(settings.FRONT_BASE_URL)
-            response.set_cookie(
-                "access_token",
-                tokens["access"],
-                max_age=int(access_lifetime),
-                httponly=True,
-                secure=settings.COOKIE_SECURE,
-                samesite=settings.COOKIE_SAMESITE,
-            )
-            response.set_cookie(
-                "refresh_token",
-                tokens["refresh"],
-                max_age=int(refresh_lifetime),
-                httponly=True,
-                secure=settings.COOKIE_SECURE,
-                samesite=settings.COOKIE_SAMESITE,
-            )
-            return response
+            return login_redirect(tokens)
 
         except Exception:
             response = Response(
@@ -194,3 +185,105 @@ class GoogleLoginCallbackView(APIView):
             request.session.save()
 
         return response
+
+
+def throttled_response(throttle):
+    """DRF 스로틀 응답과 같은 형식의 429 응답 (async 뷰는 DRF를 거치지 않음)"""
+    response = JsonResponse({"detail": str(Throttled.default_detail)}, status=status.HTTP_429_TOO_MANY_REQUESTS)
+    response["Retry-After"] = str(math.ceil(throttle.wait()))
+    return response
+
+
+class NaverLoginCallbackAsyncView(View):
+    """
+    네이버 OAuth 콜백 (async, ASGI 배포용)
+    - 제공자 API 두 번을 await로 기다리는 동안 워커가 다른 요청을 처리
+    - 응답 형식은 NaverLoginCallbackView와 동일
+    """
+
+    async def get(self, request):
+        throttle = AuthIPThrottle()
+        if not throttle.allow_request(request, self):
+            return throttled_response(throttle)
+
+        code = request.GET.get("code")
+        state = request.GET.get("state")
+
+        if not code or not state:
+            return JsonResponse({"error": "코드와 상태값이 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # state 검증
+        stored_state = await request.session.aget("naver_oauth_state")
+        if state != stored_state:
+            return JsonResponse({"error": "잘못된 요청입니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            token_response = await NaverOAuth.aget_access_token(code, state)
+            if "access_token" not in token_response:
+                return JsonResponse({"error": "네이버 토큰 발급 실패"}, status=status.HTTP_400_BAD_REQUEST)
+
+            user_info = await NaverOAuth.aget_user_info(token_response["access_token"])
+            if user_info.get("resultcode") != "00":
+                return JsonResponse({"error": "네이버 사용자 정보 조회 실패"}, status=status.HTTP_400_BAD_REQUEST)
+
+            user_data = user_info["response"]
+            user = await SocialAuthService.acreate_or_get_user(
+                email=user_data.get("email"),
+                name=user_data.get("name"),
+            )
+            tokens = await SocialAuthService.agenerate_jwt_tokens(user)
+            return login_redirect(tokens)
+
+        except Exception:
+            return JsonResponse(
+                {"error": "네이버 로그인 처리 중 오류가 발생했습니다."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        finally:
+            # state 정리
+            await request.session.apop("naver_oauth_state", None)
+            await request.session.asave()
+
+
+class GoogleLoginCallbackAsyncView(View):
+    """구글 OAuth 콜백 (async, ASGI 배포용) - 응답 형식은 GoogleLoginCallbackView와 동일"""
+
+    async def get(self, request):
+        throttle = AuthIPThrottle()
+        if not throttle.allow_request(request, self):
+            return throttled_response(throttle)
+
+        code = request.GET.get("code")
+        state = request.GET.get("state")
+
+        if not code or not state:
+            return JsonResponse({"error": "인증 코드가 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # state 검증
+        stored_state = await request.session.aget("google_oauth_state")
+        if state != stored_state:
+            return JsonResponse({"error": "잘못된 요청입니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            token_response = await GoogleOAuth.aget_access_token(code)
+            if "access_token" not in token_response:
+                return JsonResponse({"error": "구글 토큰 발급 실패"}, status=status.HTTP_400_BAD_REQUEST)
+
+            user_info = await GoogleOAuth.aget_user_info(token_response["access_token"])
+            if "error" in user_info:
+                return JsonResponse({"error": "구글 사용자 정보 조회 실패"}, status=status.HTTP_400_BAD_REQUEST)
+
+            user = await SocialAuthService.acreate_or_get_user(
+                email=user_info.get("email"),
+                name=user_info.get("name"),
+            )
+            tokens = await SocialAuthService.agenerate_jwt_tokens(user)
+            return login_redirect(tokens)
+
+        except Exception:
+            return JsonResponse(
+                {"error": "구글 로그인 처리 중 오류가 발생했습니다."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        finally:
+            # state 정리
+            await request.session.apop("google_oauth_state", None)
+            await request.session.asave()
@@ -0,0 +1,89 @@
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.carts.models import Cart
+from apps.users.middleware import CookieJWTAuthentication, TokenClaimsUser, user_cache
+from apps.users.models import User
+from apps.users.tokens import UserRefreshToken
+
+
+@override_settings(JWT_LIGHTWEIGHT_USER=True, JWT_USER_CACHE_TTL=60)
+class LightweightUserAuthenticationTest(TestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = User.objects.create_user(
+            email="light@example.com", name="경량유저", password="testpass123", is_active=True
+        )
+        self.auth = CookieJWTAuthentication()
+        self.factory = RequestFactory()
+
+    def make_request(self, token):
+        request = self.factory.get("/")
+        request.COOKIES["access_token"] = str(token)
+        return request
+
+    def test_token_contains_permission_claims(self):
+        access = UserRefreshToken.for_user(self.user).access_token
+        self.assertEqual(access["is_admin"], False)
+        self.assertEqual(access["is_active"], True)
+
+    def test_authenticate_without_user_query(self):
+        request = self.make_request(UserRefreshToken.for_user(self.user).access_token)
+
+        with self.assertNumQueries(0):
+            user, _ = self.auth.authenticate(request)
+            self.assertTrue(user.is_authenticated)
+            self.assertEqual(user.id, self.user.id)
+            self.assertFalse(user.is_admin)
+            self.assertFalse(user.is_staff)
+        self.assertIs(type(user), TokenClaimsUser)
+
+    def test_full_model_loaded_once_per_ttl(self):
+        token = UserRefreshToken.for_user(self.user).access_token
+
+        user, _ = self.auth.authenticate(self.make_request(token))
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, self.user.email)
+
+        # 다른 요청에서도 캐시 사용 (인스턴스는 새로 생성)
+        other, _ = self.auth.authenticate(self.make_request(token))
+        with self.assertNumQueries(0):
+            self.assertEqual(other.name, self.user.name)
+
+    def test_lazy_user_works_in_orm_filter(self):
+        user, _ = self.auth.authenticate(self.make_request(UserRefreshToken.for_user(self.user).access_token))
+        self.assertTrue(Cart.objects.filter(user=user).exists())
+
+    def test_user_save_invalidates_cache(self):
+        token = UserRefreshToken.for_user(self.user).access_token
+        user, _ = self.auth.authenticate(self.make_request(token))
+        self.assertEqual(user.name, "경량유저")
+
+        self.user.name = "변경된유저"
+        self.user.save()
+
+        user, _ = self.auth.authenticate(self.make_request(token))
+        self.assertEqual(user.name, "변경된유저")
+
+    def test_inactive_claim_rejected(self):
+        self.user.is_active = False
+        token = UserRefreshToken.for_user(self.user).access_token
+
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.authenticate(self.make_request(token))
+
+    def test_legacy_token_without_claims_falls_back_to_database(self):
+        request = self.make_request(RefreshToken.for_user(self.user).access_token)
+
+        with self.assertNumQueries(1):
+            user, _ = self.auth.authenticate(request)
+        self.assertIs(type(user), User)
+
+    @override_settings(JWT_LIGHTWEIGHT_USER=False)
+    def test_disabled_mode_fetches_user(self):
+        request = self.make_request(UserRefreshToken.for_user(self.user).access_token)
+
+        with self.assertNumQueries(1):
+            user, _ = self.auth.authenticate(request)
+        self.assertIs(type(user), User)
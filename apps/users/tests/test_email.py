@@ -1,14 +1,23 @@
+from io import StringIO
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
 from django.core import mail
-from django.test import TestCase
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
+
+from apps.users.mail import CLAIM_TIMEOUT, queue_mail, send_queued_emails
+from apps.users.models import OutboundEmail
 
 User = get_user_model()
 
 
 class UserEmailTests(TestCase):
     def test_register_sends_activation_email(self):
-        """회원가입 시 인증 메일이 발송되는지 테스트"""
+        """회원가입 시 인증 메일이 아웃박스에 쌓이고 워커가 발송하는지 테스트"""
         data = {
             "email": "test@example.com",
             "name": "테스트유저",
@@ -18,6 +27,11 @@ class UserEmailTests(TestCase):
         response = self.client.post(reverse("user_register"), data)
 
         self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(mail.outbox), 0)  # 요청 처리 중에는 발송하지 않음
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.Status.PENDING).count(), 1)
+
+        call_command("send_queued_emails", stdout=StringIO())
+
         self.assertEqual(len(mail.outbox), 1)  # 메일이 1개 발송됐는지 확인
         self.assertIn("회원가입 이메일 인증", mail.outbox[0].subject)
         self.assertIn("test@example.com", mail.outbox[0].to)
@@ -29,6 +43,7 @@ class UserEmailTests(TestCase):
         response = self.client.post(reverse("password_reset_request"), {"email": user.email})
 
         self.assertEqual(response.status_code, 200)
+        call_command("send_queued_emails", stdout=StringIO())
         self.assertEqual(len(mail.outbox), 1)
         self.assertIn("비밀번호 재설정", mail.outbox[0].subject)
 
@@ -42,4 +57,71 @@ class UserEmailTests(TestCase):
 
         self.assertEqual(response.status_code, 400)
         self.assertIn("소셜 로그인 사용자는 비밀번호 재설정을 할 수 없습니다.", response.data["error"])
-        self.assertEqual(len(mail.outbox), 0)
+        self.assertFalse(OutboundEmail.objects.exists())
+
+
+@override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=2, EMAIL_OUTBOX_RETRY_BACKOFF=60)
+class OutboundEmailWorkerTests(TestCase):
+    def test_batch_sent_over_single_connection(self):
+        for i in range(3):
+            queue_mail(f"제목{i}", "내용", None, [f"user{i}@example.com"])
+
+        with patch("apps.users.mail.get_connection", wraps=mail.get_connection) as get_connection:
+            sent, failed = send_queued_emails()
+
+        self.assertEqual((sent, failed), (3, 0))
+        get_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.Status.SENT).count(), 3)
+
+    def test_failed_email_retried_with_backoff(self):
+        email = queue_mail("제목", "내용", None, ["retry@example.com"])
+
+        with patch("django.core.mail.backends.locmem.EmailBackend.send_messages", side_effect=OSError("SMTP down")):
+            self.assertEqual(send_queued_emails(), (0, 1))
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.Status.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertGreater(email.next_attempt_at, timezone.now())
+        self.assertIn("SMTP down", email.last_error)
+
+        # 백오프 시간 전에는 다시 시도하지 않음
+        self.assertEqual(send_queued_emails(), (0, 0))
+
+        # 최대 시도 횟수 도달 시 failed 처리
+        OutboundEmail.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+        with patch("django.core.mail.backends.locmem.EmailBackend.send_messages", side_effect=OSError("SMTP down")):
+            send_queued_emails()
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.Status.FAILED)
+
+    def test_smtp_sent_outside_transaction(self):
+        """발송 중에는 트랜잭션/행 잠금 없이 sending 상태로 표시되어 있는지 테스트"""
+        email = queue_mail("제목", "내용", None, ["claim@example.com"])
+        seen = {}
+
+        def send_messages(messages):
+            seen["atomic_depth"] = len(connection.atomic_blocks)
+            seen["status"] = OutboundEmail.objects.get(pk=email.pk).status
+            return len(messages)
+
+        # TestCase 자체 트랜잭션 안이므로 워커가 연 atomic 블록이 더 쌓이지 않았는지로 확인
+        depth = len(connection.atomic_blocks)
+        with patch("django.core.mail.backends.locmem.EmailBackend.send_messages", side_effect=send_messages):
+            self.assertEqual(send_queued_emails(), (1, 0))
+
+        self.assertEqual(seen, {"atomic_depth": depth, "status": OutboundEmail.Status.SENDING})
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.Status.SENT)
+        self.assertIsNone(email.claimed_at)
+
+    def test_claimed_email_not_sent_twice(self):
+        """다른 워커가 sending으로 가져간 메일은 건너뛰고, CLAIM_TIMEOUT이 지나면 다시 발송"""
+        email = queue_mail("제목", "내용", None, ["claim@example.com"])
+        OutboundEmail.objects.filter(pk=email.pk).update(status=OutboundEmail.Status.SENDING, claimed_at=timezone.now())
+        self.assertEqual(send_queued_emails(), (0, 0))
+
+        OutboundEmail.objects.filter(pk=email.pk).update(claimed_at=timezone.now() - CLAIM_TIMEOUT)
+        self.assertEqual(send_queued_emails(), (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
@@ -0,0 +1,77 @@
+from io import StringIO
+
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, identify_hasher, make_password
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.users.hashers import TunableArgon2PasswordHasher
+from apps.users.models import User
+
+
+class PasswordHasherTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.login_url = reverse("user_login")
+
+    def create_user_with_hash(self, encoded):
+        user = User.objects.create_user(
+            email="hash@example.com", name="해시유저", password="placeholder", is_active=True
+        )
+        user.password = encoded
+        user.save(update_fields=["password"])
+        return user
+
+    def login(self):
+        return self.client.post(self.login_url, {"email": "hash@example.com", "password": "testpass123"}, format="json")
+
+    def test_new_password_uses_argon2id(self):
+        user = User.objects.create_user(email="new@example.com", name="신규", password="testpass123")
+        hasher = identify_hasher(user.password)
+
+        self.assertIsInstance(hasher, TunableArgon2PasswordHasher)
+        self.assertTrue(user.password.startswith("argon2$argon2id$"))
+
+    def test_legacy_pbkdf2_hash_upgraded_on_login(self):
+        user = self.create_user_with_hash(make_password("testpass123", hasher=PBKDF2PasswordHasher()))
+
+        response = self.login()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        user.refresh_from_db()
+        self.assertIsInstance(identify_hasher(user.password), TunableArgon2PasswordHasher)
+        self.assertTrue(user.check_password("testpass123"))
+
+    def test_failed_login_does_not_rehash(self):
+        encoded = make_password("testpass123", hasher=PBKDF2PasswordHasher())
+        user = self.create_user_with_hash(encoded)
+
+        response = self.client.post(self.login_url, {"email": "hash@example.com", "password": "wrong"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        user.refresh_from_db()
+        self.assertEqual(user.password, encoded)
+
+    def test_cost_change_triggers_rehash(self):
+        with override_settings(PASSWORD_ARGON2_TIME_COST=1, PASSWORD_ARGON2_MEMORY_COST=8192):
+            user = self.create_user_with_hash(make_password("testpass123"))
+        old_hash = user.password
+        self.assertIn("m=8192,t=1", old_hash)
+
+        with override_settings(PASSWORD_ARGON2_TIME_COST=2, PASSWORD_ARGON2_MEMORY_COST=19456):
+            self.assertTrue(identify_hasher(old_hash).must_update(old_hash))
+            self.assertEqual(self.login().status_code, status.HTTP_200_OK)
+
+        user.refresh_from_db()
+        self.assertNotEqual(user.password, old_hash)
+        self.assertIn("m=19456,t=2", user.password)
+
+    def test_benchmark_login_command(self):
+        out = StringIO()
+        call_command("benchmark_login", iterations=1, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("TunableArgon2PasswordHasher", output)
+        self.assertIn("PBKDF2PasswordHasher", output)
@@ -0,0 +1,152 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.users.social_utils import GoogleOAuth, NaverOAuth, build_oauth_session
+
+
+class StubOAuthHandler(BaseHTTPRequestHandler):
+    """네이버/구글 토큰·사용자 정보 엔드포인트를 흉내 내는 로컬 스텁"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def record(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.client_ports.add(self.client_address[1])
+
+    def do_POST(self):
+        self.record()
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode())
+        self.send_json(200, {"access_token": f"token-{form['code'][0]}", "token_type": "bearer"})
+
+    def do_GET(self):
+        self.record()
+        server = self.server
+        if server.delay:
+            time.sleep(server.delay)
+        if server.failures > 0:
+            server.failures -= 1
+            self.send_json(503, {"error": "unavailable"})
+            return
+
+        path = urlparse(self.path)
+        if path.path == "/naver/me":
+            token = self.headers["Authorization"].removeprefix("Bearer ")
+            self.send_json(200, {"resultcode": "00", "response": {"email": "naver@example.com", "token": token}})
+        else:
+            token = parse_qs(path.query)["access_token"][0]
+            self.send_json(200, {"email": "google@example.com", "token": token})
+
+
+class StubOAuthServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubOAuthHandler)
+        self.lock = threading.Lock()
+        self.requests = []
+        self.client_ports = set()
+        self.failures = 0
+        self.delay = 0
+
+    def handle_error(self, request, client_address):
+        # 타임아웃 테스트에서 클라이언트가 먼저 끊은 연결(BrokenPipe)은 무시
+        pass
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class OAuthHttpClientTest(SimpleTestCase):
+    """공유 세션(커넥션 풀) / 재시도 / 타임아웃을 실제 HTTP로 검증"""
+
+    def setUp(self):
+        self.server = StubOAuthServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        # 테스트마다 새 세션을 써서 커넥션 재사용 여부를 독립적으로 확인
+        session = build_oauth_session()
+        self.addCleanup(session.close)
+        patcher = patch("apps.users.social_utils.oauth_session", session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        base = self.server.base_url
+        settings_override = override_settings(
+            NAVER_TOKEN_URL=f"{base}/naver/token",
+            NAVER_USERINFO_URL=f"{base}/naver/me",
+            GOOGLE_TOKEN_URL=f"{base}/google/token",
+            GOOGLE_USERINFO_URL=f"{base}/google/userinfo",
+            SOCIAL_OAUTH_READ_TIMEOUT=0.5,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_naver_login_reuses_single_connection(self):
+        token = NaverOAuth.get_access_token("abc", "state")
+        info = NaverOAuth.get_user_info(token["access_token"])
+
+        self.assertEqual(info["response"]["token"], "token-abc")
+        self.assertEqual(self.server.requests, ["/naver/token", "/naver/me"])
+        self.assertEqual(len(self.server.client_ports), 1)
+
+    def test_google_login_reuses_single_connection(self):
+        for code in ("first", "second"):
+            token = GoogleOAuth.get_access_token(code)
+            info = GoogleOAuth.get_user_info(token["access_token"])
+            self.assertEqual(info["token"], f"token-{code}")
+
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(len(self.server.client_ports), 1)
+
+    async def test_async_naver_login_reuses_single_connection(self):
+        token = await NaverOAuth.aget_access_token("async", "state")
+        info = await NaverOAuth.aget_user_info(token["access_token"])
+
+        self.assertEqual(info["response"]["token"], "token-async")
+        self.assertEqual(len(self.server.client_ports), 1)
+
+    async def test_async_read_timeout_returns_network_error(self):
+        self.server.delay = 1
+
+        self.assertEqual(await GoogleOAuth.aget_user_info("tok"), {"error": "network_error"})
+
+    def test_user_info_retries_transient_5xx(self):
+        self.server.failures = 1
+
+        info = GoogleOAuth.get_user_info("tok")
+
+        self.assertEqual(info["email"], "google@example.com")
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_retries_exhausted_returns_network_error(self):
+        self.server.failures = 10
+
+        self.assertEqual(NaverOAuth.get_user_info("tok"), {"resultcode": "network_error"})
+
+    def test_read_timeout_returns_network_error(self):
+        self.server.delay = 1
+
+        self.assertEqual(GoogleOAuth.get_user_info("tok"), {"error": "network_error"})
@@ -0,0 +1,100 @@
+from importlib import import_module
+from unittest.mock import AsyncMock, patch
+
+from django.conf import settings
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from rest_framework import status
+
+from apps.carts.models import Cart
+from apps.users.models import User
+from apps.users.social_views import GoogleLoginCallbackAsyncView, NaverLoginCallbackAsyncView
+from apps.users.throttles import reset_buckets
+
+SessionStore = import_module(settings.SESSION_ENGINE).SessionStore
+
+
+class SocialLoginAsyncViewTest(TestCase):
+    def setUp(self):
+        self.factory = AsyncRequestFactory()
+
+    async def make_request(self, state_key, params, stored_state="test_state"):
+        request = self.factory.get("/", params)
+        request.session = SessionStore()
+        await request.session.aset(state_key, stored_state)
+        await request.session.asave()
+        return request
+
+    @patch("apps.users.social_views.NaverOAuth.aget_user_info", new_callable=AsyncMock)
+    @patch("apps.users.social_views.NaverOAuth.aget_access_token", new_callable=AsyncMock)
+    async def test_naver_callback_success(self, mock_get_token, mock_get_user_info):
+        mock_get_token.return_value = {"access_token": "test_access_token"}
+        mock_get_user_info.return_value = {
+            "resultcode": "00",
+            "response": {"email": "naver@example.com", "name": "네이버 사용자"},
+        }
+        request = await self.make_request("naver_oauth_state", {"code": "test_code", "state": "test_state"})
+
+        response = await NaverLoginCallbackAsyncView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertEqual(response.url, settings.FRONT_BASE_URL)
+        self.assertIn("access_token", response.cookies)
+        self.assertIn("refresh_token", response.cookies)
+        mock_get_token.assert_awaited_once_with("test_code", "test_state")
+        mock_get_user_info.assert_awaited_once_with("test_access_token")
+
+        user = await User.objects.aget(email="naver@example.com")
+        self.assertTrue(user.is_social)
+        self.assertTrue(await Cart.objects.filter(user=user).aexists())
+        self.assertIsNone(await request.session.aget("naver_oauth_state"))
+
+    async def test_naver_callback_state_mismatch(self):
+        request = await self.make_request("naver_oauth_state", {"code": "c", "state": "wrong"})
+
+        response = await NaverLoginCallbackAsyncView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch("apps.users.social_views.NaverOAuth.aget_access_token", new_callable=AsyncMock)
+    async def test_naver_callback_token_failure(self, mock_get_token):
+        mock_get_token.return_value = {"error": "network_error"}
+        request = await self.make_request("naver_oauth_state", {"code": "c", "state": "test_state"})
+
+        response = await NaverLoginCallbackAsyncView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNone(await request.session.aget("naver_oauth_state"))
+
+    @patch("apps.users.social_views.GoogleOAuth.aget_user_info", new_callable=AsyncMock)
+    @patch("apps.users.social_views.GoogleOAuth.aget_access_token", new_callable=AsyncMock)
+    async def test_google_callback_success(self, mock_get_token, mock_get_user_info):
+        mock_get_token.return_value = {"access_token": "test_access_token"}
+        mock_get_user_info.return_value = {"email": "google@example.com", "name": "구글 사용자"}
+        request = await self.make_request("google_oauth_state", {"code": "test_code", "state": "test_state"})
+
+        response = await GoogleLoginCallbackAsyncView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertTrue(await User.objects.filter(email="google@example.com").aexists())
+
+    @patch("apps.users.social_views.GoogleOAuth.aget_user_info", new_callable=AsyncMock)
+    @patch("apps.users.social_views.GoogleOAuth.aget_access_token", new_callable=AsyncMock)
+    async def test_google_callback_user_info_failure(self, mock_get_token, mock_get_user_info):
+        mock_get_token.return_value = {"access_token": "test_access_token"}
+        mock_get_user_info.return_value = {"error": "network_error"}
+        request = await self.make_request("google_oauth_state", {"code": "c", "state": "test_state"})
+
+        response = await GoogleLoginCallbackAsyncView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(AUTH_THROTTLE_ENABLED=True, AUTH_THROTTLE_RATES={"auth_ip": "1/min"})
+    async def test_callback_throttled(self):
+        reset_buckets()
+        view = GoogleLoginCallbackAsyncView.as_view()
+        await view(await self.make_request("google_oauth_state", {}))
+
+        response = await view(await self.make_request("google_oauth_state", {}))
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn("Retry-After", response)
@@ -1,10 +1,14 @@
+import threading
+from unittest import skipUnless
 from unittest.mock import Mock, patch
 
 import requests
 from django.contrib.auth import get_user_model
-from django.test import TestCase, override_settings
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase, override_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.carts.models import Cart
 from apps.users.social_utils import GoogleOAuth, NaverOAuth, SocialAuthService
 
 User = get_user_model()
@@ -19,7 +23,7 @@ User = get_user_model()
     GOOGLE_REDIRECT_URI="http://localhost:8000/auth/google/callback",
 )
 class NaverOAuthTest(TestCase):
-    @patch("apps.users.social_utils.requests.post")
+    @patch("apps.users.social_utils.oauth_session.post")
     def test_get_access_token_success(self, mock_post):
         # Mock 응답 설정
         mock_response = Mock()
@@ -42,10 +46,10 @@ class NaverOAuthTest(TestCase):
                 "code": "test_code",
                 "state": "test_state",
             },
-            timeout=10,
+            timeout=(3, 10),
         )
 
-    @patch("apps.users.social_utils.requests.post")
+    @patch("apps.users.social_utils.oauth_session.post")
     def test_get_access_token_network_error(self, mock_post):
         # Mock 네트워크 에러
         mock_post.side_effect = requests.RequestException("Network error")
@@ -56,7 +60,7 @@ class NaverOAuthTest(TestCase):
         # 검증
         self.assertEqual(result, {"error": "network_error"})
 
-    @patch("apps.users.social_utils.requests.get")
+    @patch("apps.users.social_utils.oauth_session.get")
     def test_get_user_info_success(self, mock_get):
         # Mock 응답 설정
         mock_response = Mock()
@@ -73,10 +77,12 @@ class NaverOAuthTest(TestCase):
         # 검증
         self.assertEqual(result["response"]["email"], "test@naver.com")
         mock_get.assert_called_once_with(
-            "https://openapi.naver.com/v1/nid/me", headers={"Authorization": "Bearer test_access_token"}, timeout=10
+            "https://openapi.naver.com/v1/nid/me",
+            headers={"Authorization": "Bearer test_access_token"},
+            timeout=(3, 10),
         )
 
-    @patch("apps.users.social_utils.requests.get")
+    @patch("apps.users.social_utils.oauth_session.get")
     def test_get_user_info_network_error(self, mock_get):
         # Mock 네트워크 에러
         mock_get.side_effect = requests.RequestException("Network error")
@@ -94,7 +100,7 @@ class NaverOAuthTest(TestCase):
     GOOGLE_REDIRECT_URI="http://localhost:8000/auth/google/callback",
 )
 class GoogleOAuthTest(TestCase):
-    @patch("apps.users.social_utils.requests.post")
+    @patch("apps.users.social_utils.oauth_session.post")
     def test_get_access_token_success(self, mock_post):
         # Mock 응답 설정
         mock_response = Mock()
@@ -116,10 +122,10 @@ class GoogleOAuthTest(TestCase):
                 "code": "test_code",
                 "redirect_uri": "http://localhost:8000/auth/google/callback",
             },
-            timeout=10,
+            timeout=(3, 10),
         )
 
-    @patch("apps.users.social_utils.requests.post")
+    @patch("apps.users.social_utils.oauth_session.post")
     def test_get_access_token_network_error(self, mock_post):
         # Mock 네트워크 에러
         mock_post.side_effect = requests.RequestException("Network error")
@@ -130,7 +136,7 @@ class GoogleOAuthTest(TestCase):
         # 검증
         self.assertEqual(result, {"error": "network_error"})
 
-    @patch("apps.users.social_utils.requests.get")
+    @patch("apps.users.social_utils.oauth_session.get")
     def test_get_user_info_success(self, mock_get):
         # Mock 응답 설정
         mock_response = Mock()
@@ -144,10 +150,10 @@ class GoogleOAuthTest(TestCase):
         # 검증
         self.assertEqual(result["email"], "test@gmail.com")
         mock_get.assert_called_once_with(
-            "https://www.googleapis.com/oauth2/v2/userinfo?access_token=test_access_token", timeout=10
+            "https://www.googleapis.com/oauth2/v2/userinfo?access_token=test_access_token", timeout=(3, 10)
         )
 
-    @patch("apps.users.social_utils.requests.get")
+    @patch("apps.users.social_utils.oauth_session.get")
     def test_get_user_info_network_error(self, mock_get):
         # Mock 네트워크 에러
         mock_get.side_effect = requests.RequestException("Network error")
@@ -183,6 +189,23 @@ class SocialAuthServiceTest(TestCase):
         self.assertTrue(user.is_social)
         self.assertEqual(User.objects.count(), 1)
 
+    def test_create_or_get_user_creates_cart_with_bounded_queries(self):
+        with self.assertNumQueries(5):  # SAVEPOINT/RELEASE + upsert + 장바구니 + 조회
+            user = SocialAuthService.create_or_get_user("new@example.com", "New User")
+
+        self.assertTrue(user.is_active)
+        self.assertIsNone(user.password)
+        self.assertEqual(Cart.objects.filter(user=user).count(), 1)
+
+    def test_create_or_get_user_existing_user_keeps_single_cart(self):
+        existing_user = User.objects.create(email="test@example.com", name="Existing User", is_social=True)
+
+        with self.assertNumQueries(5):
+            user = SocialAuthService.create_or_get_user("test@example.com", "New Name")
+
+        self.assertEqual(user.id, existing_user.id)
+        self.assertEqual(Cart.objects.filter(user=user).count(), 1)
+
     def test_generate_jwt_tokens(self):
         # 사용자 생성 (소셜 사용자)
         user = User.objects.create(email="test@example.com", name="Test User", is_social=True, is_active=True)
@@ -199,3 +222,30 @@ class SocialAuthServiceTest(TestCase):
         # JWT 토큰 검증
         refresh_token = RefreshToken(tokens["refresh"])
         self.assertEqual(refresh_token["user_id"], str(user.id))
+
+
+@skipUnless(connection.vendor == "postgresql", "동시 upsert 검증은 PostgreSQL 전용")
+class SocialAuthServiceConcurrencyTest(TransactionTestCase):
+    def test_concurrent_callbacks_create_single_user(self):
+        barrier = threading.Barrier(5)
+        results, errors = [], []
+
+        def sign_in():
+            try:
+                barrier.wait()
+                results.append(SocialAuthService.create_or_get_user("race@example.com", "Race").id)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=sign_in) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(User.objects.filter(email="race@example.com").count(), 1)
+        self.assertEqual(Cart.objects.filter(user_id=results[0]).count(), 1)
@@ -0,0 +1,115 @@
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from apps.users.throttles import consume_token, parse_rate, reset_buckets
+
+
+@override_settings(
+    AUTH_THROTTLE_ENABLED=True,
+    AUTH_THROTTLE_BACKEND="local",
+    AUTH_THROTTLE_RATES={"auth_ip": "5/min", "auth_email": "3/min"},
+)
+class AuthThrottleTest(TestCase):
+    def setUp(self):
+        reset_buckets()
+        cache.clear()
+        self.client = APIClient()
+        self.login_url = reverse("user_login")
+        User.objects.create_user(email="throttle@example.com", name="스로틀", password="testpass123", is_active=True)
+
+    def login(self, email="throttle@example.com", ip="10.0.0.1"):
+        return self.client.post(self.login_url, {"email": email, "password": "wrong"}, format="json", REMOTE_ADDR=ip)
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate("10/min"), (10, 10 / 60))
+        self.assertEqual(parse_rate("2/s"), (2, 2))
+
+    def test_email_bucket_blocks_after_capacity(self):
+        for _ in range(3):
+            self.assertEqual(self.login().status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.login(ip="10.0.0.2")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn("Retry-After", response)
+
+    def test_email_is_normalized(self):
+        for _ in range(3):
+            self.login()
+        response = self.login(email="  THROTTLE@example.com ", ip="10.0.0.2")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_ip_bucket_blocks_across_emails(self):
+        for i in range(5):
+            self.assertEqual(self.login(email=f"user{i}@example.com").status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertEqual(self.login(email="other@example.com").status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(self.login(email="other@example.com", ip="10.0.0.9").status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "NUM_PROXIES": 1})
+    def test_spoofed_forwarded_for_does_not_bypass_ip_bucket(self):
+        # nginx는 클라이언트가 보낸 X-Forwarded-For 뒤에 실제 접속 IP를 덧붙임
+        for i in range(5):
+            response = self.client.post(
+                self.login_url,
+                {"email": f"user{i}@example.com", "password": "wrong"},
+                format="json",
+                REMOTE_ADDR="172.18.0.2",
+                HTTP_X_FORWARDED_FOR=f"1.2.3.{i}, 10.0.0.1",
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(
+            self.login_url,
+            {"email": "other@example.com", "password": "wrong"},
+            format="json",
+            REMOTE_ADDR="172.18.0.2",
+            HTTP_X_FORWARDED_FOR="9.9.9.9, 10.0.0.1",
+        )
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_rejected_before_password_check(self):
+        for _ in range(3):
+            self.login()
+
+        with patch("apps.users.models.User.check_password") as check_password, self.assertNumQueries(0):
+            response = self.login()
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        check_password.assert_not_called()
+
+    def test_register_and_password_reset_share_email_bucket(self):
+        self.client.post(reverse("user_register"), {"email": "throttle@example.com"}, format="json")
+        self.client.post(reverse("password_reset_request"), {"email": "throttle@example.com"}, format="json")
+        self.login()
+
+        self.assertEqual(self.login(ip="10.0.0.2").status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_tokens_refill_over_time(self):
+        with patch("apps.users.throttles.time.monotonic", return_value=1000.0):
+            for _ in range(3):
+                self.assertTrue(consume_token("bucket", 3, 3 / 60)[0])
+            allowed, wait = consume_token("bucket", 3, 3 / 60)
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(wait, 20.0)
+
+        with patch("apps.users.throttles.time.monotonic", return_value=1020.0):
+            self.assertTrue(consume_token("bucket", 3, 3 / 60)[0])
+
+    @override_settings(AUTH_THROTTLE_BACKEND="cache")
+    def test_cache_backend_shares_buckets(self):
+        for _ in range(3):
+            self.login()
+        reset_buckets()  # 프로세스 로컬 상태와 무관하게 캐시 버킷으로 차단
+
+        self.assertEqual(self.login(ip="10.0.0.2").status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    @override_settings(AUTH_THROTTLE_ENABLED=False)
+    def test_disabled(self):
+        for _ in range(10):
+            self.assertEqual(self.login().status_code, status.HTTP_400_BAD_REQUEST)
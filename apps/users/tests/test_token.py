@@ -1,9 +1,17 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APIClient
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 
 from apps.users.models import User
+from apps.users.tokens import UserRefreshToken
 
 
 class TokenRefreshTestCase(TestCase):
@@ -36,3 +44,80 @@ class TokenRefreshTestCase(TestCase):
         response = self.client.post(self.url)
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.json()["error"], "Invalid refresh token")
+
+
+class CachedBlacklistTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="cache@example.com", name="캐시유저", password="testpass123", is_active=True
+        )
+        self.refresh_token = UserRefreshToken.for_user(self.user)
+        self.url = reverse("token_refresh")
+
+    def test_blacklist_lookup_is_cached(self):
+        """두 번째 갱신부터는 블랙리스트 테이블 조회 없음 (사용자 상태 조회 1회만)"""
+        self.client.cookies["refresh_token"] = str(self.refresh_token)
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.post(self.url).status_code, 200)
+        self.client.cookies.pop("access_token")  # 인증 조회 제외하고 블랙리스트 확인만 측정
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.post(self.url).status_code, 200)
+
+    def test_blacklisted_token_rejected_after_cached_lookup(self):
+        """캐시에 미등록으로 남아 있어도 블랙리스트 등록 시 즉시 거부"""
+        self.client.cookies["refresh_token"] = str(self.refresh_token)
+        self.client.post(self.url)
+
+        UserRefreshToken(str(self.refresh_token)).blacklist()
+
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], "Invalid refresh token")
+
+
+class RefreshUserClaimsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="admin@example.com", name="관리자", password="testpass123", is_active=True, is_admin=True
+        )
+        self.client.cookies["refresh_token"] = str(UserRefreshToken.for_user(self.user))
+        self.url = reverse("token_refresh")
+
+    def test_demoted_user_gets_current_claims(self):
+        """강등 후 갱신한 액세스 토큰에는 DB의 현재 권한이 담김"""
+        User.objects.filter(pk=self.user.pk).update(is_admin=False)
+
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        access = AccessToken(response.cookies["access_token"].value)
+        refresh = UserRefreshToken(response.cookies["refresh_token"].value)
+        self.assertFalse(access["is_admin"])
+        self.assertFalse(refresh["is_admin"])
+
+    def test_deactivated_user_cannot_refresh(self):
+        """비활성화된 사용자는 갱신 거부"""
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertNotIn("access_token", response.cookies)
+
+
+class PruneExpiredTokensTestCase(TestCase):
+    def test_prune_deletes_only_expired_tokens(self):
+        user = User.objects.create_user(email="prune@example.com", name="정리유저", password="testpass123")
+        expired = UserRefreshToken.for_user(user)
+        UserRefreshToken.for_user(user)
+        expired.blacklist()
+        OutstandingToken.objects.filter(jti=expired["jti"]).update(expires_at=timezone.now() - timedelta(days=1))
+
+        call_command("prune_expired_tokens", batch_size=1, stdout=StringIO())
+
+        self.assertEqual(OutstandingToken.objects.count(), 1)
+        self.assertFalse(BlacklistedToken.objects.exists())
@@ -0,0 +1,124 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+THROTTLE_CACHE_KEY = "throttle:{scope}:{ident}"
+
+# 프로세스 로컬 버킷 저장소: key -> (남은 토큰, 마지막 갱신 시각)
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def parse_rate(rate):
+    """'10/min' → (버킷 크기 10, 초당 충전량 10/60)"""
+    num, period = rate.split("/")
+    capacity = int(num)
+    duration = {"s": 1, "m": 60, "h": 3600, "d": 86400}[period[0]]
+    return capacity, capacity / duration
+
+
+def _refill(state, capacity, refill_rate, now):
+    if state is None:
+        return float(capacity)
+    tokens, updated_at = state
+    return min(capacity, tokens + (now - updated_at) * refill_rate)
+
+
+def _prune_local_buckets(now, max_idle):
+    """가득 찰 만큼 오래 쉰 버킷은 기본값과 같으므로 삭제 (IP가 계속 바뀌어도 메모리가 늘지 않도록)"""
+    for key in [key for key, (_, updated_at) in _buckets.items() if now - updated_at >= max_idle]:
+        del _buckets[key]
+
+
+def consume_token(key, capacity, refill_rate):
+    """
+    토큰 버킷에서 토큰 1개 소비
+    - 반환: (허용 여부, 다음 토큰까지 대기 초)
+    - AUTH_THROTTLE_BACKEND="cache"면 Django 캐시에 버킷을 저장해서 프로세스 간 공유
+      (get/set 사이 경합으로 몇 요청이 더 통과할 수 있지만 남용 차단 목적에는 충분)
+    """
+    now = time.monotonic() if settings.AUTH_THROTTLE_BACKEND == "local" else time.time()
+
+    if settings.AUTH_THROTTLE_BACKEND == "cache":
+        tokens = _refill(cache.get(key), capacity, refill_rate, now)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        cache.set(key, (tokens, now), timeout=int(capacity / refill_rate) + 1)
+    else:
+        with _buckets_lock:
+            if len(_buckets) >= settings.AUTH_THROTTLE_MAX_KEYS:
+                _prune_local_buckets(now, capacity / refill_rate)
+            tokens = _refill(_buckets.get(key), capacity, refill_rate, now)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            _buckets[key] = (tokens, now)
+
+    wait = 0 if allowed else (1 - tokens) / refill_rate
+    return allowed, wait
+
+
+def reset_buckets():
+    """프로세스 로컬 버킷 초기화 (테스트용)"""
+    with _buckets_lock:
+        _buckets.clear()
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    토큰 버킷 방식 스로틀
+    - 요청률은 AUTH_THROTTLE_RATES[scope] ("버킷 크기/기간")
+    - DRF가 뷰 본문 실행 전에 검사하므로 차단된 요청은 DB 조회나 비밀번호 해시 계산을 하지 않음
+    """
+
+    scope = None
+
+    def get_ident_value(self, request):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        self.wait_seconds = None
+        if not settings.AUTH_THROTTLE_ENABLED:
+            return True
+
+        rate = settings.AUTH_THROTTLE_RATES.get(self.scope)
+        ident = self.get_ident_value(request)
+        if not rate or not ident:
+            return True
+
+        capacity, refill_rate = parse_rate(rate)
+        allowed, self.wait_seconds = consume_token(
+            THROTTLE_CACHE_KEY.format(scope=self.scope, ident=ident), capacity, refill_rate
+        )
+        return allowed
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class AuthIPThrottle(TokenBucketThrottle):
+    """
+    클라이언트 IP 기준 (로그인/회원가입/비밀번호 재설정/소셜 콜백 공통)
+    - get_ident는 NUM_PROXIES 설정에 따라 X-Forwarded-For 중 신뢰 프록시가 붙인 값만 사용
+    """
+
+    scope = "auth_ip"
+
+    def get_ident_value(self, request):
+        return self.get_ident(request)
+
+
+class AuthEmailThrottle(TokenBucketThrottle):
+    """요청 본문의 이메일 기준 (여러 IP로 분산된 특정 계정 대입 공격 차단)"""
+
+    scope = "auth_email"
+
+    def get_ident_value(self, request):
+        email = request.data.get("email") if hasattr(request.data, "get") else None
+        if not isinstance(email, str):
+            return None
+        return email.strip().lower() or None
@@ -0,0 +1,61 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow, datetime_from_epoch
+
+BLACKLIST_CACHE_KEY = "jwt:blacklist:{jti}"
+
+
+class UserRefreshToken(RefreshToken):
+    """
+    권한 확인에 필요한 사용자 정보(is_admin, is_active)를 클레임으로 담는 리프레시 토큰
+    - access_token은 리프레시 토큰의 클레임을 그대로 복사하므로 함께 포함됨
+    - 토큰 갱신 시 DB의 현재 값으로 클레임을 다시 채움 (권한 변경은 액세스 토큰 만료 후 반영)
+    - 블랙리스트 확인 결과를 캐시해서 토큰 갱신마다 블랙리스트 테이블을 조회하지 않음
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token.set_user_claims(user)
+        return token
+
+    def set_user_claims(self, user):
+        self["is_admin"] = user.is_admin
+        self["is_active"] = user.is_active
+
+    def _blacklist_cache_key(self):
+        return BLACKLIST_CACHE_KEY.format(jti=self.payload[api_settings.JTI_CLAIM])
+
+    def _remaining_seconds(self):
+        remaining = datetime_from_epoch(self.payload["exp"]) - aware_utcnow()
+        return max(int(remaining.total_seconds()), 1)
+
+    def check_blacklist(self):
+        """
+        캐시 → DB 순서로 블랙리스트 확인
+        - 블랙리스트 등록: 토큰 만료 시각까지 캐시
+        - 미등록: JWT_BLACKLIST_CACHE_TTL 동안만 캐시 (다른 프로세스의 로그아웃 반영 지연 상한)
+        """
+        key = self._blacklist_cache_key()
+        blacklisted = cache.get(key)
+
+        if blacklisted is None:
+            jti = self.payload[api_settings.JTI_CLAIM]
+            blacklisted = BlacklistedToken.objects.filter(token__jti=jti).exists()
+            timeout = self._remaining_seconds()
+            if not blacklisted:
+                timeout = min(timeout, settings.JWT_BLACKLIST_CACHE_TTL)
+            cache.set(key, blacklisted, timeout=timeout)
+
+        if blacklisted:
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        result = super().blacklist()
+        cache.set(self._blacklist_cache_key(), True, timeout=self._remaining_seconds())
+        return result
@@ -1,7 +1,16 @@
+from django.conf import settings
 from django.urls import path
 
-from . import views
-from .social_views import GoogleLoginCallbackView, GoogleLoginStartView, NaverLoginCallbackView, NaverLoginStartView
+from . import social_views, views
+from .social_views import GoogleLoginStartView, NaverLoginStartView
+
+# ASYNC_VIEWS: 소셜 로그인 콜백(OAuth 제공자 호출)을 async 뷰로 처리 (ASGI 배포)
+if settings.ASYNC_VIEWS:
+    NaverLoginCallbackView = social_views.NaverLoginCallbackAsyncView
+    GoogleLoginCallbackView = social_views.GoogleLoginCallbackAsyncView
+else:
+    NaverLoginCallbackView = social_views.NaverLoginCallbackView
+    GoogleLoginCallbackView = social_views.GoogleLoginCallbackView
 
 urlpatterns = [
     path("register/", views.register, name="user_register"),
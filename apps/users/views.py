@@ -1,18 +1,18 @@
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
 from django.http import JsonResponse
 from django.utils.encoding import force_bytes, force_str
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.settings import api_settings
 
+from .mail import queue_mail
 from .serializers import (
     ChangePasswordSerializer,
     PasswordResetConfirmSerializer,
@@ -21,6 +21,8 @@ from .serializers import (
     UserProfileSerializer,
     UserSignUpSerializer,
 )
+from .throttles import AuthEmailThrottle, AuthIPThrottle
+from .tokens import UserRefreshToken
 
 User = get_user_model()
 
@@ -28,6 +30,7 @@ User = get_user_model()
 @swagger_auto_schema(methods=["post"], request_body=UserSignUpSerializer)
 @api_view(["POST", "OPTIONS"])
 @permission_classes([AllowAny])
+@throttle_classes([AuthIPThrottle, AuthEmailThrottle])
 def register(request):
     """일반 회원가입"""
     serializer = UserSignUpSerializer(data=request.data)
@@ -37,7 +40,7 @@ def register(request):
         token = default_token_generator.make_token(user)
         activation_link = f"{settings.FRONT_BASE_URL}/activate?uid={uid}&token={token}"
 
-        send_mail(
+        queue_mail(
             "회원가입 이메일 인증",
             f"다음 링크를 눌러 계정을 활성화하세요: {activation_link}",
             settings.DEFAULT_FROM_EMAIL,
@@ -70,6 +73,7 @@ def register(request):
 )
 @api_view(["POST", "OPTIONS"])
 @permission_classes([AllowAny])
+@throttle_classes([AuthIPThrottle, AuthEmailThrottle])
 def login(request):
     """일반 로그인"""
     email = request.data.get("email")
@@ -101,7 +105,7 @@ def login(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    refresh = RefreshToken.for_user(user)
+    refresh = UserRefreshToken.for_user(user)
     access_token = refresh.access_token
 
     # settings에서 설정된 시간 사용
@@ -136,7 +140,7 @@ def logout(request):
         # 쿠키에서 refresh_token 가져오기
         refresh_token = request.COOKIES.get("refresh_token")
         if refresh_token:
-            token = RefreshToken(refresh_token)
+            token = UserRefreshToken(refresh_token)
             token.blacklist()
 
         response = JsonResponse({"message": "로그아웃되었습니다."})
@@ -244,6 +248,7 @@ def change_password(request):
 )
 @api_view(["POST", "OPTIONS"])
 @permission_classes([AllowAny])
+@throttle_classes([AuthIPThrottle, AuthEmailThrottle])
 def password_reset_request(request):
     """비밀번호 재설정 메일 발송"""
     serializer = PasswordResetRequestSerializer(data=request.data)
@@ -264,7 +269,7 @@ def password_reset_request(request):
         token = default_token_generator.make_token(user)
         reset_link = f"{settings.FRONT_BASE_URL}/password-reset/confirm?uid={uid}&token={token}"
 
-        send_mail(
+        queue_mail(
             "비밀번호 재설정",
             f"다음 링크에서 비밀번호를 재설정하세요: {reset_link}",
             settings.DEFAULT_FROM_EMAIL,
@@ -371,7 +376,13 @@ def token_refresh(request):
         return Response({"error": "Refresh token not found"}, status=status.HTTP_400_BAD_REQUEST)
 
     try:
-        refresh = RefreshToken(refresh_token)
+        refresh = UserRefreshToken(refresh_token)
+
+        # 리프레시 토큰의 이전 클레임 대신 현재 사용자 상태로 액세스 토큰 발급 (강등/비활성화 반영)
+        user = User.objects.filter(pk=refresh[api_settings.USER_ID_CLAIM]).first()
+        if user is None or not user.is_active:
+            return Response({"error": "Inactive or deleted user"}, status=status.HTTP_401_UNAUTHORIZED)
+        refresh.set_user_claims(user)
         new_access_token = refresh.access_token
 
         # ROTATE_REFRESH_TOKENS=True라면 새 refresh token도 받음
@@ -1,6 +1,7 @@
 import mimetypes
 import os
 import sys
+import tempfile
 from datetime import timedelta
 from pathlib import Path
 
@@ -18,6 +19,13 @@ SIMPLE_JWT = {
 # .env 파일 로드
 load_dotenv()
 
+# 경량 사용자 모드 - 토큰 클레임(id, is_admin, is_active)으로 인증하고 users 조회는 필요할 때만
+JWT_LIGHTWEIGHT_USER = os.getenv("JWT_LIGHTWEIGHT_USER", "False").lower() in ("true", "1", "yes")
+# 경량 모드에서 전체 사용자 모델이 필요할 때 쓰는 프로세스 캐시 TTL(초)
+JWT_USER_CACHE_TTL = int(os.getenv("JWT_USER_CACHE_TTL", 60))
+# 블랙리스트 미등록 결과 캐시 TTL(초) - 블랙리스트 등록 결과는 토큰 만료까지 캐시
+JWT_BLACKLIST_CACHE_TTL = int(os.getenv("JWT_BLACKLIST_CACHE_TTL", 60))
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 # 보안 키
@@ -67,6 +75,9 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
+    # 앞단 신뢰 프록시(nginx) 수 - X-Forwarded-For의 뒤에서 N번째(프록시가 붙인 값)를 클라이언트 IP로 사용
+    # (앞부분은 클라이언트가 임의로 보낼 수 있으므로 IP별 스로틀 키로 쓰면 안 됨)
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", 1)),
     # 검색 기능 django-filter 사용
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
@@ -114,9 +125,83 @@ DATABASES = {
         "PASSWORD": os.getenv("POSTGRES_PASSWORD", "postgres"),
         "HOST": os.getenv("POSTGRES_HOST", "db"),
         "PORT": os.getenv("POSTGRES_PORT", "5432"),
+        # 요청 시작 시 재사용 커넥션 상태 확인 (끊긴 커넥션으로 인한 첫 쿼리 실패 방지)
+        # DB_POOL_ENABLED=False(영속 커넥션)일 때만 적용 - 풀 사용 시에는 아래 pool "check" 옵션이 대신 확인
+        "CONN_HEALTH_CHECKS": os.getenv("DB_CONN_HEALTH_CHECKS", "True") == "True",
     }
 }
 
+# 캐시 - 워커(프로세스) 간 공유되는 캐시 백엔드 선택
+# - CACHE_BACKEND: file(기본, 서버 로컬 디스크) | redis(Redis 호환 서버, 여러 서버 간 공유) | locmem(프로세스별)
+# - 테스트 실행 시에는 항상 locmem
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "file")
+CACHE_BACKENDS = {
+    # 소스 트리 밖(시스템 임시 디렉터리)에 저장 - 캐시 파일이 저장소/이미지 빌드에 섞이지 않도록
+    "file": (
+        "django.core.cache.backends.filebased.FileBasedCache",
+        os.path.join(tempfile.gettempdir(), "bookshop-cache"),
+    ),
+    "redis": ("django.core.cache.backends.redis.RedisCache", "redis://redis:6379/1"),
+    "locmem": ("django.core.cache.backends.locmem.LocMemCache", "bookshop"),
+}
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND][0],
+        "LOCATION": os.getenv("CACHE_LOCATION", CACHE_BACKENDS[CACHE_BACKEND][1]),
+        "TIMEOUT": int(os.getenv("CACHE_DEFAULT_TIMEOUT", 300)),
+        "KEY_PREFIX": os.getenv("CACHE_KEY_PREFIX", "bookshop"),
+    }
+}
+
+# 커넥션 재사용
+# - DB_POOL_ENABLED=True: psycopg 3 커넥션 풀 (프로세스당 MIN~MAX개 유지, 스레드에서도 공유)
+# - DB_POOL_ENABLED=False: CONN_MAX_AGE(초) 동안 스레드별 영속 커넥션 (0이면 요청마다 연결/해제)
+#   풀과 CONN_MAX_AGE는 함께 쓸 수 없음
+DB_POOL_ENABLED = os.getenv("DB_POOL_ENABLED", "True") == "True"
+if DB_POOL_ENABLED:
+    from psycopg_pool import ConnectionPool
+
+    # gunicorn 실행 시 미지정이면 gunicorn.conf.py가 DB_MAX_CONNECTIONS / 워커 수로 계산해서 전달
+    DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", 10))
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": min(int(os.getenv("DB_POOL_MIN_SIZE", 2)), DB_POOL_MAX_SIZE),
+            "max_size": DB_POOL_MAX_SIZE,
+            "timeout": float(os.getenv("DB_POOL_TIMEOUT", 10)),  # 풀이 가득 찼을 때 대기 시간(초)
+            "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", 600)),  # 유휴 커넥션 정리 기준(초)
+            # 풀에서 꺼낼 때마다 커넥션 상태 확인, 끊긴 커넥션은 버리고 새로 연결 (psycopg_pool 3.2+)
+            "check": ConnectionPool.check_connection,
+        }
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", 60))
+
+# 인증 엔드포인트 토큰 버킷 스로틀 (로그인/회원가입/비밀번호 재설정/소셜 콜백)
+# - 요청률 "버킷 크기/기간(s|min|h|d)", BACKEND: local(프로세스별) | cache(Django 캐시로 공유)
+AUTH_THROTTLE_ENABLED = os.getenv("AUTH_THROTTLE_ENABLED", "True") == "True"
+AUTH_THROTTLE_BACKEND = os.getenv("AUTH_THROTTLE_BACKEND", "local")
+AUTH_THROTTLE_RATES = {
+    "auth_ip": os.getenv("AUTH_THROTTLE_IP_RATE", "30/min"),
+    "auth_email": os.getenv("AUTH_THROTTLE_EMAIL_RATE", "5/min"),
+}
+AUTH_THROTTLE_MAX_KEYS = int(os.getenv("AUTH_THROTTLE_MAX_KEYS", 10000))  # local 백엔드 버킷 수 상한 (초과 시 정리)
+
+# I/O 대기 위주 엔드포인트(소셜 로그인 콜백, 문의 생성)를 async 뷰로 라우팅
+# - ASGI(uvicorn 워커)에서만 이점이 있으므로 기본값은 GUNICORN_WORKER_CLASS=asgi 여부를 따름
+ASYNC_VIEWS = os.getenv("ASYNC_VIEWS", str(os.getenv("GUNICORN_WORKER_CLASS") == "asgi")) == "True"
+
+# 비밀번호 해시 - Argon2id 기본, 기존 PBKDF2/scrypt 해시는 로그인 성공 시 Argon2로 재해시
+PASSWORD_HASHERS = [
+    "apps.users.hashers.TunableArgon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+# Argon2id 비용 (기본값: OWASP 권장 m=19MiB, t=2, p=1) - 변경 시 다음 로그인에서 재해시
+PASSWORD_ARGON2_TIME_COST = int(os.getenv("PASSWORD_ARGON2_TIME_COST", 2))
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", 19456))  # KiB
+PASSWORD_ARGON2_PARALLELISM = int(os.getenv("PASSWORD_ARGON2_PARALLELISM", 1))
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -129,6 +214,43 @@ TIME_ZONE = "UTC"
 USE_I18N = True
 USE_TZ = True
 
+# 상품 썸네일 (워커 generate_thumbnails가 업로드마다 한 번 생성)
+PRODUCT_THUMBNAIL_WIDTHS = [int(w) for w in os.getenv("PRODUCT_THUMBNAIL_WIDTHS", "200,400").split(",")]
+PRODUCT_THUMBNAIL_FORMATS = os.getenv("PRODUCT_THUMBNAIL_FORMATS", "webp,jpeg").split(",")
+PRODUCT_THUMBNAIL_QUALITY = int(os.getenv("PRODUCT_THUMBNAIL_QUALITY", 80))
+
+# 상품 이미지 직접 업로드 - 최대 크기(바이트), 업로드 URL 유효 시간(초)
+PRODUCT_IMAGE_MAX_UPLOAD_SIZE = int(os.getenv("PRODUCT_IMAGE_MAX_UPLOAD_SIZE", 10 * 1024 * 1024))
+PRODUCT_UPLOAD_URL_EXPIRES = int(os.getenv("PRODUCT_UPLOAD_URL_EXPIRES", 600))
+
+# 상품 목록 패싯 - 가격대 경계(원, 쉼표 구분), 필터별 캐시 유지 시간(초)
+PRODUCT_FACET_PRICE_BOUNDS = [
+    int(bound) for bound in os.getenv("PRODUCT_FACET_PRICE_BOUNDS", "10000,20000,30000,50000").split(",")
+]
+PRODUCT_FACET_CACHE_TTL = int(os.getenv("PRODUCT_FACET_CACHE_TTL", 300))
+
+# 상품 자동완성 - 기본/최대 후보 수, 결과 캐시 시간(초, 응답 Cache-Control max-age에도 사용)
+PRODUCT_SUGGEST_DEFAULT_LIMIT = int(os.getenv("PRODUCT_SUGGEST_DEFAULT_LIMIT", 10))
+PRODUCT_SUGGEST_MAX_LIMIT = int(os.getenv("PRODUCT_SUGGEST_MAX_LIMIT", 20))
+PRODUCT_SUGGEST_CACHE_TTL = int(os.getenv("PRODUCT_SUGGEST_CACHE_TTL", 60))
+
+# 함께 구매한 상품 - 상품별 저장 개수, 최소 동시 구매 주문 수, 조회 캐시 시간(초)
+PRODUCT_RELATED_TOP_K = int(os.getenv("PRODUCT_RELATED_TOP_K", 10))
+PRODUCT_RELATED_MIN_SCORE = int(os.getenv("PRODUCT_RELATED_MIN_SCORE", 2))
+PRODUCT_RELATED_CACHE_TTL = int(os.getenv("PRODUCT_RELATED_CACHE_TTL", 600))
+
+# 대량 재고 조정 요청 1건에 담을 수 있는 최대 상품 수
+PRODUCT_STOCK_ADJUST_MAX_ITEMS = int(os.getenv("PRODUCT_STOCK_ADJUST_MAX_ITEMS", 5000))
+
+# 통계 집계 기준 타임존 (영업일 경계 = 이 타임존의 00:00)
+STATS_TIME_ZONE = os.getenv("STATS_TIME_ZONE", "Asia/Seoul")
+
+# 대시보드 스냅샷 캐시 - TTL(초) 지나면 만료, REFRESH_INTERVAL(초) 지나면 백그라운드 갱신
+STATS_DASHBOARD_CACHE_TTL = int(os.getenv("STATS_DASHBOARD_CACHE_TTL", 300))
+STATS_DASHBOARD_REFRESH_INTERVAL = int(os.getenv("STATS_DASHBOARD_REFRESH_INTERVAL", 30))
+# 대시보드 병렬 집계 스레드 수 (스레드마다 DB 커넥션 1개 사용 → DB_POOL_MAX_SIZE 이하로)
+STATS_DASHBOARD_MAX_WORKERS = int(os.getenv("STATS_DASHBOARD_MAX_WORKERS", 4))
+
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -184,6 +306,18 @@ GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
 GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
 GOOGLE_REDIRECT_URI = os.getenv("GOOGLE_REDIRECT_URI")
 
+# OAuth 제공자 엔드포인트 (테스트/스테이징에서 스텁 서버로 교체 가능)
+NAVER_TOKEN_URL = os.getenv("NAVER_TOKEN_URL", "https://nid.naver.com/oauth2.0/token")
+NAVER_USERINFO_URL = os.getenv("NAVER_USERINFO_URL", "https://openapi.naver.com/v1/nid/me")
+GOOGLE_TOKEN_URL = os.getenv("GOOGLE_TOKEN_URL", "https://oauth2.googleapis.com/token")
+GOOGLE_USERINFO_URL = os.getenv("GOOGLE_USERINFO_URL", "https://www.googleapis.com/oauth2/v2/userinfo")
+
+# OAuth HTTP 클라이언트 - 타임아웃(초), 재시도 횟수, 호스트당 커넥션 풀 크기
+SOCIAL_OAUTH_CONNECT_TIMEOUT = float(os.getenv("SOCIAL_OAUTH_CONNECT_TIMEOUT", 3))
+SOCIAL_OAUTH_READ_TIMEOUT = float(os.getenv("SOCIAL_OAUTH_READ_TIMEOUT", 10))
+SOCIAL_OAUTH_MAX_RETRIES = int(os.getenv("SOCIAL_OAUTH_MAX_RETRIES", 2))
+SOCIAL_OAUTH_POOL_SIZE = int(os.getenv("SOCIAL_OAUTH_POOL_SIZE", 10))
+
 # email 인증을 위한 환경변수 세팅
 EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.smtp.EmailBackend")
 EMAIL_HOST = os.getenv("EMAIL_HOST", "smtp.gmail.com")
@@ -192,6 +326,12 @@ EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "True").lower() in ("true", "1", "yes")
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", EMAIL_HOST_USER)
+# 로컬 확인용 - EMAIL_BACKEND=django.core.mail.backends.filebased.EmailBackend 일 때 저장 경로
+EMAIL_FILE_PATH = os.getenv("EMAIL_FILE_PATH", BASE_DIR / "tmp" / "emails")
+
+# 메일 아웃박스 - 최대 발송 시도 횟수 / 재시도 백오프 기본값(초, 시도마다 2배)
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", 5))
+EMAIL_OUTBOX_RETRY_BACKOFF = int(os.getenv("EMAIL_OUTBOX_RETRY_BACKOFF", 60))
 
 # 제미나이 API
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -218,6 +358,9 @@ if DEBUG:
     MEDIA_URL = "/media/"
     MEDIA_ROOT = BASE_DIR / "media"
 
+    # 상품 이미지 직접 업로드: 로컬 업로드 엔드포인트로 presigned 흐름 재현
+    PRODUCT_UPLOAD_BACKEND = "local"
+
     STORAGES = {
         "default": {
             "BACKEND": "django.core.files.storage.FileSystemStorage",
@@ -231,6 +374,9 @@ else:
     AWS_STORAGE_BUCKET_NAME = "oz-main-be-12-team2"  # 버킷 이름
     AWS_S3_REGION_NAME = "ap-northeast-2"  # 서울 리전
 
+    # 상품 이미지 직접 업로드: S3 presigned POST (버킷 CORS에 프론트 도메인의 POST 허용 필요)
+    PRODUCT_UPLOAD_BACKEND = "s3"
+
     # 기본 파일 저장소를 S3로 지정
     STORAGES = {
         "default": {
@@ -245,5 +391,11 @@ else:
     AWS_S3_CUSTOM_DOMAIN = f"{AWS_STORAGE_BUCKET_NAME}.s3.{AWS_S3_REGION_NAME}.amazonaws.com"
     MEDIA_URL = f"https://{AWS_S3_CUSTOM_DOMAIN}/"
 
-# pytest나 manage.py test 실행 시 True
-TESTING = "test" in sys.argv
+# manage.py test 또는 pytest(pytest-django) 실행 시 True
+# - pytest는 sys.argv에 "test"가 없으므로 이미 import된 pytest 모듈로 판단
+TESTING = "test" in sys.argv or "pytest" in sys.modules
+if TESTING:
+    # 같은 클라이언트로 반복 로그인하는 테스트가 차단되지 않도록 (스로틀 테스트는 override_settings로 활성화)
+    AUTH_THROTTLE_ENABLED = False
+    # 테스트 간 캐시가 섞이지 않도록 프로세스 로컬 캐시 사용
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "bookshop-test"}}
@@ -0,0 +1,78 @@
+"""
+Gunicorn 설정 (환경 변수로 워커 모델/개수 조정)
+
+GUNICORN_WORKER_CLASS
+- sync    : 요청 1개 = 워커 1개 (기본값, CPU 코어 * 2 + 1 워커)
+- gthread : 워커당 GUNICORN_THREADS개 스레드 → 외부 API/SMTP 대기 중에도 다른 요청 처리
+- asgi    : uvicorn 워커로 config/asgi.py 실행 (async 뷰가 이벤트 루프에서 동시 처리)
+
+DB 커넥션 예산 (워커마다 커넥션 풀을 따로 가지므로 전체 연결 수 = 워커 수 * DB_POOL_MAX_SIZE)
+- DB_MAX_CONNECTIONS: 이 서버의 모든 워커가 여는 연결 합계 상한 (기본 80 = PostgreSQL 기본
+  max_connections 100에서 썸네일/메일 워커, 관리 명령 몫을 남긴 값)
+- 기본 워커 수는 워커당 최소 MIN_POOL_PER_WORKER개 연결을 쓸 수 있는 수까지로 제한
+- DB_POOL_MAX_SIZE를 지정하지 않으면 DB_MAX_CONNECTIONS / 워커 수로 계산 (최대 10)
+- 스레드/비동기 모드에서는 워커당 동시에 쓰는 연결이 늘어나므로 풀 크기 >= GUNICORN_THREADS가 되도록 조정
+"""
+
+import multiprocessing
+import os
+
+WORKER_MODE = os.getenv("GUNICORN_WORKER_CLASS", "sync")
+CPU_COUNT = multiprocessing.cpu_count()
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+if WORKER_MODE == "asgi":
+    wsgi_app = "config.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+    default_workers = CPU_COUNT
+elif WORKER_MODE == "gthread":
+    wsgi_app = "config.wsgi:application"
+    worker_class = "gthread"
+    threads = int(os.getenv("GUNICORN_THREADS", 4))
+    default_workers = CPU_COUNT
+else:
+    wsgi_app = "config.wsgi:application"
+    worker_class = "sync"
+    default_workers = CPU_COUNT * 2 + 1
+
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", 80))
+# 워커당 최소 연결 수 (gthread 요청 스레드 수, 대시보드 병렬 집계 스레드 수 중 큰 값)
+MIN_POOL_PER_WORKER = max(threads if WORKER_MODE == "gthread" else 1, int(os.getenv("STATS_DASHBOARD_MAX_WORKERS", 4)))
+DEFAULT_POOL_MAX_SIZE = 10
+
+default_workers = max(min(default_workers, DB_MAX_CONNECTIONS // MIN_POOL_PER_WORKER), 1)
+workers = int(os.getenv("GUNICORN_WORKERS", default_workers))
+
+# 워커가 Django 설정을 읽기 전에 풀 크기 결정 (preload 여부와 관계없이 환경 변수로 전달)
+os.environ.setdefault("DB_POOL_MAX_SIZE", str(max(min(DB_MAX_CONNECTIONS // workers, DEFAULT_POOL_MAX_SIZE), 1)))
+if workers * int(os.environ["DB_POOL_MAX_SIZE"]) > DB_MAX_CONNECTIONS:
+    print(
+        f"[WARN] 워커 {workers}개 * DB_POOL_MAX_SIZE {os.environ['DB_POOL_MAX_SIZE']} > "
+        f"DB_MAX_CONNECTIONS {DB_MAX_CONNECTIONS} - PostgreSQL max_connections를 확인하세요."
+    )
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+# 메모리 누수 대비 워커 주기적 재시작 (jitter로 워커들이 동시에 재시작되지 않도록 분산)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 100))
+
+# 마스터에서 앱을 미리 로드해서 워커 기동 시간/메모리 절약 (fork 후 공유)
+preload_app = os.getenv("GUNICORN_PRELOAD", "True") == "True"
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    """preload 시 마스터에서 열린 DB 커넥션/풀을 워커가 물려받지 않도록 정리"""
+    from django.db import connections
+
+    for conn in connections.all(initialized_only=True):
+        conn.close()
+        if hasattr(conn, "close_pool"):  # PostgreSQL 백엔드 (풀 미사용이면 아무것도 하지 않음)
+            conn.close_pool()
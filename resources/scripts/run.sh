@@ -23,4 +23,5 @@ python manage.py collectstatic --noinput
 #"
 
 echo "==> Gunicorn 서버 시작..."
-exec gunicorn --bind 0.0.0.0:8000 config.wsgi:application --workers 2
\ No newline at end of file
+# 워커 모델/개수는 resources/gunicorn.conf.py (GUNICORN_* 환경 변수) 참고
+exec gunicorn -c resources/gunicorn.conf.py
\ No newline at end of file